@@ -11,6 +11,7 @@ from .core.response import JudoResponse
 from .core.matcher import Matcher
 from .core.variables import VariableManager
 from .http.client import HttpClient
+from .http.async_client import AsyncHttpClient
 from .mock.server import MockServer
 from .reporting.reporter import JudoReporter
 from .reporting.html_reporter import HTMLReporter
@@ -31,6 +32,7 @@ __all__ = [
     "Matcher",
     "VariableManager",
     "HttpClient",
+    "AsyncHttpClient",
     "MockServer",
     "JudoReporter",
     "HTMLReporter",
@@ -48,6 +48,7 @@ _ensure_steps_loaded()
 __all__ = [
     'JudoContext',
     'before_all',
+    'before_feature',
     'before_scenario', 
     'after_scenario',
     'after_all',
@@ -58,6 +58,9 @@ def before_all_judo(context):
 
 def before_feature_judo(context, feature):
     """Hook automático: antes de cada feature"""
+    from .hooks import before_feature as judo_main_before_feature
+    judo_main_before_feature(context, feature)
+    
     reporter = _get_or_create_reporter(context)
     reporter.start_feature(
         name=feature.name,
@@ -172,10 +175,19 @@ def after_all_judo(context):
         reporter = _get_or_create_reporter(context)
         
         try:
-            # Generar reporte con nombre fijo
-            report_path = reporter.generate_html_report("test_execution_report.html")
             from ..utils.safe_print import safe_print, safe_emoji_print
-            safe_emoji_print("📊", f"Reporte HTML generado: {report_path}")
+            from ..reporting.report_merge import worker_mode
+            
+            # Artefacto para unir con los de otros workers/nodos (JUDO_REPORT_ARTIFACT_DIR)
+            artifact_path = reporter.export_artifact()
+            if artifact_path:
+                safe_emoji_print("🧩", f"Artefacto de reporte: {artifact_path}")
+            
+            # Los workers del runner no escriben HTML propio: el runner une los artefactos
+            if not worker_mode():
+                # Generar reporte con nombre fijo
+                report_path = reporter.generate_html_report("test_execution_report.html")
+                safe_emoji_print("📊", f"Reporte HTML generado: {report_path}")
             _report_generated = True
             
             summary = reporter.get_report_data().get_summary()
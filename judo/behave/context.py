@@ -3,9 +3,12 @@ Behave Context Integration
 Provides Judo Framework integration with Behave context
 """
 
+import json
 import os
 from pathlib import Path
 from judo import Judo
+from ..core.templates import MISSING, compile_json, render, render_data
+from ..core.variables import ScopedVariables, refresh_environment
 from typing import Any, Dict, Optional
 
 
@@ -37,10 +40,12 @@ def _load_env_file():
             env_path = project_root / '.env'
             if env_path.exists():
                 load_dotenv(dotenv_path=env_path)
+                refresh_environment()
                 return
         
         # Fallback: load from current directory
         load_dotenv()
+        refresh_environment()
         
     except ImportError:
         # python-dotenv not installed, just use os.getenv
@@ -58,7 +63,12 @@ class JudoContext:
         self.behave_context = behave_context
         self.judo = Judo()
         self.response = None
-        self.variables = {}
+        
+        # Reuse open connections across scenarios (JUDO_HTTP_SHARED_POOL=false disables)
+        if os.getenv('JUDO_HTTP_SHARED_POOL', 'true').lower() == 'true':
+            self.judo.http_client.use_shared_pool()
+        # Values set before the first scenario (before_all) stay visible to all
+        self.variables = ScopedVariables()
         self.test_data = {}
         
         # Request/Response logging configuration
@@ -84,6 +94,11 @@ class JudoContext:
         self.save_requests_responses = os.getenv('JUDO_SAVE_REQUESTS_RESPONSES', 'false').lower() == 'true'
         self.output_directory = os.getenv('JUDO_OUTPUT_DIRECTORY', 'judo_output')
     
+    def enter_feature(self):
+        """Start a feature scope for variables (values set here outlive its scenarios)"""
+        self.variables.enter("feature")
+        self.judo.variables.enter_scope("feature")
+    
     # URL Management
     def set_base_url(self, url: str):
         """Set base URL for API calls"""
@@ -104,13 +119,51 @@ class JudoContext:
         """Get a variable"""
         return self.variables.get(name, self.judo.get_var(name, default))
     
+    def get_mutable_variable(self, name: str) -> Any:
+        """
+        Get a variable to change in place
+        
+        get_variable() returns feature/before_all values shared by every
+        scenario; this one copies them into the scenario first.
+        """
+        value = self.variables.mutable(name)
+        self.judo.set(name, value)
+        return value
+    
+    def _resolve_variable(self, name: str) -> Any:
+        return self.variables.get(name, MISSING)
+    
     def interpolate_string(self, text: str) -> str:
-        """Interpolate variables in string"""
-        result = text
-        for key, value in self.variables.items():
-            result = result.replace(f"{{{key}}}", str(value))
-            result = result.replace(f"${{{key}}}", str(value))
-        return result
+        """
+        Interpolate {variable} markers in string
+        
+        The template is compiled once and cached; unknown names are kept.
+        """
+        if not self.variables:
+            return text
+        return render(text, self._resolve_variable)
+    
+    def interpolate_data(self, data: Any) -> Any:
+        """Interpolate {variable} markers in every string of a nested dict/list"""
+        if not self.variables:
+            return data
+        return render_data(data, self._resolve_variable)
+    
+    def interpolate_json(self, text: str) -> Any:
+        """
+        Parse a JSON docstring with {variable} markers in its strings
+        
+        The parsed body and its interpolation plan are cached per text, so
+        a step that sends the same body again neither re-parses nor re-walks
+        it. Text that is only JSON after interpolation ("id": {id}) is
+        interpolated first and then parsed.
+        """
+        template = compile_json(text)
+        if template is None:
+            return json.loads(self.interpolate_string(text))
+        if not self.variables:
+            return template.data
+        return template.render(self._resolve_variable)
     
     # Request/Response Logging Configuration
     def configure_request_response_logging(self, enabled: bool, output_directory: str = None):
@@ -150,6 +203,9 @@ class JudoContext:
         """
         Save request and response data to JSON files
         
+        Files are written by the background artifact writer (see
+        judo.reporting.artifact_writer); flush_artifacts() waits for them.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
@@ -159,16 +215,13 @@ class JudoContext:
         if not self.save_requests_responses or not self.current_scenario_name:
             return
         
-        import os
-        import json
-        from pathlib import Path
         from datetime import datetime
+        from ..reporting.artifact_writer import get_artifact_writer
         
         try:
-            # Create directory structure: output_dir/scenario_name/
+            # Directory structure: output_dir/scenario_name/
             scenario_dir_name = self._sanitize_filename(self.current_scenario_name)
             scenario_path = Path(self.output_directory) / scenario_dir_name
-            scenario_path.mkdir(parents=True, exist_ok=True)
             
             # Increment counter for this request
             self.request_counter += 1
@@ -177,29 +230,17 @@ class JudoContext:
             timestamp = datetime.now().strftime("%H%M%S")
             base_filename = f"{self.request_counter:02d}_{method}_{timestamp}"
             
-            request_filename = f"{base_filename}_request.json"
-            response_filename = f"{base_filename}_response.json"
-            
-            # Save request
-            request_path = scenario_path / request_filename
-            with open(request_path, 'w', encoding='utf-8') as f:
-                json.dump(request_data, f, indent=2, ensure_ascii=False, default=str)
-            
-            # Save response
-            response_path = scenario_path / response_filename
-            with open(response_path, 'w', encoding='utf-8') as f:
-                json.dump(response_data, f, indent=2, ensure_ascii=False, default=str)
-            
-            # Log the saved files (optional, can be enabled with environment variable)
-            if os.getenv('JUDO_LOG_SAVED_FILES', 'false').lower() == 'true':
-                print(f"💾 Saved request: {request_path}")
-                print(f"💾 Saved response: {response_path}")
-                print(f"📁 Files saved in: {scenario_path}")
+            get_artifact_writer().submit(scenario_path, base_filename, request_data, response_data)
                 
         except Exception as e:
             # Don't fail the test if logging fails, just log the error
             print(f"⚠️ Warning: Could not save request/response files: {e}")
     
+    def flush_artifacts(self, timeout: float = None) -> bool:
+        """Wait until saved requests/responses are on disk"""
+        from ..reporting.artifact_writer import flush_artifacts
+        return flush_artifacts(timeout)
+    
     # HTTP Methods
     def make_request(self, method: str, endpoint: str, **kwargs):
         """Make HTTP request and store response"""
@@ -378,14 +419,17 @@ class JudoContext:
             # Determine content type from response
             content_type = response_headers.get('content-type', response_headers.get('Content-Type', 'unknown'))
             
-            # Try to parse JSON body safely
+            # JSON is decoded once and shared with the assertions; text is only
+            # materialized for non-JSON bodies or when responses are saved to files
             json_body = None
             text_body = None
             
             try:
-                if hasattr(self.response, 'json') and self.response.json is not None:
+                # A JSON content-type with an empty or broken body keeps its raw text
+                is_json = self.response.has_json_body()
+                if is_json:
                     json_body = self.response.json
-                if hasattr(self.response, 'text') and self.response.text is not None:
+                if not is_json or self.save_requests_responses:
                     text_body = self.response.text
             except Exception:
                 # If JSON parsing fails, just capture as text
@@ -399,11 +443,14 @@ class JudoContext:
                 "content_type": content_type,
                 "body": json_body,
                 "text": text_body,
-                "size_bytes": len(text_body.encode('utf-8')) if text_body else 0,
+                "size_bytes": getattr(self.response, 'size', 0),
                 "elapsed_ms": getattr(self.response, 'elapsed', 0) * 1000 if hasattr(self.response, 'elapsed') else 0,
                 "timestamp": self._get_timestamp(),
                 "scenario": self.current_scenario_name
             }
+            transport = getattr(self.response, 'transport', None) or {}
+            if transport:
+                html_response_data["transport"] = transport
             
             # Send data to HTML reporter system
             try:
@@ -437,9 +484,12 @@ class JudoContext:
                     response_obj = ResponseData(
                         status_code=self.response.status,
                         headers=response_headers,
-                        body=json_body,
+                        body=json_body if json_body is not None else text_body,
                         body_type=content_type,
-                        elapsed_time=getattr(self.response, 'elapsed', 0)
+                        elapsed_time=getattr(self.response, 'elapsed', 0),
+                        http_version=transport.get('http_version'),
+                        connection_reused=transport.get('connection_reused'),
+                        stream_id=transport.get('stream_id')
                     )
                     
                     # Add to current step
@@ -629,13 +679,16 @@ class JudoContext:
         save_output_dir = self.output_directory
         
         self.response = None
-        self.variables.clear()
+        # New scenario scope: O(1), drops only what the previous scenario set
+        self.variables.enter("scenario")
+        self.judo.variables.enter_scope("scenario")
         self.test_data.clear()
         
         # Reset HTTP client state
         self.judo.http_client.default_headers.clear()
         self.judo.http_client.default_params.clear()
         self.judo.http_client.default_cookies.clear()
+        self.judo.http_client.reset_session_state()
         
         # Re-setup defaults
         self._setup_defaults()
@@ -52,6 +52,18 @@ def before_all(context):
     safe_emoji_print("🥋", "Judo Framework initialized for Behave tests")
 
 
+def before_feature(context, feature):
+    """
+    Hook that runs before each feature
+    Start a feature scope for variables
+    """
+    if not hasattr(context, 'judo_context'):
+        context.judo_context = JudoContext(context)
+    
+    # Variables set here (e.g. shared fixtures) are visible to every scenario of the feature
+    context.judo_context.enter_feature()
+
+
 def before_scenario(context, scenario):
     """
     Hook that runs before each scenario
@@ -81,6 +93,9 @@ def after_scenario(context, scenario):
     Cleanup and logging
     """
     if hasattr(context, 'judo_context'):
+        # Saved requests/responses of this scenario are complete on disk
+        context.judo_context.flush_artifacts()
+        
         # Log scenario completion
         status = "PASSED" if scenario.status == "passed" else "FAILED"
         context.judo_context.log(f"Scenario {scenario.name}: {status}")
@@ -104,6 +119,14 @@ def after_all(context):
         except:
             pass
         
+        # Write any request/response artifacts still queued
+        from ..reporting.artifact_writer import close_artifact_writer
+        close_artifact_writer()
+        
+        # Close the connection pool shared by all scenarios
+        from ..http.pool import close_shared_adapters
+        close_shared_adapters()
+        
         print("🏁 Judo Framework tests completed")
 
 
@@ -126,11 +126,7 @@ def step_send_post_request_with_json(context, endpoint):
     endpoint = context.judo_context.interpolate_string(endpoint)
     
     # Replace variables in JSON text
-    json_text = context.text
-    for var_name, var_value in context.judo_context.variables.items():
-        json_text = json_text.replace(f"{{{var_name}}}", str(var_value))
-    
-    json_data = json.loads(json_text)
+    json_data = context.judo_context.interpolate_json(context.text)
     context.judo_context.make_request('POST', endpoint, json=json_data)
 
 
@@ -140,11 +136,7 @@ def step_send_put_request_with_json(context, endpoint):
     endpoint = context.judo_context.interpolate_string(endpoint)
     
     # Replace variables in JSON text
-    json_text = context.text
-    for var_name, var_value in context.judo_context.variables.items():
-        json_text = json_text.replace(f"{{{var_name}}}", str(var_value))
-    
-    json_data = json.loads(json_text)
+    json_data = context.judo_context.interpolate_json(context.text)
     context.judo_context.make_request('PUT', endpoint, json=json_data)
 
 
@@ -154,11 +146,7 @@ def step_send_patch_request_with_json(context, endpoint):
     endpoint = context.judo_context.interpolate_string(endpoint)
     
     # Replace variables in JSON text
-    json_text = context.text
-    for var_name, var_value in context.judo_context.variables.items():
-        json_text = json_text.replace(f"{{{var_name}}}", str(var_value))
-    
-    json_data = json.loads(json_text)
+    json_data = context.judo_context.interpolate_json(context.text)
     context.judo_context.make_request('PATCH', endpoint, json=json_data)
 
 
@@ -860,7 +848,9 @@ def step_enable_performance_monitoring(context):
     if not hasattr(context, 'judo_context'):
         context.judo_context = JudoContext(context)
     
-    context.judo_context.performance_monitor = PerformanceMonitor()
+    context.judo_context.performance_monitor = PerformanceMonitor(
+        pool_stats=context.judo_context.judo.http_client.pool_stats
+    )
 
 
 @step('I set performance alert for "{metric}" with threshold {threshold:f}')
@@ -870,7 +860,9 @@ def step_set_performance_alert(context, metric, threshold):
     
     if not hasattr(context.judo_context, 'performance_monitor'):
         from judo.features.performance import PerformanceMonitor
-        context.judo_context.performance_monitor = PerformanceMonitor()
+        context.judo_context.performance_monitor = PerformanceMonitor(
+            pool_stats=context.judo_context.judo.http_client.pool_stats
+        )
     
     alert = PerformanceAlert(metric=metric, threshold=threshold)
     context.judo_context.performance_monitor.add_alert(alert)
@@ -1218,7 +1210,8 @@ def step_validate_response_schema_by_name(context, schema_name):
     
     try:
         import jsonschema
-        jsonschema.validate(response_data, schema)
+        from judo.core.schema_cache import validate
+        validate(response_data, schema)
     except ImportError:
         raise ImportError("jsonschema required: pip install jsonschema")
     except jsonschema.ValidationError as e:
@@ -1362,7 +1355,8 @@ def step_validate_json_schema_inline(context):
     
     try:
         import jsonschema
-        jsonschema.validate(response_data, schema)
+        from judo.core.schema_cache import validate
+        validate(response_data, schema)
     except ImportError:
         raise ImportError("jsonschema required: pip install jsonschema")
     except jsonschema.ValidationError as e:
@@ -1377,18 +1371,21 @@ def step_validate_json_schema_file(context, schema_file):
     response_data = context.judo.get_response_json()
     
     try:
-        with open(schema_file, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        import jsonschema
+        from judo.core.schema_cache import load_schema_file
+    except ImportError:
+        raise ImportError("jsonschema required: pip install jsonschema")
+    
+    # Validator cached by path + mtime: the file is read and checked once
+    try:
+        validator = load_schema_file(schema_file)
     except FileNotFoundError:
         raise FileNotFoundError(f"Schema file not found: {schema_file}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON Schema in file: {e}")
     
     try:
-        import jsonschema
-        jsonschema.validate(response_data, schema)
-    except ImportError:
-        raise ImportError("jsonschema required: pip install jsonschema")
+        validator.validate(response_data)
     except jsonschema.ValidationError as e:
         raise AssertionError(f"JSON Schema validation failed: {e.message}")
 
@@ -123,12 +123,8 @@ def step_post_request_with_body_es(context, endpoint):
     """Hacer petición POST con cuerpo JSON"""
     endpoint = context.judo_context.interpolate_string(endpoint)
     
-    # Interpolar variables en el texto JSON antes de parsear
-    json_text = context.text
-    for key, value in context.judo_context.variables.items():
-        json_text = json_text.replace(f"{{{key}}}", str(value))
-    
-    body = json.loads(json_text)
+    # Interpolar variables en el cuerpo JSON
+    body = context.judo_context.interpolate_json(context.text)
     context.judo_context.make_request('POST', endpoint, json=body)
 
 
@@ -138,12 +134,8 @@ def step_put_request_with_body_es(context, endpoint):
     """Hacer petición PUT con cuerpo JSON"""
     endpoint = context.judo_context.interpolate_string(endpoint)
     
-    # Interpolar variables en el texto JSON antes de parsear
-    json_text = context.text
-    for key, value in context.judo_context.variables.items():
-        json_text = json_text.replace(f"{{{key}}}", str(value))
-    
-    body = json.loads(json_text)
+    # Interpolar variables en el cuerpo JSON
+    body = context.judo_context.interpolate_json(context.text)
     context.judo_context.make_request('PUT', endpoint, json=body)
 
 
@@ -153,12 +145,8 @@ def step_patch_request_with_body_es(context, endpoint):
     """Hacer petición PATCH con cuerpo JSON"""
     endpoint = context.judo_context.interpolate_string(endpoint)
     
-    # Interpolar variables en el texto JSON antes de parsear
-    json_text = context.text
-    for key, value in context.judo_context.variables.items():
-        json_text = json_text.replace(f"{{{key}}}", str(value))
-    
-    body = json.loads(json_text)
+    # Interpolar variables en el cuerpo JSON
+    body = context.judo_context.interpolate_json(context.text)
     context.judo_context.make_request('PATCH', endpoint, json=body)
 
 
@@ -786,7 +774,9 @@ def step_enable_performance_monitoring_es(context):
         from judo.behave import setup_judo_context
         setup_judo_context(context)
     
-    context.judo_context.performance_monitor = PerformanceMonitor()
+    context.judo_context.performance_monitor = PerformanceMonitor(
+        pool_stats=context.judo_context.judo.http_client.pool_stats
+    )
 
 
 @step('establezco alerta de rendimiento para "{metric}" con umbral {threshold:f}')
@@ -796,7 +786,9 @@ def step_set_performance_alert_es(context, metric, threshold):
     
     if not hasattr(context.judo_context, 'performance_monitor'):
         from judo.features.performance import PerformanceMonitor
-        context.judo_context.performance_monitor = PerformanceMonitor()
+        context.judo_context.performance_monitor = PerformanceMonitor(
+            pool_stats=context.judo_context.judo.http_client.pool_stats
+        )
     
     alert = PerformanceAlert(metric=metric, threshold=threshold)
     context.judo_context.performance_monitor.add_alert(alert)
@@ -1097,7 +1089,8 @@ def step_validate_response_schema_by_name_es(context, schema_name):
     
     try:
         import jsonschema
-        jsonschema.validate(response_data, schema)
+        from judo.core.schema_cache import validate
+        validate(response_data, schema)
     except ImportError:
         raise ImportError("jsonschema requerido: pip install jsonschema")
     except jsonschema.ValidationError as e:
@@ -1262,7 +1255,8 @@ def step_validate_json_schema_inline_es(context):
     
     try:
         import jsonschema
-        jsonschema.validate(response_data, schema)
+        from judo.core.schema_cache import validate
+        validate(response_data, schema)
     except ImportError:
         raise ImportError("jsonschema requerido: pip install jsonschema")
     except jsonschema.ValidationError as e:
@@ -1277,18 +1271,21 @@ def step_validate_json_schema_file_es(context, schema_file):
     response_data = context.judo.get_response_json()
     
     try:
-        with open(schema_file, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        import jsonschema
+        from judo.core.schema_cache import load_schema_file
+    except ImportError:
+        raise ImportError("jsonschema requerido: pip install jsonschema")
+    
+    # Validator cached by path + mtime: the file is read and checked once
+    try:
+        validator = load_schema_file(schema_file)
     except FileNotFoundError:
         raise FileNotFoundError(f"Archivo de esquema no encontrado: {schema_file}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Esquema JSON inválido en archivo: {e}")
     
     try:
-        import jsonschema
-        jsonschema.validate(response_data, schema)
-    except ImportError:
-        raise ImportError("jsonschema requerido: pip install jsonschema")
+        validator.validate(response_data)
     except jsonschema.ValidationError as e:
         raise AssertionError(f"Validación de esquema JSON falló: {e.message}")
 
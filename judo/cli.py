@@ -33,6 +33,25 @@ def main():
     mock_parser.add_argument('--port', '-p', type=int, default=8080, help='Port to run on')
     mock_parser.add_argument('--config', '-c', help='Mock configuration file')
     
+    # Shard command
+    shard_parser = subparsers.add_parser('shard', help='List the feature files of a balanced static shard')
+    shard_parser.add_argument('--shard', '-s', required=True, help='Shard to emit, as i/n (e.g. 2/4)')
+    shard_parser.add_argument('--features-dir', '-f', default='features', help='Directory with .feature files')
+    shard_parser.add_argument('--timings', '-t', default=os.getenv('JUDO_TIMINGS_FILE'),
+                              help='Timing database to balance by duration; every node must read the same file '
+                                   '(checked in or restored from the CI cache). Without it shards are split by path')
+    
+    # Merge reports command
+    merge_parser = subparsers.add_parser('merge-reports',
+                                         help='Merge report artifacts of several workers or CI nodes into one report')
+    merge_parser.add_argument('inputs', nargs='+',
+                              help='Artifact directories (searched for *.ndjson), artifact files or Cucumber JSON files')
+    merge_parser.add_argument('--output-dir', '-o', default='judo_reports', help='Directory for the merged reports')
+    merge_parser.add_argument('--html', default='test_execution_report.html', help='HTML report file name')
+    merge_parser.add_argument('--junit', default='junit.xml', help='JUnit XML file name')
+    merge_parser.add_argument('--cucumber', default='cucumber-consolidated.json', help='Cucumber JSON file name')
+    merge_parser.add_argument('--title', help='Report title (default: title of the first artifact)')
+    
     # Version command
     version_parser = subparsers.add_parser('version', help='Show version')
     
@@ -44,6 +63,10 @@ def main():
         init_project(args.name)
     elif args.command == 'mock':
         start_mock_server(args.port, args.config)
+    elif args.command == 'shard':
+        emit_shard(args.shard, args.features_dir, args.timings)
+    elif args.command == 'merge-reports':
+        merge_reports_command(args.inputs, args.output_dir, args.html, args.junit, args.cucumber, args.title)
     elif args.command == 'version':
         show_version()
     else:
@@ -166,6 +189,41 @@ def start_mock_server(port: int, config_file: str):
         print("\nMock server stopped.")
 
 
+def emit_shard(shard: str, features_dir: str, timings_file: str):
+    """Print the feature files assigned to shard i/n (balanced by durations when a timings file is given)"""
+    from pathlib import Path
+    from judo.runner.scheduler import parse_shard, partition_shards
+    from judo.runner.timing_db import TimingDatabase
+    
+    try:
+        index, count = parse_shard(shard)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(2)
+    
+    feature_files = sorted(Path(features_dir).rglob("*.feature"))
+    estimate = TimingDatabase(timings_file).estimate_feature if timings_file else None
+    shards = partition_shards(feature_files, estimate, count)
+    
+    for feature_file in shards[index - 1]:
+        print(feature_file.as_posix())
+
+
+def merge_reports_command(inputs: List[str], output_dir: str, html: str, junit: str, cucumber: str,
+                          title: str = None):
+    """Merge report artifacts into one HTML report, one JUnit XML and one Cucumber JSON"""
+    from judo.reporting.report_merge import merge_reports
+    
+    try:
+        outputs = merge_reports(inputs, output_dir, html=html, junit=junit, cucumber=cucumber, title=title)
+    except (OSError, ValueError) as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(2)
+    
+    for kind, path in outputs.items():
+        print(f"{kind}: {path}")
+
+
 def show_version():
     """Show version information"""
     from judo import __version__
@@ -4,7 +4,8 @@ Core module - Main framework components
 
 from .judo import Judo
 from .response import JudoResponse
+from .streaming import StreamingJudoResponse
 from .matcher import Matcher
 from .variables import VariableManager
 
-__all__ = ['Judo', 'JudoResponse', 'Matcher', 'VariableManager']
\ No newline at end of file
+__all__ = ['Judo', 'JudoResponse', 'StreamingJudoResponse', 'Matcher', 'VariableManager']
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+JSONPath - Cached, compiled JSONPath expressions shared by the core modules
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+# Plain paths like $.a.b[0] or a.b: dotted names and non-negative indices only
+_SIMPLE_PATH = re.compile(r'^(?:\$|[A-Za-z_]\w*)(?:\.[A-Za-z_]\w*|\[\d+\])*$')
+_SIMPLE_TOKEN = re.compile(r'\.?([A-Za-z_]\w*)|\[(\d+)\]')
+# Names with a special meaning in jsonpath_ng, never take the fast path
+_RESERVED_NAMES = {'where', 'wherenot', 'auto_id'}
+
+
+class SimpleJsonPath:
+    """
+    Direct dict/list lookup for dotted and indexed paths
+
+    Gives the same results as jsonpath_ng for these paths (a missing key or
+    index yields no match) without going through the PLY parser. An index
+    on anything but a list (e.g. a string) is left to jsonpath_ng.
+    """
+
+    def __init__(self, path: str, steps: Tuple[Union[str, int], ...]):
+        self.path = path
+        self.steps = steps
+        self._compiled: Optional["CompiledJsonPath"] = None
+
+    def find_values(self, data: Any) -> List[Any]:
+        value = data
+        for step in self.steps:
+            if isinstance(step, int):
+                if not isinstance(value, list):
+                    return self._full_path().find_values(data)
+                if step >= len(value):
+                    return []
+            elif not isinstance(value, dict) or step not in value:
+                return []
+            value = value[step]
+        return [value]
+
+    def _full_path(self) -> "CompiledJsonPath":
+        if self._compiled is None:
+            self._compiled = CompiledJsonPath(self.path)
+        return self._compiled
+
+
+class CompiledJsonPath:
+    """jsonpath_ng expression parsed once"""
+
+    def __init__(self, path: str):
+        from jsonpath_ng import parse
+        self.path = path
+        self.expression = parse(path)
+
+    def find_values(self, data: Any) -> List[Any]:
+        return [match.value for match in self.expression.find(data)]
+
+
+def _parse_simple(path: str) -> Optional[SimpleJsonPath]:
+    if not _SIMPLE_PATH.match(path):
+        return None
+    steps = []
+    body = path[1:] if path.startswith('$') else path
+    for name, index in _SIMPLE_TOKEN.findall(body):
+        if index:
+            steps.append(int(index))
+        elif name in _RESERVED_NAMES:
+            return None
+        else:
+            steps.append(name)
+    return SimpleJsonPath(path, tuple(steps))
+
+
+class JsonPathCache:
+    """
+    Thread-safe bounded LRU of compiled JSONPath expressions
+
+    Size comes from JUDO_JSONPATH_CACHE_SIZE (default: 512, 0 disables caching).
+    """
+
+    def __init__(self, maxsize: int = None):
+        if maxsize is None:
+            maxsize = int(os.getenv('JUDO_JSONPATH_CACHE_SIZE', '512'))
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fast_paths = 0
+
+    def compile(self, path: str):
+        """Get the compiled expression for a path (parsing it on a miss)"""
+        with self._lock:
+            compiled = self._entries.get(path)
+            if compiled is not None:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = _parse_simple(path)
+        if compiled is not None:
+            with self._lock:
+                self.fast_paths += 1
+        else:
+            compiled = CompiledJsonPath(path)
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[path] = compiled
+                self._entries.move_to_end(path)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return compiled
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and hit rate (percent)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "fast_paths": self.fast_paths,
+                "hit_rate_percent": round(self.hits / lookups * 100, 2) if lookups else 0
+            }
+
+    def clear(self) -> None:
+        """Drop all compiled expressions and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.fast_paths = 0
+
+
+_cache = JsonPathCache()
+
+
+def compile_jsonpath(path: str):
+    """Compiled expression for a path, from the shared cache"""
+    return _cache.compile(path)
+
+
+def find_values(data: Any, path: str) -> List[Any]:
+    """All values matched by a JSONPath expression"""
+    return _cache.compile(path).find_values(data)
+
+
+def jsonpath_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the shared JSONPath cache"""
+    return _cache.stats()
+
+
+def clear_jsonpath_cache() -> None:
+    """Empty the shared JSONPath cache"""
+    _cache.clear()
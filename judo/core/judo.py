@@ -12,6 +12,7 @@ from urllib.parse import urljoin, urlparse
 from ..http.client import HttpClient
 from ..core.response import JudoResponse
 from ..core.matcher import Matcher
+from ..core.jsonpath import find_values, jsonpath_cache_stats
 from ..core.variables import VariableManager
 from ..utils.helpers import *
 from ..mock.server import MockServer
@@ -118,6 +119,44 @@ class Judo:
         """HTTP OPTIONS request"""
         return self.http_client.options(url, **kwargs)
     
+    def stream(self, method: str, url: str, spool: bool = False, **kwargs):
+        """
+        Request a large body as a stream (size, hashes and JSON/NDJSON items
+        are read incrementally)
+        
+        Example:
+            with judo.stream("GET", "/export", spool=True) as resp:
+                total = sum(1 for _ in resp.iter_ndjson())
+                resp.assert_content_type("application/x-ndjson")
+        """
+        return self.http_client.stream(method, url, spool=spool, **kwargs)
+    
+    def async_http(self, max_concurrency: int = 100, engine: str = None):
+        """
+        Get an asyncio HTTP client sharing this instance's headers, auth and base URL
+        
+        Example:
+            async with judo.async_http(max_concurrency=50) as client:
+                response = await client.get("/users/1")
+        """
+        from ..http.async_client import AsyncHttpClient
+        return AsyncHttpClient(self, max_concurrency=max_concurrency, engine=engine)
+    
+    def parallel_requests(self, requests: List, max_concurrency: int = 100,
+                          return_exceptions: bool = False) -> List[JudoResponse]:
+        """
+        Send many requests concurrently from sync code
+        
+        Args:
+            requests: (method, url[, kwargs]) tuples or dicts with method/url
+            max_concurrency: Maximum number of requests in flight
+            return_exceptions: Return failures in place instead of raising
+        
+        Returns:
+            Responses in the same order as the requests
+        """
+        return self.async_http(max_concurrency).run_many(requests, return_exceptions)
+    
     # ==================== Request Configuration ====================
     
     def header(self, name: str, value: str) -> None:
@@ -203,11 +242,13 @@ class Judo:
     
     def json_path(self, json_data: Any, path: str) -> Any:
         """Extract value using JSONPath"""
-        from jsonpath_ng import parse
-        jsonpath_expr = parse(path)
-        matches = [match.value for match in jsonpath_expr.find(json_data)]
+        matches = find_values(json_data, path)
         return matches[0] if len(matches) == 1 else matches
     
+    def json_path_stats(self) -> Dict[str, Any]:
+        """Hit/miss stats of the shared compiled JSONPath cache"""
+        return jsonpath_cache_stats()
+    
     def xml_path(self, xml_data: str, xpath: str) -> Any:
         """Extract value using XPath"""
         from lxml import etree
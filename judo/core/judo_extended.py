@@ -50,7 +50,7 @@ class JudoExtended(Judo):
         self.data_driven = DataDrivenTesting()
         
         # Tier 2: Performance Monitoring
-        self.performance_monitor = PerformanceMonitor()
+        self.performance_monitor = PerformanceMonitor(pool_stats=self.http_client.pool_stats)
         
         # Tier 2: Response Caching
         self.cache = ResponseCache()
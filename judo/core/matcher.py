@@ -4,175 +4,248 @@ Implements Karate's powerful matching capabilities
 """
 
 import re
-import json
-from typing import Any, Dict, List, Optional, Union
-from jsonschema import validate, ValidationError
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Union
+from jsonschema import SchemaError
+from .jsonpath import find_values
+from .schema_cache import get_validator
 
 
-class Matcher:
-    """
-    Comprehensive matcher implementing Karate's matching logic
-    """
-    
-    def __init__(self, judo_instance):
-        self.judo = judo_instance
-    
-    def match(self, actual: Any, expected: Any) -> bool:
-        """
-        Main match method - implements Karate's match operator
-        Supports all Karate matching patterns
-        """
-        try:
-            return self._match_recursive(actual, expected)
-        except Exception as e:
-            self.judo.log(f"Match failed: {e}", "ERROR")
-            return False
-    
-    def _match_recursive(self, actual: Any, expected: Any) -> bool:
-        """Recursive matching logic"""
-        
-        # Handle special matchers (strings starting with ##)
-        if isinstance(expected, str) and expected.startswith('##'):
-            return self._match_special(actual, expected)
-        
-        # Handle regex patterns
-        if isinstance(expected, str) and expected.startswith('#regex'):
-            pattern = expected[6:].strip()
-            return bool(re.match(pattern, str(actual)))
-        
-        # Handle JSONPath expressions
-        if isinstance(expected, str) and expected.startswith('$.'):
-            return self._match_jsonpath(actual, expected)
-        
-        # Handle schema validation
-        if isinstance(expected, dict) and expected.get('type'):
-            return self._match_schema(actual, expected)
-        
-        # Exact match for primitives
-        if isinstance(expected, (str, int, float, bool)) and not isinstance(expected, str):
-            return actual == expected
-        
-        # String exact match (unless it's a special pattern)
-        if isinstance(expected, str) and not expected.startswith(('#', '$')):
-            return str(actual) == expected
-        
-        # None/null matching
-        if expected is None:
-            return actual is None
-        
-        # List matching
-        if isinstance(expected, list):
-            return self._match_list(actual, expected)
-        
-        # Dictionary matching
-        if isinstance(expected, dict):
-            return self._match_dict(actual, expected)
-        
-        # Default exact match
-        return actual == expected
-    
-    def _match_special(self, actual: Any, pattern: str) -> bool:
-        """Handle special matchers like ##string, ##number, etc."""
-        
-        matchers = {
-            '##string': lambda x: isinstance(x, str),
-            '##number': lambda x: isinstance(x, (int, float)),
-            '##boolean': lambda x: isinstance(x, bool),
-            '##array': lambda x: isinstance(x, list),
-            '##object': lambda x: isinstance(x, dict),
-            '##null': lambda x: x is None,
-            '##notnull': lambda x: x is not None,
-            '##present': lambda x: x is not None,
-            '##notpresent': lambda x: x is None,
-            '##ignore': lambda x: True,
-            '##uuid': lambda x: self._is_uuid(x),
-            '##email': lambda x: self._is_email(x),
-            '##url': lambda x: self._is_url(x),
-            '##date': lambda x: self._is_date(x),
-            '##datetime': lambda x: self._is_datetime(x),
-        }
-        
-        # Handle parameterized matchers
+# A compiled template: takes the actual value, returns whether it matches
+MatchPlan = Callable[[Any], bool]
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+
+
+def _is_uuid(value: Any) -> bool:
+    """Check if value is a valid UUID"""
+    try:
+        uuid.UUID(str(value))
+        return True
+    except ValueError:
+        return False
+
+
+_SPECIAL_MATCHERS: Dict[str, MatchPlan] = {
+    '##string': lambda x: isinstance(x, str),
+    '##number': lambda x: isinstance(x, (int, float)),
+    '##boolean': lambda x: isinstance(x, bool),
+    '##array': lambda x: isinstance(x, list),
+    '##object': lambda x: isinstance(x, dict),
+    '##null': lambda x: x is None,
+    '##notnull': lambda x: x is not None,
+    '##present': lambda x: x is not None,
+    '##notpresent': lambda x: x is None,
+    '##ignore': lambda x: True,
+    '##uuid': _is_uuid,
+    '##email': lambda x: bool(_EMAIL_RE.match(str(x))),
+    '##url': lambda x: bool(_URL_RE.match(str(x))),
+    '##date': lambda x: bool(_DATE_RE.match(str(x))),
+    '##datetime': lambda x: bool(_DATETIME_RE.match(str(x))),
+}
+
+
+def _failing_plan(error: Exception) -> MatchPlan:
+    """Plan for a malformed template: raises when used, like the interpreter did"""
+    def plan(actual):
+        raise error
+    return plan
+
+
+def _compile_special(pattern: str) -> MatchPlan:
+    """Compile ##string, ##number[1,100], ##array[5] and friends"""
+    try:
         if pattern.startswith('##string['):
-            # ##string[5] - exact length
-            # ##string[3,10] - length range
+            # ##string[5] - exact length, ##string[3,10] - length range
             length_spec = pattern[9:-1]
             if ',' in length_spec:
                 min_len, max_len = map(int, length_spec.split(','))
-                return isinstance(actual, str) and min_len <= len(actual) <= max_len
-            else:
-                expected_len = int(length_spec)
-                return isinstance(actual, str) and len(actual) == expected_len
+                return lambda x: isinstance(x, str) and min_len <= len(x) <= max_len
+            expected_len = int(length_spec)
+            return lambda x: isinstance(x, str) and len(x) == expected_len
         
         if pattern.startswith('##number['):
             # ##number[1,100] - number range
-            range_spec = pattern[9:-1]
-            min_val, max_val = map(float, range_spec.split(','))
-            return isinstance(actual, (int, float)) and min_val <= actual <= max_val
+            min_val, max_val = map(float, pattern[9:-1].split(','))
+            return lambda x: isinstance(x, (int, float)) and min_val <= x <= max_val
         
         if pattern.startswith('##array['):
-            # ##array[5] - exact size
-            # ##array[1,10] - size range
+            # ##array[5] - exact size, ##array[1,10] - size range
             size_spec = pattern[8:-1]
             if ',' in size_spec:
                 min_size, max_size = map(int, size_spec.split(','))
-                return isinstance(actual, list) and min_size <= len(actual) <= max_size
-            else:
-                expected_size = int(size_spec)
-                return isinstance(actual, list) and len(actual) == expected_size
-        
-        matcher_func = matchers.get(pattern)
-        return matcher_func(actual) if matcher_func else False
+                return lambda x: isinstance(x, list) and min_size <= len(x) <= max_size
+            expected_size = int(size_spec)
+            return lambda x: isinstance(x, list) and len(x) == expected_size
+    except ValueError as e:
+        return _failing_plan(e)
     
-    def _match_jsonpath(self, actual: Any, jsonpath: str) -> bool:
-        """Match using JSONPath expression"""
+    return _SPECIAL_MATCHERS.get(pattern, lambda x: False)
+
+
+def _compile_jsonpath(jsonpath: str) -> MatchPlan:
+    def plan(actual):
         try:
-            from jsonpath_ng import parse
-            jsonpath_expr = parse(jsonpath)
-            matches = [match.value for match in jsonpath_expr.find(actual)]
-            return len(matches) > 0
+            return len(find_values(actual, jsonpath)) > 0
         except Exception:
             return False
+    return plan
+
+
+def _compile_schema(schema: Dict) -> MatchPlan:
+    try:
+        validator = get_validator(schema)
+    except SchemaError as e:
+        return _failing_plan(e)
+    return validator.is_valid
+
+
+def _compile_list(expected: List) -> MatchPlan:
+    item_plans = [_compile_plan(item) for item in expected]
+    size = len(item_plans)
     
-    def _match_schema(self, actual: Any, schema: Dict) -> bool:
-        """Validate against JSON schema"""
-        try:
-            validate(instance=actual, schema=schema)
-            return True
-        except ValidationError:
+    def plan(actual):
+        if not isinstance(actual, list) or len(actual) != size:
             return False
+        return all(item_plan(value) for item_plan, value in zip(item_plans, actual))
+    return plan
+
+
+def _compile_dict(expected: Dict) -> MatchPlan:
+    key_plans = [(key, _compile_plan(value)) for key, value in expected.items()]
     
-    def _match_list(self, actual: Any, expected: List) -> bool:
-        """Match lists/arrays"""
-        if not isinstance(actual, list):
-            return False
-        
-        if len(actual) != len(expected):
+    def plan(actual):
+        if not isinstance(actual, dict):
             return False
-        
-        for i, expected_item in enumerate(expected):
-            if not self._match_recursive(actual[i], expected_item):
+        for key, value_plan in key_plans:
+            if key not in actual or not value_plan(actual[key]):
                 return False
-        
         return True
+    return plan
+
+
+def _compile_plan(expected: Any) -> MatchPlan:
+    """Turn an expected template into a match plan (same rules as Matcher.match)"""
+    if isinstance(expected, str):
+        # Special matchers (strings starting with ##)
+        if expected.startswith('##'):
+            return _compile_special(expected)
+        # Regex patterns
+        if expected.startswith('#regex'):
+            try:
+                regex = re.compile(expected[6:].strip())
+            except re.error as e:
+                return _failing_plan(e)
+            return lambda x: bool(regex.match(str(x)))
+        # JSONPath expressions
+        if expected.startswith('$.'):
+            return _compile_jsonpath(expected)
+        # String exact match (unless it's a special pattern)
+        if not expected.startswith(('#', '$')):
+            return lambda x: str(x) == expected
+        return lambda x: x == expected
     
-    def _match_dict(self, actual: Any, expected: Dict) -> bool:
-        """Match dictionaries/objects"""
-        if not isinstance(actual, dict):
+    # Schema validation
+    if isinstance(expected, dict) and expected.get('type'):
+        return _compile_schema(expected)
+    
+    # Exact match for primitives
+    if isinstance(expected, (int, float, bool)):
+        return lambda x: x == expected
+    
+    # None/null matching
+    if expected is None:
+        return lambda x: x is None
+    
+    if isinstance(expected, list):
+        return _compile_list(expected)
+    
+    if isinstance(expected, dict):
+        return _compile_dict(expected)
+    
+    # Default exact match
+    return lambda x: x == expected
+
+
+class Matcher:
+    """
+    Comprehensive matcher implementing Karate's matching logic
+    """
+    
+    # Compiled plans kept per Matcher (LRU)
+    plan_cache_size = 256
+    
+    def __init__(self, judo_instance):
+        self.judo = judo_instance
+        self._plans: "OrderedDict[str, MatchPlan]" = OrderedDict()
+        self._plans_lock = threading.Lock()
+        self._plan_hits = 0
+        self._plan_misses = 0
+    
+    def match(self, actual: Any, expected: Any) -> bool:
+        """
+        Main match method - implements Karate's match operator
+        Supports all Karate matching patterns
+        """
+        try:
+            return self._match_recursive(actual, expected)
+        except Exception as e:
+            self.judo.log(f"Match failed: {e}", "ERROR")
             return False
+    
+    def compile(self, expected: Any) -> MatchPlan:
+        """
+        Compile an expected template into a reusable match plan
         
-        for key, expected_value in expected.items():
-            if key not in actual:
-                return False
-            if not self._match_recursive(actual[key], expected_value):
-                return False
+        Plans are cached by the template's repr, so matching the same
+        template again (e.g. match_each over a large array) skips
+        re-reading markers and recompiling regexes.
         
-        return True
+        Example:
+            plan = matcher.compile({"id": "##number", "email": "##email"})
+            ok = all(plan(item) for item in items)
+        """
+        key = repr(expected)
+        with self._plans_lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self._plan_hits += 1
+                return plan
+            self._plan_misses += 1
+        
+        plan = _compile_plan(expected)
+        with self._plans_lock:
+            self._plans[key] = plan
+            while len(self._plans) > self.plan_cache_size:
+                self._plans.popitem(last=False)
+        return plan
+    
+    def plan_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the compiled plan cache"""
+        with self._plans_lock:
+            lookups = self._plan_hits + self._plan_misses
+            return {
+                "size": len(self._plans),
+                "hits": self._plan_hits,
+                "misses": self._plan_misses,
+                "hit_rate_percent": round(self._plan_hits / lookups * 100, 2) if lookups else 0
+            }
+    
+    def _match_recursive(self, actual: Any, expected: Any) -> bool:
+        """Match one value against a template (through its compiled plan)"""
+        return self.compile(expected)(actual)
     
     def match_contains(self, actual: Any, expected: Any) -> bool:
         """Match that actual contains expected"""
         if isinstance(actual, list):
-            return any(self._match_recursive(item, expected) for item in actual)
+            plan = self.compile(expected)
+            return any(plan(item) for item in actual)
         elif isinstance(actual, dict) and isinstance(expected, dict):
             for key, value in expected.items():
                 if key not in actual or not self._match_recursive(actual[key], value):
@@ -190,11 +263,11 @@ class Matcher:
         if len(actual) != len(expected):
             return False
         
-        expected_copy = expected.copy()
+        expected_copy = [self.compile(exp_item) for exp_item in expected]
         for item in actual:
             found = False
-            for i, exp_item in enumerate(expected_copy):
-                if self._match_recursive(item, exp_item):
+            for i, exp_plan in enumerate(expected_copy):
+                if exp_plan(item):
                     expected_copy.pop(i)
                     found = True
                     break
@@ -209,7 +282,8 @@ class Matcher:
             return False
         
         for exp_item in expected:
-            if any(self._match_recursive(item, exp_item) for item in actual):
+            plan = self.compile(exp_item)
+            if any(plan(item) for item in actual):
                 return True
         
         return False
@@ -219,35 +293,6 @@ class Matcher:
         if not isinstance(actual, list):
             return False
         
-        return all(self._match_recursive(item, expected) for item in actual)
-    
-    # Helper methods for special matchers
-    
-    def _is_uuid(self, value: str) -> bool:
-        """Check if value is a valid UUID"""
-        import uuid
-        try:
-            uuid.UUID(str(value))
-            return True
-        except ValueError:
-            return False
-    
-    def _is_email(self, value: str) -> bool:
-        """Check if value is a valid email"""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, str(value)))
-    
-    def _is_url(self, value: str) -> bool:
-        """Check if value is a valid URL"""
-        url_pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        return bool(re.match(url_pattern, str(value)))
-    
-    def _is_date(self, value: str) -> bool:
-        """Check if value is a valid date (YYYY-MM-DD)"""
-        date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-        return bool(re.match(date_pattern, str(value)))
-    
-    def _is_datetime(self, value: str) -> bool:
-        """Check if value is a valid datetime (ISO format)"""
-        datetime_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'
-        return bool(re.match(datetime_pattern, str(value)))
\ No newline at end of file
+        # Compiled once, reused for every item
+        plan = self.compile(expected)
+        return all(plan(item) for item in actual)
@@ -5,17 +5,33 @@ JudoResponse class - Enhanced response object with Karate-like features
 import json
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import parse_qs, urlparse
+from .jsonpath import find_values
+from ..utils import json_codec
+
+
+# Marks a lazily computed value that has not been computed yet
+_UNSET = object()
+# Cached result of a body that is not valid JSON
+_INVALID_JSON = object()
+# Encodings the JSON codec can detect on its own from raw bytes
+_JSON_BYTE_ENCODINGS = {'utf-8', 'utf8', 'utf-16', 'utf-32', 'ascii'}
 
 
 class JudoResponse:
     """
     Enhanced response object providing Karate-like response handling
+    
+    The body is kept as the raw bytes from requests; text and JSON are
+    decoded on first access and cached, so assertions and reporting share
+    a single decoded representation.
     """
     
     def __init__(self, response):
         """Initialize with requests.Response object"""
         self._response = response
-        self._json_cache = None
+        self._headers = None
+        self._text = _UNSET
+        self._json_value = _UNSET
         self._xml_cache = None
     
     @property
@@ -31,7 +47,9 @@ class JudoResponse:
     @property
     def headers(self) -> Dict[str, str]:
         """Response headers"""
-        return dict(self._response.headers)
+        if self._headers is None:
+            self._headers = dict(self._response.headers)
+        return self._headers
     
     @property
     def cookies(self) -> Dict[str, str]:
@@ -40,8 +58,10 @@ class JudoResponse:
     
     @property
     def text(self) -> str:
-        """Response text content"""
-        return self._response.text
+        """Response text content (decoded once)"""
+        if self._text is _UNSET:
+            self._text = self._response.text
+        return self._text
     
     @property
     def content(self) -> bytes:
@@ -49,14 +69,32 @@ class JudoResponse:
         return self._response.content
     
     @property
-    def json(self) -> Any:
-        """Parse response as JSON"""
-        if self._json_cache is None:
+    def size(self) -> int:
+        """Body size in bytes (no decoding)"""
+        return len(self._response.content or b'')
+    
+    def _parse_json(self) -> Any:
+        """Decode the body as JSON once; _INVALID_JSON if it is not JSON"""
+        if self._json_value is _UNSET:
+            encoding = (self._response.encoding or '').lower()
             try:
-                self._json_cache = self._response.json()
-            except (json.JSONDecodeError, ValueError):
-                self._json_cache = {}
-        return self._json_cache
+                if self._text is _UNSET and (not encoding or encoding in _JSON_BYTE_ENCODINGS):
+                    # The codec detects UTF-8/16/32 from bytes, skipping the text copy
+                    content = self._response.content
+                    if not content:
+                        raise ValueError("Empty body")
+                    self._json_value = json_codec.loads(content)
+                else:
+                    self._json_value = json_codec.loads(self.text)
+            except (json.JSONDecodeError, ValueError, UnicodeDecodeError):
+                self._json_value = _INVALID_JSON
+        return self._json_value
+    
+    @property
+    def json(self) -> Any:
+        """Parse response as JSON ({} when the body is not JSON)"""
+        value = self._parse_json()
+        return {} if value is _INVALID_JSON else value
     
     @property
     def xml(self) -> Any:
@@ -79,6 +117,26 @@ class JudoResponse:
         """Response time in seconds"""
         return self._response.elapsed.total_seconds()
     
+    @property
+    def transport(self) -> Dict[str, Any]:
+        """Connection details: http_version, connection_reused, stream_id"""
+        return dict(getattr(self._response, 'judo_transport', None) or {})
+    
+    @property
+    def http_version(self) -> Optional[str]:
+        """Negotiated protocol, e.g. HTTP/1.1 or HTTP/2"""
+        return self.transport.get('http_version')
+    
+    @property
+    def connection_reused(self) -> Optional[bool]:
+        """Whether the request went over an already open connection"""
+        return self.transport.get('connection_reused')
+    
+    @property
+    def stream_id(self) -> Optional[int]:
+        """HTTP/2 stream id (None for HTTP/1.x)"""
+        return self.transport.get('stream_id')
+    
     @property
     def encoding(self) -> str:
         """Response encoding"""
@@ -94,9 +152,7 @@ class JudoResponse:
     
     def json_path(self, path: str) -> Any:
         """Extract value using JSONPath"""
-        from jsonpath_ng import parse
-        jsonpath_expr = parse(path)
-        matches = [match.value for match in jsonpath_expr.find(self.json)]
+        matches = find_values(self.json, path)
         return matches[0] if len(matches) == 1 else matches
     
     def xpath(self, xpath: str) -> Any:
@@ -123,16 +179,12 @@ class JudoResponse:
         if 'application/json' in content_type or 'application/javascript' in content_type:
             return True
         
-        # If already cached, it's JSON
-        if self._json_cache is not None:
-            return True
-        
-        # Try to parse as JSON
-        try:
-            self._response.json()
-            return True
-        except (json.JSONDecodeError, ValueError):
-            return False
+        # Try to parse as JSON (the result is cached for .json)
+        return self.has_json_body()
+    
+    def has_json_body(self) -> bool:
+        """Check if the body decodes as JSON, whatever the content-type says"""
+        return self._parse_json() is not _INVALID_JSON
     
     def is_xml(self) -> bool:
         """Check if response is XML"""
@@ -174,7 +226,7 @@ class JudoResponse:
         
         if self.is_json():
             lines.append("JSON Body:")
-            lines.append(json.dumps(self.json, indent=2))
+            lines.append(json_codec.dumps(self.json, indent=2, ensure_ascii=True))
         elif self.text:
             lines.append("Text Body:")
             lines.append(self.text[:1000] + ("..." if len(self.text) > 1000 else ""))
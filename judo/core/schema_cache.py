@@ -0,0 +1,174 @@
+"""
+Schema Cache - Pre-built JSON Schema validators reused across validations
+
+jsonschema.validate() checks the schema against its meta-schema and builds
+a new validator on every call. Here validators are built once per schema
+content (sha1 of its canonical JSON) and schema files are cached by
+path + mtime.
+
+Optional fast path: with JUDO_SCHEMA_BACKEND=fastjsonschema (and
+fastjsonschema installed) valid instances are checked by a compiled
+validator; failures are re-checked with jsonschema so error messages stay
+the same.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import jsonschema
+from jsonschema.exceptions import best_match
+
+
+class CachedValidator:
+    """A checked schema with its pre-built jsonschema validator"""
+
+    def __init__(self, schema: Any, fast_backend: bool = False):
+        self.schema = schema
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        self.validator = validator_class(schema)
+        self._fast: Optional[Callable] = None
+        if fast_backend:
+            try:
+                import fastjsonschema
+                self._fast = fastjsonschema.compile(schema)
+            except Exception:
+                # Not installed or schema not supported: jsonschema only
+                self._fast = None
+
+    def is_valid(self, instance: Any) -> bool:
+        if self._fast is not None:
+            try:
+                self._fast(instance)
+                return True
+            except Exception:
+                pass
+        return self.validator.is_valid(instance)
+
+    def validate(self, instance: Any) -> None:
+        """Raise jsonschema.ValidationError like jsonschema.validate()"""
+        if self._fast is not None:
+            try:
+                self._fast(instance)
+                return
+            except Exception:
+                pass
+        error = best_match(self.validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+
+class SchemaCache:
+    """
+    Thread-safe LRU of CachedValidator instances
+
+    Size comes from JUDO_SCHEMA_CACHE_SIZE (default: 256).
+    """
+
+    def __init__(self, maxsize: int = None, fast_backend: bool = None):
+        if maxsize is None:
+            maxsize = int(os.getenv('JUDO_SCHEMA_CACHE_SIZE', '256'))
+        if fast_backend is None:
+            fast_backend = os.getenv('JUDO_SCHEMA_BACKEND', 'jsonschema').lower() == 'fastjsonschema'
+        self.maxsize = maxsize
+        self.fast_backend = fast_backend
+        self._validators: "OrderedDict[str, CachedValidator]" = OrderedDict()
+        self._files: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def schema_key(schema: Any) -> str:
+        """Content hash of a schema (key order does not matter)"""
+        canonical = json.dumps(schema, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, schema: Any) -> CachedValidator:
+        """Validator for a schema, built on the first request"""
+        key = self.schema_key(schema)
+        with self._lock:
+            cached = self._validators.get(key)
+            if cached is not None:
+                self._validators.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        cached = CachedValidator(schema, self.fast_backend)
+        if self.maxsize > 0:
+            with self._lock:
+                self._validators[key] = cached
+                while len(self._validators) > self.maxsize:
+                    self._validators.popitem(last=False)
+        return cached
+
+    def get_file(self, schema_file: str) -> CachedValidator:
+        """Validator for a JSON schema file, reloaded when its mtime changes"""
+        path = os.path.abspath(schema_file)
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and entry[0] == mtime:
+                cached = self._validators.get(entry[1])
+                if cached is not None:
+                    self._validators.move_to_end(entry[1])
+                    self.hits += 1
+                    return cached
+
+        with open(path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        cached = self.get(schema)
+        with self._lock:
+            self._files[path] = (mtime, self.schema_key(schema))
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and hit rate (percent)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._validators),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fast_backend": self.fast_backend,
+                "hit_rate_percent": round(self.hits / lookups * 100, 2) if lookups else 0
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+            self._files.clear()
+            self.hits = self.misses = 0
+
+
+_cache = SchemaCache()
+
+
+def get_validator(schema: Any) -> CachedValidator:
+    """Cached validator for a schema"""
+    return _cache.get(schema)
+
+
+def validate(instance: Any, schema: Any) -> None:
+    """Drop-in for jsonschema.validate() using the shared cache"""
+    _cache.get(schema).validate(instance)
+
+
+def load_schema_file(schema_file: str) -> CachedValidator:
+    """Cached validator for a JSON schema file (keyed by path + mtime)"""
+    return _cache.get_file(schema_file)
+
+
+def schema_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the shared validator cache"""
+    return _cache.stats()
+
+
+def clear_schema_cache() -> None:
+    """Empty the shared validator cache"""
+    _cache.clear()
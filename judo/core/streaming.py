@@ -0,0 +1,287 @@
+"""
+StreamingJudoResponse - Bounded-memory handling of large response bodies
+"""
+
+import hashlib
+import json
+import tempfile
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from .response import JudoResponse
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Spooled bodies stay in memory up to this size, then move to a temp file
+DEFAULT_SPOOL_MEMORY = 8 * 1024 * 1024
+
+
+class StreamingJudoResponse(JudoResponse):
+    """
+    JudoResponse whose body is read from the network incrementally
+
+    The body is consumed once, chunk by chunk; size and hashes are updated
+    as it goes. With spool=True the chunks are also written to a spooled
+    temp file so the body can be read again (iter_bytes, content, json).
+    Without spooling, the body can only be iterated once and calling
+    content/text/json loads the remaining body into memory. If an
+    iteration stops early the connection is released, and any later read
+    raises instead of returning the partial body.
+
+    Example:
+        with judo.stream("GET", "/export.ndjson") as resp:
+            for item in resp.iter_ndjson():
+                ...
+            resp.assert_size(min_bytes=1)
+            print(resp.hexdigest("sha256"))
+    """
+
+    def __init__(self, response, spool: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 hash_algorithms: Sequence[str] = ("sha256",),
+                 spool_memory: int = DEFAULT_SPOOL_MEMORY):
+        super().__init__(response)
+        self.chunk_size = chunk_size
+        self._hashers = {name: hashlib.new(name) for name in hash_algorithms}
+        self._bytes_read = 0
+        self._consumed = False
+        self._complete = False
+        self._content_cache: Optional[bytes] = None
+        self._spool = tempfile.SpooledTemporaryFile(max_size=spool_memory) if spool else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    # ==================== Incremental reading ====================
+
+    def _read_network(self) -> Iterator[bytes]:
+        """Read the remaining body from the network, updating size and hashes"""
+        if self._consumed:
+            raise RuntimeError("Streamed body was already consumed (use spool=True to read it again)")
+        complete = False
+        try:
+            for chunk in self._response.iter_content(chunk_size=self.chunk_size):
+                if not chunk:
+                    continue
+                self._bytes_read += len(chunk)
+                for hasher in self._hashers.values():
+                    hasher.update(chunk)
+                if self._spool is not None:
+                    self._spool.write(chunk)
+                yield chunk
+            complete = True
+        finally:
+            self._consumed = True
+            self._complete = complete
+            self._response.close()
+
+    def _require_complete(self) -> None:
+        if self._consumed and not self._complete:
+            raise RuntimeError(f"Streamed body was only partially read ({self._bytes_read} bytes): "
+                               "iteration stopped early and the rest of the body is no longer available")
+
+    def iter_bytes(self, chunk_size: int = None) -> Iterator[bytes]:
+        """Iterate over the body in chunks"""
+        self._require_complete()
+        if self._content_cache is not None:
+            data = self._content_cache
+            step = chunk_size or self.chunk_size
+            for start in range(0, len(data), step):
+                yield data[start:start + step]
+            return
+        if self._consumed and self._spool is not None:
+            self._spool.seek(0)
+            while True:
+                chunk = self._spool.read(chunk_size or self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        yield from self._read_network()
+
+    def iter_lines(self, encoding: str = None) -> Iterator[str]:
+        """Iterate over the body line by line (decoded)"""
+        encoding = encoding or self._response.encoding or 'utf-8'
+        pending = b''
+        for chunk in self.iter_bytes():
+            pending += chunk
+            lines = pending.split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip(b'\r').decode(encoding)
+        if pending:
+            yield pending.rstrip(b'\r').decode(encoding)
+
+    def iter_ndjson(self) -> Iterator[Any]:
+        """Iterate over NDJSON / JSON Lines records"""
+        for line in self.iter_lines():
+            if line.strip():
+                yield json.loads(line)
+
+    def iter_json_items(self) -> Iterator[Any]:
+        """
+        Iterate over the items of a top-level JSON array without loading it
+
+        Only the item being decoded is held in memory.
+        """
+        decoder = json.JSONDecoder()
+        encoding = self._response.encoding or 'utf-8'
+        buffer = ''
+        position = 0
+        started = False
+        chunks = self.iter_bytes()
+        incremental = _incremental_decoder(encoding)
+
+        def more() -> bool:
+            nonlocal buffer, position
+            for chunk in chunks:
+                buffer = buffer[position:] + incremental.decode(chunk)
+                position = 0
+                return True
+            return False
+
+        while True:
+            # Skip whitespace and separators
+            while True:
+                while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                    position += 1
+                if position < len(buffer) or not more():
+                    break
+            if position >= len(buffer):
+                raise ValueError("Unexpected end of JSON array")
+
+            if not started:
+                if buffer[position] != '[':
+                    raise ValueError("Response body is not a JSON array")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == ']':
+                # Read any trailing bytes so size and hashes cover the whole body
+                for _ in chunks:
+                    pass
+                return
+
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if not more():
+                        raise
+                    continue
+                # Accept the item once its ',' or ']' arrived: a number cut at the
+                # chunk boundary (1 of 1.5) decodes too early otherwise
+                following = end
+                while following < len(buffer) and buffer[following] in ' \t\r\n':
+                    following += 1
+                if following < len(buffer) and buffer[following] in ',]':
+                    break
+                if not more():
+                    raise ValueError("Malformed JSON array")
+            position = following
+            yield item
+
+    def consume(self) -> int:
+        """Read the rest of the body (discarding it unless spooled); returns total size"""
+        if not self._consumed:
+            for _ in self._read_network():
+                pass
+        self._require_complete()
+        return self._bytes_read
+
+    # ==================== Body accessors ====================
+
+    @property
+    def content(self) -> bytes:
+        """Whole body in memory (from the spool when available)"""
+        if self._content_cache is None:
+            self._require_complete()
+            if self._consumed and self._spool is not None:
+                self._spool.seek(0)
+                self._content_cache = self._spool.read()
+            else:
+                self._content_cache = b''.join(self._read_network())
+            self._response._content = self._content_cache
+        return self._content_cache
+
+    @property
+    def text(self) -> str:
+        """Whole body decoded (loads it into memory)"""
+        self.content
+        return super().text
+
+    def _parse_json(self) -> Any:
+        self.content
+        return super()._parse_json()
+
+    @property
+    def size(self) -> int:
+        """Body size in bytes (reads the remaining body if needed)"""
+        return self.consume()
+
+    @property
+    def bytes_read(self) -> int:
+        """Bytes received so far"""
+        return self._bytes_read
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header"""
+        return self.header('content-type', self.header('Content-Type', ''))
+
+    def hexdigest(self, algorithm: str = "sha256") -> str:
+        """Digest of the whole body (algorithm must be in hash_algorithms)"""
+        if algorithm not in self._hashers:
+            raise ValueError(f"Hash '{algorithm}' not tracked; pass hash_algorithms=(..., '{algorithm}')")
+        self.consume()
+        return self._hashers[algorithm].hexdigest()
+
+    def is_json(self) -> bool:
+        """Check JSON by content type only (never reads the body)"""
+        content_type = self.content_type.lower()
+        return 'json' in content_type or 'application/javascript' in content_type
+
+    # ==================== Assertions ====================
+
+    def assert_size(self, min_bytes: int = None, max_bytes: int = None, exact: int = None):
+        """Assert body size in bytes"""
+        size = self.size
+        if exact is not None:
+            assert size == exact, f"Body size {size} bytes, expected {exact}"
+        if min_bytes is not None:
+            assert size >= min_bytes, f"Body size {size} bytes is below {min_bytes}"
+        if max_bytes is not None:
+            assert size <= max_bytes, f"Body size {size} bytes exceeds {max_bytes}"
+
+    def assert_content_type(self, expected: str):
+        """Assert Content-Type contains the expected media type"""
+        actual = self.content_type
+        assert expected.lower() in actual.lower(), f"Content-Type '{actual}' does not match '{expected}'"
+
+    def assert_hash(self, expected: str, algorithm: str = "sha256"):
+        """Assert body digest"""
+        actual = self.hexdigest(algorithm)
+        assert actual.lower() == expected.lower(), f"{algorithm} {actual} does not match {expected}"
+
+    def summary(self) -> Dict[str, Any]:
+        """Size, content type and digests, for logs and reports"""
+        data = {"size_bytes": self._bytes_read, "content_type": self.content_type,
+                "complete": self._complete}
+        if self._complete:
+            data.update({name: hasher.hexdigest() for name, hasher in self._hashers.items()})
+        return data
+
+    def close(self):
+        """Release the connection and the spool"""
+        self._response.close()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def __str__(self) -> str:
+        return f"StreamingJudoResponse(status={self.status}, url='{self.url}')"
+
+
+def _incremental_decoder(encoding: str):
+    import codecs
+    return codecs.getincrementaldecoder(encoding)(errors='strict')
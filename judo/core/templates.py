@@ -0,0 +1,281 @@
+"""
+Templates - Interpolation templates compiled once and cached
+
+Two marker syntaxes are used in Judo:
+    - "brace": {name}   (Behave steps, JudoContext.interpolate_string)
+    - "hash":  #{name}  (VariableManager.interpolate, Karate style)
+
+A template is the string split once into literal text and placeholders.
+Rendering only looks up the placeholders; strings without markers are
+returned as-is without touching the cache. JSON documents (request body
+docstrings) are parsed and compiled once as well, see compile_json().
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from ..utils import json_codec
+
+
+# Returned by a resolver when a name is unknown: the marker is kept as written
+MISSING = object()
+
+# Cached compile_json() result for text that is not JSON before interpolation
+_NOT_JSON = object()
+
+Resolver = Callable[[str], Any]
+
+_SYNTAXES = {
+    # syntax: (quick marker check, pattern, strip names)
+    "brace": ("{", re.compile(r'\{([^{}]+)\}'), False),
+    "hash": ("#{", re.compile(r'#\{([^}]+)\}'), True),
+}
+
+
+class Template:
+    """A string split into literal parts and (name, marker) placeholders"""
+
+    __slots__ = ('source', 'parts', 'names')
+
+    def __init__(self, source: str, parts: Tuple[Union[str, Tuple[str, str]], ...]):
+        self.source = source
+        self.parts = parts
+        self.names = tuple(part[0] for part in parts if part.__class__ is tuple)
+
+    def render(self, resolve: Resolver) -> str:
+        """Replace known names (resolve returns MISSING to keep the marker)"""
+        if not self.names:
+            return self.source
+        out = []
+        for part in self.parts:
+            if part.__class__ is str:
+                out.append(part)
+                continue
+            value = resolve(part[0])
+            out.append(part[1] if value is MISSING else str(value))
+        return ''.join(out)
+
+
+def _tokenize(text: str, syntax: str) -> Template:
+    _, pattern, strip = _SYNTAXES[syntax]
+    parts = []
+    position = 0
+    for match in pattern.finditer(text):
+        if match.start() > position:
+            parts.append(text[position:match.start()])
+        name = match.group(1).strip() if strip else match.group(1)
+        parts.append((name, match.group(0)))
+        position = match.end()
+    if position < len(text):
+        parts.append(text[position:])
+    return Template(text, tuple(parts))
+
+
+class TemplateCache:
+    """
+    Thread-safe bounded LRU of compiled templates
+
+    Size comes from JUDO_TEMPLATE_CACHE_SIZE (default: 1024, 0 disables caching).
+    """
+
+    def __init__(self, maxsize: int = None):
+        if maxsize is None:
+            maxsize = int(os.getenv('JUDO_TEMPLATE_CACHE_SIZE', '1024'))
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, text: str, syntax: str = "brace") -> Template:
+        """Get the compiled template for a string (tokenizing it on a miss)"""
+        return self.get_or_build((syntax, text), lambda: _tokenize(text, syntax))
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Cached entry for key, built (outside the lock) and stored on a miss"""
+        with self._lock:
+            entry = self._entries.get(key, MISSING)
+            if entry is not MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = build()
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = entry
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and hit rate (percent)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate_percent": round(self.hits / lookups * 100, 2) if lookups else 0
+            }
+
+    def clear(self) -> None:
+        """Drop all compiled templates and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_cache = TemplateCache()
+# Parsed and compiled JSON documents, keyed by their text
+_json_cache = TemplateCache(int(os.getenv('JUDO_JSON_TEMPLATE_CACHE_SIZE', '256')))
+
+
+def has_markers(text: str, syntax: str = "brace") -> bool:
+    """Cheap check before compiling: can the string contain a placeholder?"""
+    return _SYNTAXES[syntax][0] in text
+
+
+def compile_template(text: str, syntax: str = "brace") -> Template:
+    """Compiled template for a string, from the shared cache"""
+    return _cache.compile(text, syntax)
+
+
+def render(text: Any, resolve: Resolver, syntax: str = "brace") -> Any:
+    """Interpolate a string (non-strings and strings without markers are returned unchanged)"""
+    if not isinstance(text, str) or _SYNTAXES[syntax][0] not in text:
+        return text
+    return _cache.compile(text, syntax).render(resolve)
+
+
+def _compile_data(value: Any, syntax: str) -> Optional[Callable[[Resolver], Any]]:
+    """Render function for a value, or None when it contains no placeholders"""
+    if isinstance(value, str):
+        if _SYNTAXES[syntax][0] not in value:
+            return None
+        template = _cache.compile(value, syntax)
+        return template.render if template.names else None
+
+    if isinstance(value, dict):
+        changed = []
+        for key, item in value.items():
+            item_plan = _compile_data(item, syntax)
+            if item_plan is not None:
+                changed.append((key, item_plan))
+        if not changed:
+            return None
+
+        def render_dict(resolve):
+            result = dict(value)
+            for key, item_plan in changed:
+                result[key] = item_plan(resolve)
+            return result
+        return render_dict
+
+    if isinstance(value, (list, tuple)):
+        changed = []
+        for index, item in enumerate(value):
+            item_plan = _compile_data(item, syntax)
+            if item_plan is not None:
+                changed.append((index, item_plan))
+        if not changed:
+            return None
+        sequence_type = type(value)
+
+        def render_sequence(resolve):
+            result = list(value)
+            for index, item_plan in changed:
+                result[index] = item_plan(resolve)
+            return result if sequence_type is list else sequence_type(result)
+        return render_sequence
+
+    return None
+
+
+class DataTemplate:
+    """
+    A JSON-like structure (dicts, lists, strings) compiled for interpolation
+
+    Only the branches that contain placeholders are rebuilt on render;
+    every other subtree is shared with the original data, not copied.
+    Keep the DataTemplate to render the same body many times.
+
+    Example:
+        body = DataTemplate({"user": {"id": "#{id}"}, "items": big_list}, syntax="hash")
+        payload = body.render(variables.resolve)   # big_list is reused as-is
+    """
+
+    def __init__(self, data: Any, syntax: str = "brace"):
+        self.data = data
+        self._plan = _compile_data(data, syntax)
+
+    @property
+    def is_static(self) -> bool:
+        """True when the data has no placeholders (render returns it unchanged)"""
+        return self._plan is None
+
+    def render(self, resolve: Resolver) -> Any:
+        if self._plan is None:
+            return self.data
+        return self._plan(resolve)
+
+
+def render_data(data: Any, resolve: Resolver, syntax: str = "brace") -> Any:
+    """
+    Interpolate every string in a nested structure, sharing unchanged subtrees
+
+    The structure is walked on every call (it may have changed since the
+    last one); keep a DataTemplate, or use compile_json() for JSON text, to
+    render the same data repeatedly without walking it again.
+    """
+    return DataTemplate(data, syntax).render(resolve)
+
+
+def _keys_have_markers(value: Any, marker: str) -> bool:
+    if isinstance(value, dict):
+        return any(marker in key or _keys_have_markers(item, marker) for key, item in value.items())
+    if isinstance(value, list):
+        return any(_keys_have_markers(item, marker) for item in value)
+    return False
+
+
+def _build_json_template(text: str, syntax: str) -> Any:
+    try:
+        data = json_codec.loads(text)
+    except ValueError:
+        return _NOT_JSON
+    if _keys_have_markers(data, _SYNTAXES[syntax][0]):
+        # DataTemplate only renders values
+        return _NOT_JSON
+    return DataTemplate(data, syntax)
+
+
+def compile_json(text: str, syntax: str = "brace") -> Optional[DataTemplate]:
+    """
+    JSON text parsed and compiled for interpolation, from a shared cache
+
+    Rendering the result gives the same data as interpolating the text and
+    parsing it, without re-parsing or re-walking the document. Unchanged
+    subtrees are shared by every render, so they must not be modified.
+    Returns None when the text only becomes JSON after interpolation
+    (e.g. "id": {id}) or has placeholders in keys; interpolate the text
+    and parse it then. Cache size: JUDO_JSON_TEMPLATE_CACHE_SIZE (default: 256).
+    """
+    template = _json_cache.get_or_build((syntax, text), lambda: _build_json_template(text, syntax))
+    return None if template is _NOT_JSON else template
+
+
+def template_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the shared template cache"""
+    return _cache.stats()
+
+
+def clear_template_cache() -> None:
+    """Empty the shared template caches"""
+    _cache.clear()
+    _json_cache.clear()
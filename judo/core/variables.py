@@ -3,46 +3,213 @@ Variable Manager - Handles variable storage and manipulation
 Implements Karate's variable system with scoping and interpolation
 """
 
+import copy
 import os
-import re
-from typing import Any, Dict, Optional
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .templates import MISSING, render, render_data
+
+
+# Scope levels, outermost first ("root" holds values set outside any scope)
+SCOPE_LEVELS = ("root", "feature", "scenario")
+
+# Marks a name deleted in an inner scope while an outer scope still has it
+_DELETED = object()
+
+_environment: Optional[Dict[str, str]] = None
+
+
+def environment() -> Dict[str, str]:
+    """Snapshot of os.environ, taken on first use"""
+    global _environment
+    if _environment is None:
+        _environment = dict(os.environ)
+    return _environment
+
+
+def env_value(name: str, default: Any = None) -> Any:
+    """Environment variable from the snapshot"""
+    if os.name == 'nt':
+        # os.environ keys are upper-case on Windows
+        name = name.upper()
+    return environment().get(name, default)
+
+
+def refresh_environment() -> None:
+    """Take a new snapshot on next use (call after changing os.environ or loading a .env)"""
+    global _environment
+    _environment = None
+
+
+class ScopedVariables(MutableMapping):
+    """
+    Variables stored in stacked scopes: root -> feature -> scenario
+    
+    Reads look from the innermost scope outwards and writes go to the
+    innermost scope. Entering a scope pushes an empty dict and drops any
+    scope at the same or a deeper level, so a per-scenario reset is O(1)
+    and values from outer scopes (large fixtures) are shared, not copied:
+    get() returns the outer object itself. To change one in place use
+    mutable(), which copies it into the current scope on first write, so
+    the change never leaks into later scenarios. Deleting a name that
+    lives in an outer scope only hides it in the current one.
+    """
+    
+    def __init__(self):
+        self._layers: List[Tuple[int, Dict[str, Any]]] = [(0, {})]
+    
+    @staticmethod
+    def _level(scope: str) -> int:
+        try:
+            return SCOPE_LEVELS.index(scope)
+        except ValueError:
+            raise ValueError(f"Unknown variable scope '{scope}' (expected one of {', '.join(SCOPE_LEVELS)})")
+    
+    @property
+    def scope(self) -> str:
+        """Name of the innermost scope"""
+        return SCOPE_LEVELS[self._layers[-1][0]]
+    
+    def enter(self, scope: str) -> None:
+        """Start a new scope, discarding the previous one at this level and any deeper"""
+        level = self._level(scope)
+        if level == 0:
+            raise ValueError("The root scope cannot be re-entered; use clear()")
+        while self._layers[-1][0] >= level:
+            self._layers.pop()
+        self._layers.append((level, {}))
+    
+    def leave(self, scope: str) -> None:
+        """Discard a scope and any deeper one (no-op if it is not active)"""
+        level = self._level(scope)
+        while len(self._layers) > 1 and self._layers[-1][0] >= level:
+            self._layers.pop()
+    
+    def set_in(self, scope: str, name: str, value: Any) -> None:
+        """Set a value in an active outer scope (e.g. a feature-wide fixture)"""
+        level = self._level(scope)
+        for layer_level, layer in reversed(self._layers):
+            if layer_level <= level:
+                layer[name] = value
+                return
+    
+    def _lookup(self, name: str) -> Tuple[Any, bool]:
+        """(value or MISSING, whether it lives in the innermost scope)"""
+        for position in range(len(self._layers) - 1, -1, -1):
+            value = self._layers[position][1].get(name, MISSING)
+            if value is not MISSING:
+                if value is _DELETED:
+                    return MISSING, True
+                return value, position == len(self._layers) - 1
+        return MISSING, True
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        value = self._lookup(name)[0]
+        return default if value is MISSING else value
+    
+    def mutable(self, name: str) -> Any:
+        """
+        Value safe to change in place (copy-on-write)
+        
+        A dict/list coming from an outer scope is deep-copied into the
+        current scope once; later calls (and get()) return that copy.
+        """
+        value, innermost = self._lookup(name)
+        if value is MISSING:
+            raise KeyError(name)
+        if not innermost and isinstance(value, (dict, list)):
+            value = copy.deepcopy(value)
+            self._layers[-1][1][name] = value
+        return value
+    
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, MISSING)
+        if value is MISSING:
+            raise KeyError(name)
+        return value
+    
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._layers[-1][1][name] = value
+    
+    def __delitem__(self, name: str) -> None:
+        if self._lookup(name)[0] is MISSING:
+            raise KeyError(name)
+        top = self._layers[-1][1]
+        top.pop(name, None)
+        if self._lookup(name)[0] is not MISSING:
+            top[name] = _DELETED
+    
+    def __contains__(self, name: object) -> bool:
+        return self._lookup(name)[0] is not MISSING
+    
+    def _merged(self) -> Dict[str, Any]:
+        merged = {}
+        for _, layer in self._layers:
+            for name, value in layer.items():
+                if value is _DELETED:
+                    merged.pop(name, None)
+                else:
+                    merged[name] = value
+        return merged
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._merged())
+    
+    def __len__(self) -> int:
+        return len(self._merged())
+    
+    def __bool__(self) -> bool:
+        return any(layer for _, layer in self._layers)
+    
+    def clear(self) -> None:
+        """Drop every scope and value"""
+        self._layers = [(0, {})]
+    
+    def __repr__(self) -> str:
+        return f"ScopedVariables(scope={self.scope!r}, {self._merged()!r})"
 
 
 class VariableManager:
     """
     Manages variables with Karate-like scoping and interpolation
+    
+    global_variables is a plain dict shared by every scope; variables is a
+    ScopedVariables store (feature -> scenario). Environment
+    variables are read from a snapshot taken once (see refresh_environment).
     """
     
     def __init__(self):
-        self.variables = {}
+        self.variables = ScopedVariables()
         self.global_variables = {}
-        
+    
+
     def set(self, name: str, value: Any) -> None:
         """Set variable value"""
         self.variables[name] = value
     
     def get(self, name: str, default: Any = None) -> Any:
         """Get variable value with fallback to global and environment"""
-        # Check local variables first
-        if name in self.variables:
-            return self.variables[name]
-        
-        # Check global variables
-        if name in self.global_variables:
-            return self.global_variables[name]
-        
-        # Check environment variables
-        env_value = os.getenv(name)
-        if env_value is not None:
-            return env_value
-            
-        return default
+        value = self.resolve(name)
+        return default if value is MISSING else value
     
     def remove(self, name: str) -> None:
         """Remove variable"""
         self.variables.pop(name, None)
         self.global_variables.pop(name, None)
     
+    def enter_scope(self, scope: str) -> None:
+        """Start a feature/scenario scope (see ScopedVariables.enter)"""
+        self.variables.enter(scope)
+    
+    def leave_scope(self, scope: str) -> None:
+        """Discard a scope and the values set in it"""
+        self.variables.leave(scope)
+    
+    def get_mutable(self, name: str) -> Any:
+        """Variable value safe to modify in place (copy-on-write from outer scopes)"""
+        return self.variables.mutable(name)
+    
     def set_global(self, name: str, value: Any) -> None:
         """Set global variable"""
         self.global_variables[name] = value
@@ -55,35 +222,28 @@ class VariableManager:
         """Clear all global variables"""
         self.global_variables.clear()
     
+    def resolve(self, name: str) -> Any:
+        """Value for an interpolation marker (local, global, environment) or MISSING"""
+        value = self.variables.get(name, MISSING)
+        if value is not MISSING:
+            return value
+        if name in self.global_variables:
+            return self.global_variables[name]
+        return env_value(name, MISSING)
+    
     def interpolate(self, text: str) -> str:
         """
         Interpolate variables in text using #{variable} syntax
         Similar to Karate's embedded expressions
-        """
-        if not isinstance(text, str):
-            return text
-        
-        # Pattern to match #{variable} or #{expression}
-        pattern = r'#\{([^}]+)\}'
         
-        def replace_var(match):
-            var_name = match.group(1).strip()
-            
-            # Handle simple variable reference
-            if var_name in self.variables:
-                return str(self.variables[var_name])
-            elif var_name in self.global_variables:
-                return str(self.global_variables[var_name])
-            else:
-                # Try environment variable
-                env_value = os.getenv(var_name)
-                if env_value is not None:
-                    return env_value
-                
-                # Return original if not found
-                return match.group(0)
-        
-        return re.sub(pattern, replace_var, text)
+        Unknown names are left as written. Templates are compiled once and
+        cached; strings without '#{' are returned without scanning.
+        """
+        return render(text, self.resolve, "hash")
+    
+    def interpolate_data(self, data: Any) -> Any:
+        """Interpolate #{variable} in every string of a nested dict/list"""
+        return render_data(data, self.resolve, "hash")
     
     def evaluate_expression(self, expression: str) -> Any:
         """
@@ -114,7 +274,7 @@ class VariableManager:
         """Check if variable exists"""
         return (name in self.variables or 
                 name in self.global_variables or 
-                os.getenv(name) is not None)
+                env_value(name) is not None)
     
     def copy_from(self, other: 'VariableManager') -> None:
         """Copy variables from another manager"""
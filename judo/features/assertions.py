@@ -39,6 +39,7 @@ class AdvancedAssertions:
         """Assert response matches JSON schema"""
         try:
             import jsonschema
+            from ..core.schema_cache import validate
         except ImportError:
             raise ImportError("jsonschema required: pip install jsonschema")
         
@@ -46,7 +47,7 @@ class AdvancedAssertions:
         body = resp.json if hasattr(resp, 'json') else resp
         
         try:
-            jsonschema.validate(body, schema)
+            validate(body, schema)
         except jsonschema.ValidationError as e:
             raise AssertionError(f"JSON schema validation failed: {e.message}")
     
@@ -3,25 +3,266 @@ API Contract Testing
 Validate against OpenAPI and AsyncAPI specs
 """
 
+import hashlib
 import json
+import os
+import pickle
 import yaml
 import re
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+from ..core.schema_cache import CachedValidator, get_validator
+
+
+class _PathNode:
+    """Trie node of OpenAPI path templates, one level per '/' segment"""
+    
+    __slots__ = ('literals', 'param', 'templates')
+    
+    def __init__(self):
+        self.literals: Dict[str, '_PathNode'] = {}
+        self.param: Optional['_PathNode'] = None
+        # (declaration order, template) of the templates ending here
+        self.templates: List[Tuple[int, str]] = []
+
+
+class OperationIndex:
+    """
+    Lookup index built once per loaded spec
+    
+    Path templates go into a trie ('{param}' segments match any non-empty
+    segment), so finding the template of a request path costs one step per
+    segment instead of a scan of every template. When several templates
+    match, the first declared one wins, like the linear scan did.
+    
+    Ref-resolved schemas are turned into validators on first use and kept
+    per operation/status (or AsyncAPI channel).
+    """
+    
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self._root = _PathNode()
+        self._validators: Dict[Tuple, Optional[CachedValidator]] = {}
+        self._lock = threading.Lock()
+        
+        for order, template in enumerate(spec.get("paths") or {}):
+            self._insert(order, template)
+    
+    def _insert(self, order: int, template: str):
+        node = self._root
+        for part in template.split('/'):
+            if part.startswith('{') and part.endswith('}'):
+                if node.param is None:
+                    node.param = _PathNode()
+                node = node.param
+            else:
+                node = node.literals.setdefault(part, _PathNode())
+        node.templates.append((order, template))
+    
+    def find_path(self, path: str) -> Optional[str]:
+        """Spec path template matching a request path (None if no match)"""
+        parts = path.split('/')
+        best = None
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(parts):
+                if node.templates and (best is None or node.templates[0] < best):
+                    best = node.templates[0]
+                continue
+            part = parts[depth]
+            child = node.literals.get(part)
+            if child is not None:
+                stack.append((child, depth + 1))
+            if node.param is not None and part:
+                stack.append((node.param, depth + 1))
+        return best[1] if best else None
+    
+    def find_operation(self, method: str, path: str) -> Tuple[Optional[str], Optional[Dict], Optional[Dict]]:
+        """(path template, path item, operation) for a request; None where missing"""
+        template = self.find_path(path)
+        if template is None:
+            return None, None, None
+        path_spec = self.spec["paths"][template]
+        return template, path_spec, path_spec.get(method.lower())
+    
+    def validator(self, key: Tuple, schema: Any) -> Optional[CachedValidator]:
+        """Validator for the ref-resolved schema stored under key (None if no schema)"""
+        with self._lock:
+            if key in self._validators:
+                return self._validators[key]
+        validator = get_validator(self.resolve_refs(schema)) if schema else None
+        with self._lock:
+            self._validators[key] = validator
+        return validator
+    
+    def resolve_refs(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve $ref references in schema"""
+        if isinstance(schema, dict):
+            if "$ref" in schema:
+                ref_path = schema["$ref"]
+                if ref_path.startswith("#/"):
+                    # Internal reference
+                    parts = ref_path[2:].split("/")
+                    resolved = self.spec
+                    for part in parts:
+                        resolved = resolved.get(part, {})
+                    return self.resolve_refs(resolved)
+                else:
+                    # External reference - not supported yet
+                    return schema
+            else:
+                # Recursively resolve refs in nested objects
+                resolved = {}
+                for key, value in schema.items():
+                    resolved[key] = self.resolve_refs(value)
+                return resolved
+        elif isinstance(schema, list):
+            return [self.resolve_refs(item) for item in schema]
+        else:
+            return schema
+
+
+class SpecCache:
+    """
+    Process-wide cache of parsed specs and their OperationIndex
+    
+    Entries are keyed by absolute path and reused while the file's mtime
+    and size are unchanged, so every scenario loading the same contract
+    shares one parsed spec (treat ContractValidator.spec as read-only).
+    
+    When JUDO_CONTRACT_CACHE_DIR is set, parsed specs are also pickled
+    there; other processes (parallel workers, later runs) load the pickle
+    instead of parsing the YAML again. The directory is a local cache:
+    only point it at a location you trust.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, cache_dir: str = None):
+        """
+        Args:
+            cache_dir: Directory for pre-parsed specs (default: JUDO_CONTRACT_CACHE_DIR, unset = memory only)
+        """
+        self._cache_dir = cache_dir
+        self._entries: Dict[str, Tuple[Tuple[int, int], OperationIndex]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "parsed": 0}
+    
+    @property
+    def cache_dir(self) -> Optional[Path]:
+        cache_dir = self._cache_dir or os.getenv('JUDO_CONTRACT_CACHE_DIR')
+        return Path(cache_dir) if cache_dir else None
+    
+    def get(self, spec_file: str) -> OperationIndex:
+        """Indexed spec for a file, parsed only when it changed"""
+        path = os.path.abspath(spec_file)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.stats["memory_hits"] += 1
+                return entry[1]
+        
+        spec = self._read_disk(path, signature)
+        if spec is None:
+            spec = ContractValidator._load_spec(spec_file)
+            self._write_disk(path, signature, spec)
+            counter = "parsed"
+        else:
+            counter = "disk_hits"
+        
+        index = OperationIndex(spec)
+        with self._lock:
+            self.stats[counter] += 1
+            self._entries[path] = (signature, index)
+        return index
+    
+    def _disk_file(self, path: str) -> Optional[Path]:
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return None
+        digest = hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+        return cache_dir / f"{Path(path).stem}-{digest}.pickle"
+    
+    def _read_disk(self, path: str, signature: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Pre-parsed spec from disk (None if missing, stale or unreadable)"""
+        cache_file = self._disk_file(path)
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.PickleError, AttributeError, ValueError):
+            return None
+        if (not isinstance(data, dict) or data.get("version") != self.VERSION
+                or data.get("path") != path or tuple(data.get("signature", ())) != signature):
+            return None
+        return data.get("spec")
+    
+    def _write_disk(self, path: str, signature: Tuple[int, int], spec: Dict[str, Any]):
+        """Persist the parsed spec atomically (best effort)"""
+        cache_file = self._disk_file(path)
+        if cache_file is None:
+            return
+        data = {"version": self.VERSION, "path": path, "signature": signature, "spec": spec}
+        tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except (OSError, pickle.PickleError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def summary(self) -> Dict[str, int]:
+        """Counters and number of cached specs"""
+        with self._lock:
+            return dict(self.stats, size=len(self._entries))
+    
+    def clear(self):
+        """Forget in-memory entries (files in cache_dir are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.stats = {"memory_hits": 0, "disk_hits": 0, "parsed": 0}
+
+
+_spec_cache = SpecCache()
+
+
+def spec_cache_stats() -> Dict[str, int]:
+    """Hit counters of the shared spec cache"""
+    return _spec_cache.summary()
+
+
+def clear_spec_cache():
+    """Empty the shared in-memory spec cache"""
+    _spec_cache.clear()
+
 
 class ContractValidator:
     """Validate API responses against contracts"""
     
-    def __init__(self, spec_file: str):
+    def __init__(self, spec_file: str, use_cache: bool = True):
         """
         Initialize contract validator
         
         Args:
             spec_file: Path to OpenAPI or AsyncAPI spec file
+            use_cache: Share the parsed spec with other validators of the same file
         """
         self.spec_file = spec_file
-        self.spec = self._load_spec(spec_file)
+        if use_cache:
+            self.index = _spec_cache.get(spec_file)
+        else:
+            self.index = OperationIndex(self._load_spec(spec_file))
+        self.spec = self.index.spec
     
     @staticmethod
     def _load_spec(spec_file: str) -> Dict[str, Any]:
@@ -52,20 +293,12 @@ class ContractValidator:
         except ImportError:
             raise ImportError("jsonschema required: pip install jsonschema")
         
-        # Find path in spec
-        paths = self.spec.get("paths", {})
-        path_spec = None
-        
-        for spec_path in paths:
-            if self._match_path(spec_path, path):
-                path_spec = paths[spec_path]
-                break
+        # Find path and method in spec
+        template, path_spec, method_spec = self.index.find_operation(method, path)
         
         if not path_spec:
             raise ValueError(f"Path {path} not found in OpenAPI spec")
         
-        # Find method in path
-        method_spec = path_spec.get(method.lower())
         if not method_spec:
             raise ValueError(f"Method {method} not found for path {path}")
         
@@ -76,20 +309,18 @@ class ContractValidator:
         if not response_spec:
             raise ValueError(f"Status code {status_code} not found in spec")
         
-        # Get schema
+        # Get schema (resolved and compiled once per operation/status)
         content = response_spec.get("content", {})
         json_content = content.get("application/json", {})
         schema = json_content.get("schema", {})
+        validator = self.index.validator(("response", template, method.lower(), str(status_code)), schema)
         
-        if not schema:
+        if validator is None:
             return True  # No schema to validate
         
-        # Resolve schema references
-        schema = self._resolve_schema_refs(schema)
-        
         # Validate
         try:
-            jsonschema.validate(response, schema)
+            validator.validate(response)
             return True
         except jsonschema.ValidationError as e:
             raise AssertionError(f"Response validation failed: {e.message}")
@@ -117,49 +348,25 @@ class ContractValidator:
         if not channel_spec:
             raise ValueError(f"Channel {channel} not found in AsyncAPI spec")
         
-        # Get message schema
+        # Get message schema (resolved and compiled once per channel)
         publish = channel_spec.get("publish", {})
         message_spec = publish.get("message", {})
         payload = message_spec.get("payload", {})
+        validator = self.index.validator(("message", channel), payload)
         
-        if not payload:
+        if validator is None:
             return True  # No schema to validate
         
-        # Resolve schema references
-        payload = self._resolve_schema_refs(payload)
-        
         # Validate
         try:
-            jsonschema.validate(message, payload)
+            validator.validate(message)
             return True
         except jsonschema.ValidationError as e:
             raise AssertionError(f"Message validation failed: {e.message}")
     
     def _resolve_schema_refs(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve $ref references in schema"""
-        if isinstance(schema, dict):
-            if "$ref" in schema:
-                ref_path = schema["$ref"]
-                if ref_path.startswith("#/"):
-                    # Internal reference
-                    parts = ref_path[2:].split("/")
-                    resolved = self.spec
-                    for part in parts:
-                        resolved = resolved.get(part, {})
-                    return self._resolve_schema_refs(resolved)
-                else:
-                    # External reference - not supported yet
-                    return schema
-            else:
-                # Recursively resolve refs in nested objects
-                resolved = {}
-                for key, value in schema.items():
-                    resolved[key] = self._resolve_schema_refs(value)
-                return resolved
-        elif isinstance(schema, list):
-            return [self._resolve_schema_refs(item) for item in schema]
-        else:
-            return schema
+        return self.index.resolve_refs(schema)
     
     @staticmethod
     def _match_path(spec_path: str, actual_path: str) -> bool:
@@ -224,18 +431,11 @@ class ContractValidator:
             raise ImportError("jsonschema required: pip install jsonschema")
         
         # Find path and method in spec
-        paths = self.spec.get("paths", {})
-        path_spec = None
-        
-        for spec_path in paths:
-            if self._match_path(spec_path, path):
-                path_spec = paths[spec_path]
-                break
+        template, path_spec, method_spec = self.index.find_operation(method, path)
         
         if not path_spec:
             raise ValueError(f"Path {path} not found in OpenAPI spec")
         
-        method_spec = path_spec.get(method.lower())
         if not method_spec:
             raise ValueError(f"Method {method} not found for path {path}")
         
@@ -247,16 +447,14 @@ class ContractValidator:
         content = request_body_spec.get("content", {})
         json_content = content.get("application/json", {})
         schema = json_content.get("schema", {})
+        validator = self.index.validator(("request", template, method.lower()), schema)
         
-        if not schema:
+        if validator is None:
             return True  # No schema to validate
         
-        # Resolve schema references
-        schema = self._resolve_schema_refs(schema)
-        
         # Validate
         try:
-            jsonschema.validate(request_body, schema)
+            validator.validate(request_body)
             return True
         except jsonschema.ValidationError as e:
             raise AssertionError(f"Request body validation failed: {e.message}")
@@ -275,18 +473,11 @@ class ContractValidator:
             True if valid
         """
         # Find path and method in spec
-        paths = self.spec.get("paths", {})
-        path_spec = None
-        
-        for spec_path in paths:
-            if self._match_path(spec_path, path):
-                path_spec = paths[spec_path]
-                break
+        template, path_spec, method_spec = self.index.find_operation(method, path)
         
         if not path_spec:
             return True  # Path not in spec, skip validation
         
-        method_spec = path_spec.get(method.lower())
         if not method_spec:
             return True  # Method not in spec, skip validation
         
@@ -299,9 +490,10 @@ class ContractValidator:
         
         # Check required headers
         headers_spec = response_spec.get("headers", {})
+        present = {h.lower() for h in headers.keys()}
         for header_name, header_spec in headers_spec.items():
             required = header_spec.get("required", False)
-            if required and header_name.lower() not in [h.lower() for h in headers.keys()]:
+            if required and header_name.lower() not in present:
                 raise AssertionError(f"Required header '{header_name}' is missing")
         
         return True
@@ -317,24 +509,22 @@ class ContractValidator:
         Returns:
             Operation information
         """
-        paths = self.spec.get("paths", {})
-        
-        for spec_path in paths:
-            if self._match_path(spec_path, path):
-                path_spec = paths[spec_path]
-                method_spec = path_spec.get(method.lower(), {})
-                return {
-                    "operationId": method_spec.get("operationId"),
-                    "summary": method_spec.get("summary"),
-                    "description": method_spec.get("description"),
-                    "tags": method_spec.get("tags", []),
-                    "parameters": method_spec.get("parameters", []),
-                    "requestBody": method_spec.get("requestBody"),
-                    "responses": method_spec.get("responses", {}),
-                    "security": method_spec.get("security", [])
-                }
-        
-        return {}
+        template, path_spec, method_spec = self.index.find_operation(method, path)
+        
+        if path_spec is None:
+            return {}
+        
+        method_spec = method_spec or {}
+        return {
+            "operationId": method_spec.get("operationId"),
+            "summary": method_spec.get("summary"),
+            "description": method_spec.get("description"),
+            "tags": method_spec.get("tags", []),
+            "parameters": method_spec.get("parameters", []),
+            "requestBody": method_spec.get("requestBody"),
+            "responses": method_spec.get("responses", {}),
+            "security": method_spec.get("security", [])
+        }
 
 
 class DataTypeValidator:
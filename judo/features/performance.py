@@ -103,9 +103,25 @@ class PerformanceMetrics:
 class PerformanceMonitor:
     """Monitor and track API performance"""
     
-    def __init__(self):
+    def __init__(self, pool_stats=None):
+        """
+        Initialize monitor
+        
+        Args:
+            pool_stats: Optional PoolStats of an HttpClient to include
+                connection pool hits/misses in the metrics
+        """
         self.metrics = PerformanceMetrics()
         self.alerts: List["PerformanceAlert"] = []
+        self.pool_stats = None
+        self._pool_baseline: Dict = {}
+        if pool_stats is not None:
+            self.attach_connection_pool(pool_stats)
+    
+    def attach_connection_pool(self, pool_stats):
+        """Track connection pool counters from now on"""
+        self.pool_stats = pool_stats
+        self._pool_baseline = pool_stats.snapshot()
     
     def record_request(self, elapsed_ms: float, status_code: int, error: Optional[str] = None):
         """Record a request"""
@@ -130,11 +146,16 @@ class PerformanceMonitor:
     def get_metrics(self) -> Dict:
         """Get current metrics"""
         self.metrics.end_time = datetime.now()
-        return self.metrics.to_dict()
+        metrics = self.metrics.to_dict()
+        if self.pool_stats is not None:
+            metrics["connection_pool"] = self.pool_stats.since(self._pool_baseline)
+        return metrics
     
     def reset(self):
         """Reset metrics"""
         self.metrics = PerformanceMetrics()
+        if self.pool_stats is not None:
+            self._pool_baseline = self.pool_stats.snapshot()
 
 
 class PerformanceAlert:
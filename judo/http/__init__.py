@@ -3,5 +3,7 @@ HTTP module - HTTP client and related utilities
 """
 
 from .client import HttpClient
+from .async_client import AsyncHttpClient
+from .pool import HttpPoolConfig, PoolStats, close_shared_adapters
 
-__all__ = ['HttpClient']
\ No newline at end of file
+__all__ = ['HttpClient', 'AsyncHttpClient', 'HttpPoolConfig', 'PoolStats', 'close_shared_adapters']
\ No newline at end of file
@@ -0,0 +1,336 @@
+"""
+Async HTTP Client - asyncio engine for high fan-out request workloads
+"""
+
+import asyncio
+import os
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from http.client import HTTPMessage
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+from requests.cookies import cookiejar_from_dict, extract_cookies_to_jar, get_cookie_header
+from requests.structures import CaseInsensitiveDict
+
+from ..core.response import JudoResponse
+
+
+# A request for gather(): (method, url) / (method, url, kwargs) or a dict
+# with "method", "url" and any requests-style keyword arguments
+RequestSpec = Union[Tuple, Dict[str, Any]]
+
+
+class _SetCookieSource:
+    """The shape requests' extract_cookies_to_jar reads Set-Cookie headers from"""
+
+    def __init__(self, resp):
+        self._original_response = self
+        self.msg = HTTPMessage()
+        for value in resp.headers.getall('Set-Cookie', ()):
+            self.msg['Set-Cookie'] = value
+
+
+def _ssl_option(verify) -> Any:
+    """requests-style verify (bool or CA bundle path) as aiohttp's ssl argument"""
+    if verify is False:
+        return False
+    if isinstance(verify, str):
+        if os.path.isdir(verify):
+            return ssl.create_default_context(capath=verify)
+        return ssl.create_default_context(cafile=verify)
+    return None
+
+
+def _aiohttp_available() -> bool:
+    try:
+        import aiohttp  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class AsyncHttpClient:
+    """
+    asyncio HTTP client with the same surface as HttpClient
+
+    Shares defaults (headers, params, cookies, auth, timeout, SSL, proxy)
+    with the sync client of the Judo instance and returns JudoResponse
+    objects. Concurrency is bounded by a semaphore, so hundreds of calls
+    can be fanned out from a single thread.
+    Cookies are read from and written back to the sync session, so a login
+    done by either client is seen by the other. A client is bound to the
+    event loop it is first used on until close().
+
+    Engines:
+        - "aiohttp": native asyncio I/O (pip install judo-framework[async])
+        - "threads": the requests session on a bounded thread pool,
+          used automatically when aiohttp is not installed
+
+    Example:
+        async with judo.async_http(max_concurrency=50) as client:
+            responses = await client.gather([("GET", f"/users/{i}") for i in range(200)])
+    """
+
+    def __init__(self, judo_instance, max_concurrency: int = 100, engine: str = None):
+        """
+        Initialize async client
+
+        Args:
+            judo_instance: Judo instance (its HttpClient provides the defaults)
+            max_concurrency: Maximum number of requests in flight
+            engine: "aiohttp" or "threads" (default: aiohttp if installed)
+        """
+        self.judo = judo_instance
+        self.http_client = judo_instance.http_client
+        self.max_concurrency = max(1, int(max_concurrency))
+
+        if engine is None:
+            engine = "aiohttp" if _aiohttp_available() else "threads"
+        if engine == "aiohttp" and not _aiohttp_available():
+            raise ImportError("aiohttp required for the aiohttp engine: pip install aiohttp")
+        if engine not in ("aiohttp", "threads"):
+            raise ValueError(f"Unknown async HTTP engine: {engine}")
+        self.engine = engine
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        await self.close()
+
+    def _bind_loop(self):
+        """Create loop-bound resources for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._session is not None:
+                # The aiohttp session belongs to the other loop and cannot be closed from here
+                raise RuntimeError("AsyncHttpClient is in use on another event loop; "
+                                   "await close() there first or create a new client")
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def request(self, method: str, url: str, **kwargs) -> JudoResponse:
+        """HTTP request with any method"""
+        self._bind_loop()
+        method = method.upper()
+        if method == 'HEAD':
+            kwargs.setdefault('allow_redirects', False)
+
+        full_url, kwargs = self.http_client._prepare_call(method, url, kwargs)
+
+        async with self._semaphore:
+            if self.engine == "aiohttp":
+                response = await self._send_aiohttp(method, full_url, kwargs)
+            else:
+                response = await self._send_threaded(method, full_url, kwargs)
+
+        return self.http_client._build_response(response)
+
+    async def get(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP GET request"""
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP POST request"""
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP PUT request"""
+        return await self.request('PUT', url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP PATCH request"""
+        return await self.request('PATCH', url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP DELETE request"""
+        return await self.request('DELETE', url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP HEAD request"""
+        return await self.request('HEAD', url, **kwargs)
+
+    async def options(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP OPTIONS request"""
+        return await self.request('OPTIONS', url, **kwargs)
+
+    async def gather(self, requests_specs: Iterable[RequestSpec],
+                     return_exceptions: bool = False) -> List[Union[JudoResponse, BaseException]]:
+        """
+        Send many requests concurrently (bounded by max_concurrency)
+
+        Args:
+            requests_specs: (method, url[, kwargs]) tuples or dicts with method/url/kwargs
+            return_exceptions: Return failures in place instead of raising the first one
+
+        Returns:
+            Responses in the same order as the requests
+        """
+        coroutines = [self.request(method, url, **kwargs)
+                      for method, url, kwargs in map(self._normalize_spec, requests_specs)]
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    def run_many(self, requests_specs: Iterable[RequestSpec],
+                 return_exceptions: bool = False) -> List[Union[JudoResponse, BaseException]]:
+        """
+        Sync entry point for gather(): runs its own event loop
+
+        Useful from behave steps and other sync code. Must not be called
+        from inside a running event loop (use `await gather(...)` there).
+        """
+        async def _run():
+            try:
+                return await self.gather(requests_specs, return_exceptions)
+            finally:
+                await self.close()
+
+        return asyncio.run(_run())
+
+    async def close(self) -> None:
+        """Close the aiohttp session and the thread pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._loop = None
+
+    @staticmethod
+    def _normalize_spec(spec: RequestSpec) -> Tuple[str, str, Dict[str, Any]]:
+        if isinstance(spec, dict):
+            kwargs = dict(spec)
+            method = kwargs.pop('method', 'GET')
+            url = kwargs.pop('url')
+            kwargs.update(kwargs.pop('kwargs', {}) or {})
+            return method, url, kwargs
+        if len(spec) == 2:
+            return spec[0], spec[1], {}
+        return spec[0], spec[1], dict(spec[2] or {})
+
+    # ==================== Threads engine ====================
+
+    async def _send_threaded(self, method: str, url: str, kwargs: Dict) -> requests.Response:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix="judo-async-http")
+        call = partial(self.http_client.session.request, method, url, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    # ==================== aiohttp engine ====================
+
+    def _get_session(self):
+        if self._session is None:
+            import aiohttp
+            session = self.http_client.session
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=_ssl_option(session.verify)
+            )
+            # Cookies live in the requests session (see _send_aiohttp), shared with the sync client
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                headers=dict(session.headers),
+                auth=self._to_basic_auth(session.auth)
+            )
+        return self._session
+
+    @staticmethod
+    def _to_basic_auth(auth):
+        """Translate requests-style auth (HTTPBasicAuth or tuple) to aiohttp"""
+        if auth is None:
+            return None
+        import aiohttp
+        if isinstance(auth, tuple):
+            return aiohttp.BasicAuth(*auth)
+        if hasattr(auth, 'username') and hasattr(auth, 'password'):
+            return aiohttp.BasicAuth(auth.username, auth.password)
+        raise ValueError(f"Unsupported auth for the aiohttp engine: {type(auth).__name__}")
+
+    def _to_aiohttp_kwargs(self, url: str, kwargs: Dict) -> Dict:
+        """Translate requests keyword arguments to aiohttp ones"""
+        import aiohttp
+
+        options: Dict[str, Any] = {}
+        for key in ('headers', 'params', 'cookies', 'json', 'data', 'allow_redirects'):
+            if key in kwargs:
+                options[key] = kwargs[key]
+
+        if kwargs.get('params'):
+            # aiohttp only accepts str/int/float query values
+            options['params'] = {k: (str(v).lower() if isinstance(v, bool) else v)
+                                 for k, v in kwargs['params'].items()}
+
+        if 'files' in kwargs:
+            form = aiohttp.FormData()
+            for name, value in (kwargs.get('data') or {}).items():
+                form.add_field(name, str(value))
+            for name, value in kwargs['files'].items():
+                if isinstance(value, tuple):
+                    form.add_field(name, value[1], filename=value[0])
+                else:
+                    form.add_field(name, value)
+            options['data'] = form
+
+        timeout = kwargs.get('timeout')
+        if timeout is not None:
+            total = sum(timeout) if isinstance(timeout, tuple) else timeout
+            options['timeout'] = aiohttp.ClientTimeout(total=total)
+
+        if 'auth' in kwargs:
+            options['auth'] = self._to_basic_auth(kwargs['auth'])
+
+        if 'verify' in kwargs and kwargs['verify'] is not True:
+            options['ssl'] = _ssl_option(kwargs['verify'])
+
+        proxies = kwargs.get('proxies') or self.http_client.session.proxies
+        if proxies:
+            scheme = 'https' if url.startswith('https') else 'http'
+            options['proxy'] = proxies.get(scheme) or proxies.get('http')
+
+        return options
+
+    async def _send_aiohttp(self, method: str, url: str, kwargs: Dict) -> requests.Response:
+        session = self._get_session()
+        options = self._to_aiohttp_kwargs(url, kwargs)
+
+        # Send the session cookies (e.g. from a login step) and keep what the server sets
+        jar = self.http_client.session.cookies
+        prepared = requests.Request(method, url).prepare()
+        cookie_header = get_cookie_header(jar, prepared)
+        if cookie_header:
+            options['headers'] = dict(options.get('headers') or {}, Cookie=cookie_header)
+
+        start = time.perf_counter()
+        async with session.request(method, url, **options) as resp:
+            content = await resp.read()
+            elapsed = time.perf_counter() - start
+            for hop in (*resp.history, resp):
+                hop_request = prepared if hop is resp and not resp.history else \
+                    requests.Request(method, str(hop.url)).prepare()
+                extract_cookies_to_jar(jar, hop_request, _SetCookieSource(hop))
+            return self._to_requests_response(resp, content, elapsed)
+
+    @staticmethod
+    def _to_requests_response(resp, content: bytes, elapsed: float) -> requests.Response:
+        """Build a requests.Response so JudoResponse works unchanged"""
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response._content = content
+        response.url = str(resp.url)
+        response.encoding = resp.charset
+        response.elapsed = timedelta(seconds=elapsed)
+        response.cookies = cookiejar_from_dict({name: morsel.value for name, morsel in resp.cookies.items()})
+        return response
@@ -4,9 +4,12 @@ HTTP Client - Advanced HTTP client with Karate-like features
 
 import requests
 from requests.auth import HTTPBasicAuth
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import replace
 from urllib.parse import urljoin
 from ..core.response import JudoResponse
+from ..core.streaming import StreamingJudoResponse
+from .pool import HttpPoolConfig, PoolStats, build_adapter, get_shared_adapter
 
 
 class HttpClient:
@@ -23,6 +26,68 @@ class HttpClient:
         self.form_fields = {}
         self.multipart_fields = {}
         
+        # Connection pool sized from Judo config / JUDO_HTTP_* env vars
+        self.pool_config = HttpPoolConfig.from_config(getattr(judo_instance, 'config', None))
+        self.pool_stats = PoolStats()
+        self.shared_pool = False
+        self._mount_pool()
+        
+    def _mount_pool(self) -> None:
+        """Mount the pooled adapter for http and https"""
+        # Close this client's own adapters; a shared one belongs to the process
+        for previous in set(self.session.adapters.values()):
+            if not getattr(previous, 'shared', False):
+                previous.close()
+        if self.shared_pool:
+            adapter = get_shared_adapter(self.pool_config)
+            self.pool_stats = adapter.stats
+        else:
+            adapter = build_adapter(self.pool_config, self.pool_stats)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def use_shared_pool(self, enabled: bool = True) -> None:
+        """
+        Send requests through the process-wide connection pool
+        
+        Connections to the same hosts are reused across HttpClient instances
+        (e.g. one per scenario); headers, cookies and auth stay per client.
+        """
+        if enabled == self.shared_pool:
+            return
+        self.shared_pool = enabled
+        if not enabled:
+            self.pool_stats = PoolStats()
+        self._mount_pool()
+    
+    def configure_pool(self, **settings) -> None:
+        """
+        Change connection pool settings (see HttpPoolConfig)
+        
+        Example:
+            client.configure_pool(pool_maxsize=50, pool_block=True)
+        """
+        for name, value in settings.items():
+            if not hasattr(self.pool_config, name):
+                raise ValueError(f"Unknown pool setting: {name}")
+        # Copy so a shared pool's settings are never changed in place
+        self.pool_config = replace(self.pool_config, **settings)
+        self._mount_pool()
+    
+    def use_http2(self, enabled: bool = True) -> None:
+        """
+        Send requests over HTTP/2 (pip install judo-framework[http2])
+        
+        Concurrent requests to one origin are multiplexed on a single
+        connection; origins without h2 support fall back to HTTP/1.1.
+        """
+        self.configure_pool(http2=enabled)
+    
+    def reset_session_state(self) -> None:
+        """Drop cookies and auth kept on the session (connections stay open)"""
+        self.session.cookies.clear()
+        self.session.auth = None
+    
     def _build_url(self, url: str) -> str:
         """Build complete URL"""
         if url.startswith(('http://', 'https://')):
@@ -52,50 +117,28 @@ class HttpClient:
             
         return kwargs
     
-    def get(self, url: str, **kwargs) -> JudoResponse:
-        """HTTP GET request"""
-        full_url = self._build_url(url)
-        kwargs = self._prepare_request_kwargs(**kwargs)
-        
-        # Log request to reporter
-        if self.judo.reporter:
-            self.judo.reporter.log_request(
-                method="GET",
-                url=full_url,
-                headers=kwargs.get('headers', {}),
-                params=kwargs.get('params', {}),
-                body=None
-            )
-        
-        response = self.session.get(full_url, **kwargs)
-        judo_response = JudoResponse(response)
-        
-        # Log response to reporter
-        if self.judo.reporter:
-            self.judo.reporter.log_response(
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                body=judo_response.json if judo_response.is_json() else response.text,
-                body_type="json" if judo_response.is_json() else "text",
-                elapsed_time=response.elapsed.total_seconds()
-            )
-        
-        return judo_response
-    
-    def post(self, url: str, **kwargs) -> JudoResponse:
-        """HTTP POST request"""
+    def _prepare_call(self, method: str, url: str, kwargs: Dict) -> Tuple[str, Dict]:
+        """
+        Prepare a request: build URL, merge defaults, attach pending form or
+        multipart fields and log the request to the reporter.
+        Shared by the sync client and AsyncHttpClient.
+        """
         full_url = self._build_url(url)
         kwargs = self._prepare_request_kwargs(**kwargs)
         
-        # Handle form data
-        if self.form_fields:
-            kwargs['data'] = self.form_fields
-            self.form_fields.clear()
+        if method in ('POST', 'PUT', 'PATCH'):
+            # Handle form data
+            if self.form_fields:
+                kwargs['data'] = dict(self.form_fields)
+                self.form_fields.clear()
+            
+            # Handle multipart data
+            if self.multipart_fields:
+                kwargs['files'] = dict(self.multipart_fields)
+                self.multipart_fields.clear()
         
-        # Handle multipart data
-        if self.multipart_fields:
-            kwargs['files'] = self.multipart_fields
-            self.multipart_fields.clear()
+        if 'timeout' not in kwargs and getattr(self.session, 'timeout', None):
+            kwargs['timeout'] = self.session.timeout
         
         # Determine body and body type for logging
         body = None
@@ -113,7 +156,7 @@ class HttpClient:
         # Log request to reporter
         if self.judo.reporter:
             self.judo.reporter.log_request(
-                method="POST",
+                method=method,
                 url=full_url,
                 headers=kwargs.get('headers', {}),
                 params=kwargs.get('params', {}),
@@ -121,7 +164,10 @@ class HttpClient:
                 body_type=body_type
             )
         
-        response = self.session.post(full_url, **kwargs)
+        return full_url, kwargs
+    
+    def _build_response(self, response) -> JudoResponse:
+        """Wrap a requests.Response and log it to the reporter"""
         judo_response = JudoResponse(response)
         
         # Log response to reporter
@@ -129,47 +175,79 @@ class HttpClient:
             self.judo.reporter.log_response(
                 status_code=response.status_code,
                 headers=dict(response.headers),
-                body=judo_response.json if judo_response.is_json() else response.text,
+                body=judo_response.json if judo_response.is_json() else judo_response.text,
                 body_type="json" if judo_response.is_json() else "text",
-                elapsed_time=response.elapsed.total_seconds()
+                elapsed_time=response.elapsed.total_seconds(),
+                transport=judo_response.transport
             )
         
         return judo_response
     
+    def request(self, method: str, url: str, **kwargs) -> JudoResponse:
+        """HTTP request with any method"""
+        method = method.upper()
+        if method == 'HEAD':
+            kwargs.setdefault('allow_redirects', False)
+        full_url, kwargs = self._prepare_call(method, url, kwargs)
+        response = self.session.request(method, full_url, **kwargs)
+        return self._build_response(response)
+    
+    def stream(self, method: str, url: str, spool: bool = False, chunk_size: int = 64 * 1024,
+               hash_algorithms: Tuple[str, ...] = ('sha256',), **kwargs) -> StreamingJudoResponse:
+        """
+        HTTP request whose body is read incrementally (bounded memory)
+        
+        Args:
+            spool: Also keep the body in a spooled temp file so it can be re-read
+            chunk_size: Bytes per network read
+            hash_algorithms: hashlib digests computed while the body is read
+        """
+        method = method.upper()
+        full_url, kwargs = self._prepare_call(method, url, kwargs)
+        kwargs['stream'] = True
+        response = self.session.request(method, full_url, **kwargs)
+        
+        # The body is not read here; the report only gets status and headers
+        if self.judo.reporter:
+            self.judo.reporter.log_response(
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                body=None,
+                body_type="stream",
+                elapsed_time=response.elapsed.total_seconds(),
+                transport=getattr(response, 'judo_transport', None)
+            )
+        
+        return StreamingJudoResponse(response, spool=spool, chunk_size=chunk_size,
+                                     hash_algorithms=hash_algorithms)
+    
+    def get(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP GET request"""
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> JudoResponse:
+        """HTTP POST request"""
+        return self.request('POST', url, **kwargs)
+    
     def put(self, url: str, **kwargs) -> JudoResponse:
         """HTTP PUT request"""
-        full_url = self._build_url(url)
-        kwargs = self._prepare_request_kwargs(**kwargs)
-        response = self.session.put(full_url, **kwargs)
-        return JudoResponse(response)
+        return self.request('PUT', url, **kwargs)
     
     def patch(self, url: str, **kwargs) -> JudoResponse:
         """HTTP PATCH request"""
-        full_url = self._build_url(url)
-        kwargs = self._prepare_request_kwargs(**kwargs)
-        response = self.session.patch(full_url, **kwargs)
-        return JudoResponse(response)
+        return self.request('PATCH', url, **kwargs)
     
     def delete(self, url: str, **kwargs) -> JudoResponse:
         """HTTP DELETE request"""
-        full_url = self._build_url(url)
-        kwargs = self._prepare_request_kwargs(**kwargs)
-        response = self.session.delete(full_url, **kwargs)
-        return JudoResponse(response)
+        return self.request('DELETE', url, **kwargs)
     
     def head(self, url: str, **kwargs) -> JudoResponse:
         """HTTP HEAD request"""
-        full_url = self._build_url(url)
-        kwargs = self._prepare_request_kwargs(**kwargs)
-        response = self.session.head(full_url, **kwargs)
-        return JudoResponse(response)
+        return self.request('HEAD', url, **kwargs)
     
     def options(self, url: str, **kwargs) -> JudoResponse:
         """HTTP OPTIONS request"""
-        full_url = self._build_url(url)
-        kwargs = self._prepare_request_kwargs(**kwargs)
-        response = self.session.options(full_url, **kwargs)
-        return JudoResponse(response)
+        return self.request('OPTIONS', url, **kwargs)
     
     # Configuration methods
     
@@ -0,0 +1,237 @@
+"""
+HTTP/2 Transport - requests adapter backed by httpx with HTTP/2 multiplexing
+"""
+
+import threading
+import weakref
+from http.client import HTTPMessage
+from typing import Any, Dict, Iterator, Tuple
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .pool import HttpPoolConfig, PoolStats
+
+
+def http2_available() -> bool:
+    try:
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _RawResponse:
+    """
+    Minimal stand-in for urllib3's response
+
+    requests reads cookies from it and, with stream=True, the body through
+    stream()/read(), which pull from the still open httpx response.
+    """
+
+    def __init__(self, response):
+        self._original_response = self
+        self._response = response
+        self._buffer = b''
+        self._chunks = None
+        self.msg = HTTPMessage()
+        for name, value in response.headers.multi_items():
+            self.msg[name] = value
+
+    def _body_chunks(self, amt: int, decode_content: bool) -> Iterator[bytes]:
+        # One iterator for the whole body, shared by every stream()/read() call
+        if self._chunks is None:
+            chunks = self._response.iter_bytes(amt) if decode_content else self._response.iter_raw(amt)
+            self._chunks = self._translate_errors(chunks)
+        return self._chunks
+
+    def _translate_errors(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        import httpx
+
+        try:
+            yield from chunks
+        except httpx.DecodingError as e:
+            self._response.close()
+            raise requests.exceptions.ContentDecodingError(e)
+        except httpx.TimeoutException as e:
+            self._response.close()
+            raise requests.exceptions.ConnectionError(e)
+        except httpx.TransportError as e:
+            self._response.close()
+            raise requests.exceptions.ChunkedEncodingError(e)
+        self._response.close()
+
+    def stream(self, amt: int = 65536, decode_content: bool = True) -> Iterator[bytes]:
+        """Body chunks as they arrive (used by requests' iter_content)"""
+        if self._buffer:
+            buffered, self._buffer = self._buffer, b''
+            yield buffered
+        # A plain loop, not `yield from`: stopping this generator early must
+        # not close the shared iterator
+        for chunk in self._body_chunks(amt, decode_content):
+            yield chunk
+
+    def read(self, amt: int = None, decode_content: bool = True) -> bytes:
+        chunks = self._body_chunks(65536, decode_content)
+        data = self._buffer
+        while amt is None or len(data) < amt:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            data += chunk
+        if amt is None:
+            self._buffer = b''
+            return data
+        self._buffer = data[amt:]
+        return data[:amt]
+
+    def close(self):
+        self._response.close()
+
+
+class JudoHTTP2Adapter(BaseAdapter):
+    """
+    requests adapter sending requests through an httpx client with HTTP/2
+
+    Mounted on a requests.Session it keeps the session's cookies, auth,
+    redirects and hooks working, while concurrent requests to one origin
+    are multiplexed as streams over a single TLS connection. Servers that
+    do not negotiate h2 via ALPN (and plain http:// URLs) fall back to
+    HTTP/1.1 keep-alive.
+
+    Requires: pip install judo-framework[http2]
+    """
+
+    shared = False
+
+    def __init__(self, pool_config: HttpPoolConfig = None, stats: PoolStats = None):
+        if not http2_available():
+            raise ImportError("httpx[http2] required for HTTP/2: pip install judo-framework[http2]")
+        super().__init__()
+        self.pool_config = pool_config or HttpPoolConfig()
+        self.stats = stats or PoolStats()
+        # One httpx client per (verify, cert, proxy) since httpx fixes them per client
+        self._clients: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        # HTTP/1.1 connections seen so far (weak: forgotten once httpcore drops them)
+        self._seen_streams = weakref.WeakSet()
+
+    def _get_client(self, verify, cert, proxy):
+        import httpx
+
+        key = (verify if isinstance(verify, (bool, str)) else True, cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                config = self.pool_config
+                limits = httpx.Limits(
+                    max_connections=config.max_connections or None,
+                    max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0
+                )
+                transport = httpx.HTTPTransport(
+                    http2=True, verify=key[0], cert=cert, limits=limits,
+                    retries=config.max_retries, proxy=proxy
+                )
+                client = httpx.Client(transport=transport, follow_redirects=False, timeout=None)
+                self._clients[key] = client
+            return client
+
+    @staticmethod
+    def _to_timeout(timeout):
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        import httpx
+
+        proxy = None
+        if proxies:
+            scheme = 'https' if request.url.startswith('https') else 'http'
+            proxy = proxies.get(scheme) or proxies.get('all')
+
+        client = self._get_client(verify, cert, proxy)
+        outgoing = client.build_request(
+            request.method, request.url,
+            headers=dict(request.headers),
+            content=request.body,
+            timeout=self._to_timeout(timeout)
+        )
+
+        try:
+            response = client.send(outgoing, stream=stream)
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        return self.build_response(request, response, stream)
+
+    def _connection_reused(self, extensions: Dict) -> bool:
+        """HTTP/2 streams after the first (id 1) ride on an open connection"""
+        stream_id = extensions.get("stream_id")
+        if stream_id is not None:
+            return stream_id > 1
+        network_stream = extensions.get("network_stream")
+        if network_stream is None:
+            return False
+        with self._lock:
+            try:
+                reused = network_stream in self._seen_streams
+                self._seen_streams.add(network_stream)
+            except TypeError:
+                # Not weak-referenceable: reuse cannot be told
+                return False
+        return reused
+
+    def build_response(self, request, response, stream: bool = False) -> requests.Response:
+        """
+        Convert an httpx response into a requests.Response
+
+        With stream=True the body is left on the connection and read on
+        demand through response.raw (iter_content, HttpClient.stream()).
+        """
+        extensions = response.extensions
+        reused = self._connection_reused(extensions)
+        self.stats.increment("requests")
+        self.stats.increment("hits" if reused else "misses")
+        if not reused:
+            self.stats.increment("new_connections")
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers.multi_items())
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.url = request.url
+        result.request = request
+        result.connection = self
+        result.raw = _RawResponse(response)
+        extract_cookies_to_jar(result.cookies, request, result.raw)
+        if not stream:
+            result._content = response.read()
+            result._content_consumed = True
+            response.close()
+
+        result.judo_transport = {
+            "http_version": response.http_version,
+            "connection_reused": reused,
+            "stream_id": extensions.get("stream_id")
+        }
+        return result
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
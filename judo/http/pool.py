@@ -0,0 +1,229 @@
+"""
+Connection Pool - Configurable pooling and keep-alive for HttpClient
+"""
+
+import os
+import socket
+import threading
+import warnings
+from dataclasses import astuple, dataclass
+from typing import Any, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('true', '1', 'yes', 'on')
+
+
+@dataclass
+class HttpPoolConfig:
+    """
+    Connection pool settings
+
+    Each field can be set in the "http_pool" section of the Judo config
+    (same key) or through a JUDO_HTTP_* environment variable; the config
+    wins over env. A malformed value is ignored with a warning.
+
+    Example:
+        Judo(config={"http_pool": {"pool_maxsize": 50, "http2": True}})
+    """
+    pool_connections: int = 10       # Number of host pools kept (JUDO_HTTP_POOL_CONNECTIONS)
+    pool_maxsize: int = 10           # Connections kept per host (JUDO_HTTP_POOL_MAXSIZE)
+    pool_block: bool = False         # Wait for a free connection instead of opening extra ones (JUDO_HTTP_POOL_BLOCK)
+    max_connections: int = 0         # Max requests in flight across all hosts, 0 = unlimited (JUDO_HTTP_MAX_CONNECTIONS)
+    max_retries: int = 0             # Transport-level retries on connection errors (JUDO_HTTP_MAX_RETRIES)
+    keep_alive: bool = True          # Reuse connections (HTTP keep-alive) (JUDO_HTTP_KEEP_ALIVE)
+    tcp_keepalive_idle: int = 0      # Seconds before TCP keepalive probes, 0 = OS default (JUDO_HTTP_TCP_KEEPALIVE_IDLE)
+    http2: bool = False              # Use the HTTP/2 transport, needs judo-framework[http2] (JUDO_HTTP_HTTP2)
+
+    ENV_PREFIX = "JUDO_HTTP_"
+    CONFIG_SECTION = "http_pool"
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "HttpPoolConfig":
+        """Build settings from the Judo config ("http_pool" section) and JUDO_HTTP_* env vars"""
+        section = (config or {}).get(cls.CONFIG_SECTION) or {}
+        values = {}
+        for name, default in cls.__dataclass_fields__.items():
+            if name in section:
+                raw, source = section[name], f'config["{cls.CONFIG_SECTION}"]["{name}"]'
+            else:
+                raw, source = os.getenv(cls.ENV_PREFIX + name.upper()), cls.ENV_PREFIX + name.upper()
+            if raw is None or raw == "":
+                continue
+            if isinstance(default.default, bool):
+                values[name] = _to_bool(raw)
+                continue
+            try:
+                values[name] = int(raw)
+            except (TypeError, ValueError):
+                warnings.warn(f"Ignoring {source}={raw!r}: not an integer, using {default.default}",
+                              RuntimeWarning, stacklevel=2)
+        return cls(**values)
+
+    def socket_options(self):
+        """Socket options for new connections (TCP keepalive when configured)"""
+        options = list(HTTPConnection.default_socket_options)
+        if self.tcp_keepalive_idle > 0:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.tcp_keepalive_idle))
+            elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, self.tcp_keepalive_idle))
+        return options
+
+
+class PoolStats:
+    """
+    Thread-safe connection pool counters
+
+    - requests: connections taken from the pool to send a request
+    - hits: requests served by an already open connection
+    - misses: requests that needed a new connection
+    - new_connections: connections opened
+    - discarded: connections closed because the pool was full
+    """
+
+    FIELDS = ("requests", "hits", "misses", "new_connections", "discarded")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def increment(self, field: str, amount: int = 1):
+        with self._lock:
+            self._counts[field] += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters plus hit rate (percent)"""
+        with self._lock:
+            data = dict(self._counts)
+        data["hit_rate_percent"] = round(data["hits"] / data["requests"] * 100, 2) if data["requests"] else 0
+        return data
+
+    def since(self, baseline: Dict[str, Any]) -> Dict[str, Any]:
+        """Counters accumulated after a previous snapshot"""
+        current = self.snapshot()
+        data = {field: current[field] - baseline.get(field, 0) for field in self.FIELDS}
+        data["hit_rate_percent"] = round(data["hits"] / data["requests"] * 100, 2) if data["requests"] else 0
+        return data
+
+
+class _InstrumentedPoolMixin:
+    """Count hits, misses and new connections on a urllib3 connection pool"""
+
+    judo_stats: PoolStats = None
+
+    def _new_conn(self):
+        self.judo_stats.increment("new_connections")
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        opened_before = self.num_connections
+        conn = super()._get_conn(timeout=timeout)
+        self.judo_stats.increment("requests")
+        conn.judo_reused = not (self.num_connections > opened_before or getattr(conn, "sock", None) is None)
+        self.judo_stats.increment("hits" if conn.judo_reused else "misses")
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None and self.pool is not None and self.pool.full():
+            self.judo_stats.increment("discarded")
+        return super()._put_conn(conn)
+
+
+class JudoHTTPAdapter(HTTPAdapter):
+    """requests adapter with configurable pool sizing, keep-alive and stats"""
+
+    shared = False
+
+    def __init__(self, pool_config: HttpPoolConfig = None, stats: PoolStats = None):
+        self.pool_config = pool_config or HttpPoolConfig()
+        self.stats = stats or PoolStats()
+        self._limit = (threading.BoundedSemaphore(self.pool_config.max_connections)
+                       if self.pool_config.max_connections > 0 else None)
+        super().__init__(
+            pool_connections=self.pool_config.pool_connections,
+            pool_maxsize=self.pool_config.pool_maxsize,
+            max_retries=self.pool_config.max_retries,
+            pool_block=self.pool_config.pool_block
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", self.pool_config.socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+        stats = self.stats
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("JudoHTTPConnectionPool", (_InstrumentedPoolMixin, HTTPConnectionPool), {"judo_stats": stats}),
+            "https": type("JudoHTTPSConnectionPool", (_InstrumentedPoolMixin, HTTPSConnectionPool), {"judo_stats": stats}),
+        }
+
+    def send(self, request, **kwargs):
+        if not self.pool_config.keep_alive:
+            request.headers["Connection"] = "close"
+        if self._limit is None:
+            return super().send(request, **kwargs)
+        with self._limit:
+            return super().send(request, **kwargs)
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        version = getattr(resp, "version", 11)
+        conn = getattr(resp, "_connection", None) or getattr(resp, "connection", None)
+        response.judo_transport = {
+            "http_version": "HTTP/1.0" if version == 10 else "HTTP/1.1",
+            "connection_reused": getattr(conn, "judo_reused", None),
+            "stream_id": None
+        }
+        return response
+
+
+def build_adapter(pool_config: HttpPoolConfig, stats: PoolStats = None):
+    """Adapter for these settings: HTTP/2 (httpx) or pooled HTTP/1.1 (urllib3)"""
+    if pool_config.http2:
+        from .http2 import JudoHTTP2Adapter
+        return JudoHTTP2Adapter(pool_config, stats)
+    return JudoHTTPAdapter(pool_config, stats)
+
+
+# Process-wide adapters shared by HttpClient instances, keyed by pool settings
+_shared_adapters: Dict[tuple, Any] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_adapter(pool_config: HttpPoolConfig):
+    """
+    Get the process-wide adapter for these pool settings
+
+    Every HttpClient mounting it reuses the same open connections, while
+    cookies, auth and default headers stay on each client's own Session.
+    urllib3 pools are thread-safe, so the adapter can serve parallel
+    scenarios running in threads.
+    """
+    key = astuple(pool_config)
+    with _shared_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            adapter = build_adapter(HttpPoolConfig(*key))
+            adapter.shared = True
+            _shared_adapters[key] = adapter
+        return adapter
+
+
+def close_shared_adapters() -> None:
+    """Close every shared pool (open connections are dropped)"""
+    with _shared_lock:
+        adapters = list(_shared_adapters.values())
+        _shared_adapters.clear()
+    for adapter in adapters:
+        adapter.close()
@@ -0,0 +1,110 @@
+"""
+Mock Server benchmark - Requests/sec under concurrent clients
+
+    python -m judo.mock.benchmark
+
+Compares a single-threaded server closing every connection with the
+threaded server, with and without HTTP/1.1 keep-alive.
+"""
+
+import contextlib
+import http.client
+import io
+import threading
+import time
+from typing import Dict, List
+
+from .server import MockServer
+
+
+def benchmark_throughput(clients: int = 16, requests_per_client: int = 500, threaded: bool = True,
+                         keep_alive: bool = True) -> Dict[str, float]:
+    """
+    Requests/sec of a MockServer under concurrent clients
+
+    Each client is a thread with its own http.client connection (reused
+    across requests when keep_alive is on) sending GETs to a JSON route.
+
+    Returns:
+        {"clients": ..., "requests": ..., "errors": ..., "seconds": ..., "requests_per_sec": ...,
+         "p50_ms": ..., "p99_ms": ...}
+    """
+    server = MockServer(0, threaded=threaded, keep_alive=keep_alive)
+    server.get('/users/*', {'status': 200, 'body': {'id': 1, 'name': 'Judo', 'roles': ['admin', 'user']}})
+    server.start()
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    ready = threading.Barrier(clients + 1)
+
+    def client(number: int) -> None:
+        timings = []
+        failed = 0
+        connection = None
+        ready.wait()
+        for n in range(requests_per_client):
+            start = time.perf_counter()
+            try:
+                if connection is None:
+                    connection = http.client.HTTPConnection('localhost', server.port, timeout=30)
+                connection.request('GET', f'/users/{number}-{n}',
+                                   headers={} if keep_alive else {'Connection': 'close'})
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+                if response.will_close:
+                    connection.close()
+                    connection = None
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                if connection is not None:
+                    connection.close()
+                connection = None
+            timings.append(time.perf_counter() - start)
+        if connection is not None:
+            connection.close()
+        with lock:
+            latencies.extend(timings)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client, args=(number,), daemon=True) for number in range(clients)]
+    try:
+        for thread in threads:
+            thread.start()
+        ready.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    latencies.sort()
+    total = clients * requests_per_client
+    return {
+        "clients": clients,
+        "requests": total,
+        "errors": errors[0],
+        "seconds": round(elapsed, 2),
+        "requests_per_sec": round(total / elapsed),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2)
+    }
+
+
+def main() -> None:
+    """Print requests/sec for each server mode and client count"""
+    for label, threaded, keep_alive in (("single thread, close", False, False),
+                                        ("threaded, close", True, False),
+                                        ("threaded, keep-alive", True, True)):
+        for clients in (1, 16, 64):
+            # start()/stop() print a line each
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = benchmark_throughput(clients, max(50, 4000 // clients), threaded, keep_alive)
+            print(f"{label:<22} {clients:>3} clients: {result['requests_per_sec']:>6} req/s "
+                  f"(p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, {result['errors']} errors)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,38 @@
 """
 Mock Server - Built-in mock server for testing
 Provides Karate-like mock server functionality
+
+Connections are served by one thread each and kept alive (HTTP/1.1), so
+concurrent scenarios and load-style tests are not serialized on a single
+thread or a new TCP connection per request. Run `python -m judo.mock.benchmark`
+to measure requests/sec under concurrent clients.
 """
 
-import json
+import re
+import socket
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import HTTPServer, BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, List, Optional, Callable
 from urllib.parse import urlparse, parse_qs
 
+from ..utils import json_codec
+
 
 class MockHandler(BaseHTTPRequestHandler):
     """HTTP request handler for mock server"""
     
+    # Keep-alive: every response carries Content-Length
+    protocol_version = "HTTP/1.1"
+    # Buffered output: status line, headers and body leave in one send
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    
     def __init__(self, mock_server, *args, **kwargs):
         self.mock_server = mock_server
+        # A single-threaded server must not be held by one idle connection
+        if not (mock_server.keep_alive and mock_server.threaded):
+            self.protocol_version = "HTTP/1.0"
+        self.timeout = mock_server.idle_timeout
         super().__init__(*args, **kwargs)
     
     def do_GET(self):
@@ -32,6 +50,32 @@ class MockHandler(BaseHTTPRequestHandler):
     def do_DELETE(self):
         self._handle_request('DELETE')
     
+    def _read_body(self) -> str:
+        """Read the request body (always, so the next request on the connection starts clean)"""
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b';', 1)[0].strip() or b'0', 16)
+                if size == 0:
+                    # Trailer section ends with an empty line
+                    while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b''.join(chunks).decode('utf-8')
+        content_length = int(self.headers.get('Content-Length', 0))
+        return self.rfile.read(content_length).decode('utf-8') if content_length > 0 else ''
+    
+    def _send(self, status: int, headers: Dict[str, Any], body: bytes) -> None:
+        self.send_response(status)
+        for key, value in headers.items():
+            if key.lower() != 'content-length':
+                self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
     def _handle_request(self, method: str):
         """Handle incoming request"""
         # Parse request
@@ -40,46 +84,81 @@ class MockHandler(BaseHTTPRequestHandler):
         query_params = parse_qs(parsed_url.query)
         
         # Get request body
-        content_length = int(self.headers.get('Content-Length', 0))
-        body = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else ''
+        body = self._read_body()
         
         # Find matching route
         response_data = self.mock_server.find_route(method, path, query_params, body, dict(self.headers))
         
         if response_data:
-            # Send response
-            self.send_response(response_data.get('status', 200))
-            
-            # Send headers
             headers = response_data.get('headers', {})
-            for key, value in headers.items():
-                self.send_header(key, value)
-            self.end_headers()
-            
-            # Send body
             body = response_data.get('body', '')
-            if isinstance(body, dict):
-                body = json.dumps(body)
-            self.wfile.write(body.encode('utf-8'))
+            if isinstance(body, (dict, list)):
+                body = json_codec.dumps(body)
+                if not any(key.lower() == 'content-type' for key in headers):
+                    headers = dict(headers, **{'Content-Type': 'application/json'})
+            if not isinstance(body, bytes):
+                body = str(body).encode('utf-8')
+            self._send(response_data.get('status', 200), headers, body)
         else:
             # Default 404 response
-            self.send_response(404)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': 'Route not found'}).encode('utf-8'))
+            self._send(404, {'Content-Type': 'application/json'},
+                       json_codec.dumps({'error': 'Route not found'}).encode('utf-8'))
     
     def log_message(self, format, *args):
         """Override to suppress default logging"""
         pass
 
 
+class _ThreadingMockHTTPServer(ThreadingHTTPServer):
+    """One thread per connection; open connections are tracked so stop() can close them"""
+    
+    daemon_threads = True
+    request_queue_size = 128
+    
+    def __init__(self, *args, **kwargs):
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+    
+    def process_request(self, request, client_address):
+        with self._connections_lock:
+            self._connections.add(request)
+        super().process_request(request, client_address)
+    
+    def shutdown_request(self, request):
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+    
+    def close_connections(self) -> None:
+        """Close kept-alive connections (their threads would otherwise keep serving)"""
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
 class MockServer:
     """
     Mock server providing Karate-like mocking capabilities
+    
+    Args:
+        port: Port to listen on (0 picks a free port; see get_url())
+        threaded: Serve each connection in its own thread (False: the old
+            single-threaded server, one request at a time)
+        keep_alive: Reuse connections across requests (HTTP/1.1)
+        idle_timeout: Seconds an idle kept-alive connection stays open
     """
     
-    def __init__(self, port: int = 8080):
+    def __init__(self, port: int = 8080, threaded: bool = True, keep_alive: bool = True,
+                 idle_timeout: float = 30.0):
         self.port = port
+        self.threaded = threaded
+        self.keep_alive = keep_alive
+        self.idle_timeout = idle_timeout
         self.routes = []
         self.server = None
         self.server_thread = None
@@ -93,7 +172,9 @@ class MockServer:
         def handler(*args, **kwargs):
             return MockHandler(self, *args, **kwargs)
         
-        self.server = HTTPServer(('localhost', self.port), handler)
+        server_class = _ThreadingMockHTTPServer if self.threaded else HTTPServer
+        self.server = server_class(('localhost', self.port), handler)
+        self.port = self.server.server_address[1]
         self.server_thread = threading.Thread(target=self.server.serve_forever)
         self.server_thread.daemon = True
         self.server_thread.start()
@@ -104,6 +185,8 @@ class MockServer:
         """Stop the mock server"""
         if self.server and self.running:
             self.server.shutdown()
+            if isinstance(self.server, _ThreadingMockHTTPServer):
+                self.server.close_connections()
             self.server.server_close()
             self.running = False
             print("Mock server stopped")
@@ -115,7 +198,9 @@ class MockServer:
             'method': method.upper(),
             'path': path,
             'response': response,
-            'condition': condition
+            'condition': condition,
+            # Wildcard routes are compiled once instead of on every request
+            'pattern': re.compile(f"^{path.replace('*', '.*')}$") if '*' in path else None
         }
         self.routes.append(route)
     
@@ -139,7 +224,10 @@ class MockServer:
                    body: str, headers: Dict) -> Optional[Dict]:
         """Find matching route for request"""
         for route in self.routes:
-            if route['method'] == method and self._path_matches(route['path'], path):
+            if route['method'] != method:
+                continue
+            pattern = route.get('pattern')
+            if route['path'] == path or (pattern is not None and pattern.match(path)):
                 # Check condition if provided
                 if route['condition']:
                     request_data = {
@@ -163,7 +251,6 @@ class MockServer:
         
         # Simple wildcard matching
         if '*' in route_path:
-            import re
             pattern = route_path.replace('*', '.*')
             return bool(re.match(f'^{pattern}$', request_path))
         
@@ -179,4 +266,5 @@ class MockServer:
     
     def is_running(self) -> bool:
         """Check if server is running"""
-        return self.running
\ No newline at end of file
+        return self.running
+
@@ -0,0 +1,234 @@
+"""
+Artifact Writer - Background, batched writing of request/response artifacts
+
+With JUDO_SAVE_REQUESTS_RESPONSES=true every request produces an artifact.
+Writing it on the request path adds several milliseconds per call, so
+artifacts are serialized when submitted (a snapshot: the step may change
+the data afterwards) and written by a background thread in batches (one
+directory creation and one file open per scenario per batch).
+
+Formats (JUDO_ARTIFACT_FORMAT):
+    files     - NN_METHOD_HHMMSS_request.json / _response.json per request (default)
+    ndjson    - one append-only requests_responses.ndjson per scenario
+    ndjson.gz - same, gzip-compressed (each batch is a gzip member)
+"""
+
+import atexit
+import gzip
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..utils import json_codec
+
+
+FORMATS = ("files", "ndjson", "ndjson.gz")
+NDJSON_FILENAME = "requests_responses.ndjson"
+
+# (directory, base filename, serialized request, serialized response)
+Artifact = Tuple[Path, str, str, str]
+
+_STOP = object()
+
+
+class ArtifactWriter:
+    """
+    Queue of artifacts drained by one writer thread
+
+    The queue is bounded (JUDO_ARTIFACT_QUEUE_SIZE, default 1000): when the
+    disk cannot keep up, submit() blocks instead of growing memory. flush()
+    waits until everything queued so far is on disk (called at scenario end).
+    With JUDO_ARTIFACT_ASYNC=false artifacts are written in the caller's thread.
+    """
+
+    def __init__(self, fmt: str = None, queue_size: int = None, batch_size: int = 64,
+                 async_mode: bool = None, log_saved_files: bool = None):
+        if fmt is None:
+            fmt = os.getenv('JUDO_ARTIFACT_FORMAT', 'files')
+        fmt = fmt.lower()
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown artifact format '{fmt}' (expected one of {', '.join(FORMATS)})")
+        if queue_size is None:
+            queue_size = int(os.getenv('JUDO_ARTIFACT_QUEUE_SIZE', '1000'))
+        if async_mode is None:
+            async_mode = os.getenv('JUDO_ARTIFACT_ASYNC', 'true').lower() == 'true'
+        if log_saved_files is None:
+            log_saved_files = os.getenv('JUDO_LOG_SAVED_FILES', 'false').lower() == 'true'
+
+        self.format = fmt
+        self.batch_size = max(1, batch_size)
+        self.async_mode = async_mode
+        self.log_saved_files = log_saved_files
+        self.written = 0
+        self.errors = 0
+        self._created_dirs: Set[Path] = set()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(0, queue_size))
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, directory: Path, base_filename: str,
+               request_data: Dict[str, Any], response_data: Dict[str, Any]) -> None:
+        """Queue one request/response pair, serialized now so later changes to the data are not saved"""
+        # Files are pretty-printed; NDJSON keeps each record on one line
+        indent = 2 if self.format == "files" else None
+        artifact = (Path(directory), base_filename,
+                    json_codec.dumps(request_data, indent=indent, default=str),
+                    json_codec.dumps(response_data, indent=indent, default=str))
+        if self.async_mode:
+            with self._lock:
+                if not self._closed:
+                    if self._thread is None:
+                        self._thread = threading.Thread(target=self._run, name="judo-artifact-writer",
+                                                        daemon=True)
+                        self._thread.start()
+                    # Blocks while the queue is full; the writer thread never takes the lock
+                    self._queue.put(artifact)
+                    return
+        self._write_batch([artifact])
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until every queued artifact is written; False on timeout"""
+        if self._thread is None:
+            return True
+        if timeout is None:
+            self._queue.join()
+            return True
+        done = threading.Event()
+
+        def wait():
+            self._queue.join()
+            done.set()
+        threading.Thread(target=wait, daemon=True).start()
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Flush and stop the writer thread (later submits are written synchronously)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "format": self.format,
+            "async": self.async_mode,
+            "written": self.written,
+            "errors": self.errors,
+            "pending": self._queue.qsize()
+        }
+
+    # ==================== Writer thread ====================
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [] if item is _STOP else [item]
+            stop = item is _STOP
+            # Take whatever else is already queued, up to batch_size
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write_batch(batch)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[Artifact]) -> None:
+        by_directory: Dict[Path, List[Artifact]] = {}
+        for artifact in batch:
+            by_directory.setdefault(artifact[0], []).append(artifact)
+
+        for directory, artifacts in by_directory.items():
+            try:
+                if directory not in self._created_dirs:
+                    directory.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(directory)
+                if self.format == "files":
+                    self._write_files(artifacts)
+                else:
+                    self._write_ndjson(directory, artifacts)
+                self.written += len(artifacts)
+            except Exception as e:
+                # Don't fail the test if logging fails, just log the error
+                self.errors += len(artifacts)
+                print(f"⚠️ Warning: Could not save request/response files: {e}")
+
+    def _write_files(self, artifacts: List[Artifact]) -> None:
+        for directory, base_filename, request_json, response_json in artifacts:
+            request_path = directory / f"{base_filename}_request.json"
+            response_path = directory / f"{base_filename}_response.json"
+            with open(request_path, 'w', encoding='utf-8') as f:
+                f.write(request_json)
+            with open(response_path, 'w', encoding='utf-8') as f:
+                f.write(response_json)
+            if self.log_saved_files:
+                print(f"💾 Saved request: {request_path}")
+                print(f"💾 Saved response: {response_path}")
+                print(f"📁 Files saved in: {directory}")
+
+    def _write_ndjson(self, directory: Path, artifacts: List[Artifact]) -> None:
+        lines = []
+        for _, base_filename, request_json, response_json in artifacts:
+            # Request and response are already JSON: splice them into the record
+            lines.append(f'{{"id": {json_codec.dumps(base_filename)}, "request": {request_json}, '
+                         f'"response": {response_json}}}')
+        payload = ('\n'.join(lines) + '\n').encode('utf-8')
+
+        if self.format == "ndjson.gz":
+            path = directory / f"{NDJSON_FILENAME}.gz"
+            with gzip.open(path, 'ab') as f:
+                f.write(payload)
+        else:
+            path = directory / NDJSON_FILENAME
+            with open(path, 'ab') as f:
+                f.write(payload)
+        if self.log_saved_files:
+            print(f"💾 Saved {len(artifacts)} request/response pair(s) to {path}")
+
+
+_writer: Optional[ArtifactWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_artifact_writer() -> ArtifactWriter:
+    """Process-wide writer (created on first use, flushed at interpreter exit)"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ArtifactWriter()
+                atexit.register(_writer.close)
+    return _writer
+
+
+def flush_artifacts(timeout: float = None) -> bool:
+    """Wait for pending artifacts of the process-wide writer (no-op if unused)"""
+    if _writer is None:
+        return True
+    return _writer.flush(timeout)
+
+
+def close_artifact_writer() -> None:
+    """Flush and stop the process-wide writer; the next use creates a new one"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
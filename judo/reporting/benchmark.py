@@ -0,0 +1,83 @@
+"""
+Report memory benchmark - Memory held by a report of many API steps
+
+    python -m judo.reporting.benchmark
+
+Compares keeping response bodies with truncating and offloading them
+(JUDO_REPORT_BODY_LIMIT / JUDO_REPORT_BODY_MODE).
+"""
+
+import gc
+import tempfile
+import time
+import tracemalloc
+from typing import Dict
+
+from . import body_store
+from .report_data import ReportData, ScenarioStatus, StepStatus
+
+
+def benchmark_memory(steps: int = 100000, steps_per_scenario: int = 20, body_items: int = 20,
+                     body_limit: int = 0, body_mode: str = "offload") -> Dict[str, float]:
+    """
+    Memory held by a report of API steps (request + response with a JSON body each)
+
+    body_limit/body_mode are applied as JUDO_REPORT_BODY_LIMIT/_MODE would be;
+    offloaded bodies go to a temporary directory.
+
+    Returns:
+        {"steps": ..., "total_mb": ..., "bytes_per_step": ..., "seconds": ...}
+    """
+    previous_store = body_store._store
+    with tempfile.TemporaryDirectory() as tmp:
+        body_store._store = body_store.BodyStore(body_limit, body_mode, tmp)
+        try:
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            report = ReportData()
+            feature = scenario = None
+            for n in range(steps):
+                if n % (steps_per_scenario * 50) == 0:
+                    feature = report.add_feature(f"Feature {n // (steps_per_scenario * 50)}")
+                if n % steps_per_scenario == 0:
+                    scenario = feature.add_scenario(f"Scenario {n // steps_per_scenario}", ["smoke"])
+                step = scenario.add_step(f'When I send a GET request to "/users/{n % 7}"')
+                step.add_request("GET", f"https://api.example.com/users/{n}",
+                                 {"Accept": "application/json", "User-Agent": "judo", "X-Trace": str(n)},
+                                 {"page": "1"})
+                step.add_response(200, {"Content-Type": "application/json", "Server": "nginx",
+                                        "Date": "Thu, 01 Jan 2026 00:00:00 GMT", "X-Request-Id": str(n)},
+                                  [{"id": i, "name": f"user-{i}", "email": f"user{i}@example.com", "page": n}
+                                   for i in range(body_items)],
+                                  elapsed_time=0.01)
+                step.add_assertion("status is 200", 200, 200, True)
+                step.finish(StepStatus.PASSED)
+                if n % steps_per_scenario == steps_per_scenario - 1:
+                    scenario.finish(ScenarioStatus.PASSED)
+            report.finish()
+            elapsed = time.perf_counter() - start
+            held = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            body_store._store = previous_store
+    return {
+        "steps": steps,
+        "total_mb": round(held / 1e6, 1),
+        "bytes_per_step": round(held / steps),
+        "seconds": round(elapsed, 2)
+    }
+
+
+def main() -> None:
+    """Print memory per step with bodies kept, truncated and offloaded"""
+    for label, limit, mode in (("bodies kept", 0, "offload"),
+                               ("truncate > 512", 512, "truncate"),
+                               ("offload > 512", 512, "offload")):
+        result = benchmark_memory(body_limit=limit, body_mode=mode)
+        print(f"{label:<16} {result['steps']} steps: {result['total_mb']:>7} MB "
+              f"({result['bytes_per_step']} B/step, {result['seconds']}s)")
+
+
+if __name__ == "__main__":
+    main()
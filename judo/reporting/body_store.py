@@ -0,0 +1,173 @@
+"""
+Body Store - Keeps captured request/response bodies out of report memory
+
+Every step of a run keeps its request and response bodies until the HTML
+report is generated. For long runs the bodies dominate memory, so bodies
+larger than a limit can be truncated or offloaded to disk:
+
+    JUDO_REPORT_BODY_LIMIT  bodies longer than this many characters (as JSON)
+                            are truncated or offloaded (default: 0 = keep all)
+    JUDO_REPORT_BODY_MODE   offload | truncate (default: offload)
+    JUDO_REPORT_BODY_DIR    directory for offloaded bodies
+                            (default: <JUDO_REPORT_OUTPUT_DIR or ./judo_reports>/bodies)
+
+Offloaded bodies are content-addressed (sha1 of the JSON), so identical
+responses are written once. The report keeps a BodyRef that reads the
+body back when the report is generated.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..utils import json_codec
+
+
+MODES = ("offload", "truncate")
+
+
+class BodyRef:
+    """A body written to disk by BodyStore"""
+
+    __slots__ = ('path', 'size')
+
+    def __init__(self, path: Path, size: int):
+        self.path = path
+        self.size = size
+
+    def load(self) -> Any:
+        """Read the body back (a placeholder string if the file is gone)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json_codec.load(f)
+        except (OSError, ValueError) as e:
+            return f"[body not available: {self.path} ({e})]"
+
+    def __repr__(self) -> str:
+        return f"BodyRef({str(self.path)!r}, size={self.size})"
+
+
+class BodyStore:
+    """Applies JUDO_REPORT_BODY_LIMIT / JUDO_REPORT_BODY_MODE to captured bodies"""
+
+    def __init__(self, limit: int = None, mode: str = None, directory: str = None):
+        if limit is None:
+            limit = int(os.getenv('JUDO_REPORT_BODY_LIMIT', '0'))
+        if mode is None:
+            mode = os.getenv('JUDO_REPORT_BODY_MODE', 'offload')
+        mode = mode.lower()
+        if mode not in MODES:
+            raise ValueError(f"Unknown body mode '{mode}' (expected one of {', '.join(MODES)})")
+        if directory is None:
+            directory = os.getenv('JUDO_REPORT_BODY_DIR')
+        if directory is None:
+            output_dir = os.getenv('JUDO_REPORT_OUTPUT_DIR') or os.path.join(os.getcwd(), "judo_reports")
+            directory = os.path.join(output_dir, "bodies")
+
+        self.limit = max(0, limit)
+        self.mode = mode
+        self.directory = Path(directory)
+        self.kept = 0
+        self.truncated = 0
+        self.offloaded = 0
+        self.deduplicated = 0
+        self._created_dir = False
+        self._lock = threading.Lock()
+
+    def store(self, body: Any) -> Any:
+        """Value to keep in the report for a body: itself, a truncated string or a BodyRef"""
+        if not self.limit or body is None or isinstance(body, (bool, int, float, BodyRef)):
+            return body
+        if isinstance(body, str):
+            if len(body) <= self.limit:
+                self.kept += 1
+                return body
+            text = None
+        else:
+            try:
+                text = json_codec.dumps(body, default=str)
+            except (TypeError, ValueError):
+                return body
+            if len(text) <= self.limit:
+                self.kept += 1
+                return body
+
+        if self.mode == "truncate":
+            text = body if text is None else text
+            self.truncated += 1
+            return f"{text[:self.limit]}... [truncated, {len(text)} chars]"
+
+        if text is None:
+            text = json_codec.dumps(body)
+        return self._offload(text, len(body) if isinstance(body, str) else len(text))
+
+    def _offload(self, text: str, size: int) -> Any:
+        data = text.encode('utf-8')
+        path = self.directory / f"{hashlib.sha1(data).hexdigest()}.json"
+        with self._lock:
+            if path.exists():
+                self.deduplicated += 1
+                return BodyRef(path, size)
+            try:
+                if not self._created_dir:
+                    self.directory.mkdir(parents=True, exist_ok=True)
+                    self._created_dir = True
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                # Keep the report going with a truncated copy instead
+                print(f"⚠️ Warning: Could not offload report body to {self.directory}: {e}")
+                self.truncated += 1
+                return f"{text[:self.limit]}... [truncated, {size} chars]"
+            self.offloaded += 1
+        return BodyRef(path, size)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "mode": self.mode,
+            "kept": self.kept,
+            "truncated": self.truncated,
+            "offloaded": self.offloaded,
+            "deduplicated": self.deduplicated
+        }
+
+
+_store: Optional[BodyStore] = None
+
+
+def get_body_store() -> BodyStore:
+    """Process-wide store (created on first use, after any .env has been loaded)"""
+    global _store
+    if _store is None:
+        _store = BodyStore()
+    return _store
+
+
+def store_body(body: Any) -> Any:
+    """Apply the process-wide body limit to a captured body"""
+    if body is None:
+        return None
+    return get_body_store().store(body)
+
+
+def load_body(value: Any) -> Any:
+    """Body value for display (reads offloaded bodies back)"""
+    if value.__class__ is BodyRef:
+        return value.load()
+    return value
+
+
+def body_store_stats() -> Dict[str, Any]:
+    """Counters of the process-wide store"""
+    return get_body_store().stats()
+
+
+def reset_body_store() -> None:
+    """Re-read the JUDO_REPORT_BODY_* settings on next use"""
+    global _store
+    _store = None
@@ -0,0 +1,81 @@
+"""
+Cucumber Exporter - Cucumber JSON from Judo report data
+
+Works with an in-memory ReportData or a SpooledReport; features are
+written one at a time, so exporting a spooled run does not load it whole.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..utils import json_codec
+
+
+_KEYWORD = re.compile(r'^\s*(Given|When|Then|And|But|Dado|Dada|Cuando|Entonces|Y|E|Pero|\*)\s+(.*)$', re.DOTALL)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', (text or "").lower()).strip('-')
+
+
+def _tags(tags) -> List[Dict[str, Any]]:
+    return [{"name": tag if str(tag).startswith('@') else f"@{tag}", "line": 1} for tag in tags or []]
+
+
+def _step(step, line: int) -> Dict[str, Any]:
+    match = _KEYWORD.match(step.step_text or "")
+    keyword, name = (match.group(1) + " ", match.group(2)) if match else ("* ", step.step_text or "")
+    status = step.status.value
+    result: Dict[str, Any] = {
+        "status": "undefined" if status == "pending" else status,
+        # Cucumber JSON durations are nanoseconds
+        "duration": int((step.duration or 0) * 1_000_000_000)
+    }
+    if step.error_message:
+        result["error_message"] = step.error_message
+        if step.error_traceback:
+            result["error_message"] += "\n" + step.error_traceback
+    return {"keyword": keyword, "name": name, "line": line, "match": {"location": ""}, "result": result}
+
+
+def feature_to_cucumber(feature) -> Dict[str, Any]:
+    """One feature in Cucumber JSON format"""
+    feature_id = _slug(feature.name)
+    elements = []
+    for index, scenario in enumerate(feature.scenarios):
+        steps = list(scenario.background_steps) + list(scenario.steps)
+        elements.append({
+            "id": f"{feature_id};{_slug(scenario.name)}",
+            "keyword": "Scenario",
+            "type": "scenario",
+            "name": scenario.name,
+            "description": "",
+            "line": index + 1,
+            "tags": _tags(scenario.tags),
+            "steps": [_step(step, line) for line, step in enumerate(steps, 1)]
+        })
+    return {
+        "id": feature_id,
+        "uri": feature.file_path or "",
+        "keyword": "Feature",
+        "name": feature.name,
+        "description": feature.description or "",
+        "line": 1,
+        "tags": _tags(feature.tags),
+        "elements": elements
+    }
+
+
+def write_cucumber_json(report_data, path) -> str:
+    """Write report_data as a Cucumber JSON array, one feature at a time"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("[")
+        for index, feature in enumerate(report_data.features):
+            if index:
+                f.write(",\n")
+            f.write(json_codec.dumps(feature_to_cucumber(feature), default=str))
+        f.write("]\n")
+    return str(path)
@@ -5,10 +5,71 @@ HTML Reporter - Generate comprehensive HTML reports for Judo Framework tests
 import json
 import os
 import base64
+import gzip
+import io
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, TextIO
 from .report_data import ReportData
+from ..utils import json_codec
+
+
+class StepDetailsWriter:
+    """
+    Step details stored next to the report instead of inside the HTML
+
+    Details are numbered in the order they are added and written in chunks
+    to <directory>/part-NNNNN.js. Each chunk is a script calling
+    judoReportData(chunk, payload), so the page can load it on demand with a
+    <script> tag (fetch() of local files is blocked when the report is opened
+    from disk). With compression the payload is base64 gzip, inflated in the
+    browser with DecompressionStream.
+
+    JUDO_REPORT_DATA_CHUNK_SIZE: details per chunk (default: 200)
+    JUDO_REPORT_DATA_COMPRESS:   gzip chunks (default: true)
+    """
+
+    def __init__(self, directory: Path, chunk_size: int = None, compress: bool = None):
+        if chunk_size is None:
+            chunk_size = int(os.getenv('JUDO_REPORT_DATA_CHUNK_SIZE', '200'))
+        if compress is None:
+            compress = os.getenv('JUDO_REPORT_DATA_COMPRESS', 'true').lower() == 'true'
+        self.directory = Path(directory)
+        self.chunk_size = max(1, chunk_size)
+        self.compress = compress
+        self.count = 0
+        self.chunks = 0
+        self._pending: List[str] = []
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Chunks left by a previous report with the same name
+        for stale in self.directory.glob("part-*.js"):
+            stale.unlink()
+
+    def add(self, html: str) -> int:
+        """Store the details of one step and return its number"""
+        index = self.count
+        self._pending.append(html)
+        self.count += 1
+        if len(self._pending) >= self.chunk_size:
+            self._write_chunk()
+        return index
+
+    def close(self) -> None:
+        """Write the last partial chunk"""
+        if self._pending:
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        payload = json_codec.dumps(self._pending)
+        if self.compress:
+            packed = gzip.compress(payload.encode('utf-8'), compresslevel=6, mtime=0)
+            payload = '"' + base64.b64encode(packed).decode('ascii') + '"'
+        path = self.directory / f"part-{self.chunks:05d}.js"
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"judoReportData({self.chunks},{payload});\n")
+        self.chunks += 1
+        self._pending = []
 
 
 class HTMLReporter:
@@ -263,16 +324,28 @@ class HTMLReporter:
             node = node.get(k, default)
         return node if node is not None else default
 
-    def generate_report(self, report_data: ReportData, filename: str = None) -> str:
-        """Generate HTML report"""
+    def generate_report(self, report_data: ReportData, filename: str = None,
+                        external_data: bool = None) -> str:
+        """
+        Generate HTML report
+
+        The page is streamed to the file section by section (one scenario at
+        a time), so memory does not grow with the size of the report. With
+        external_data (JUDO_REPORT_EXTERNAL_DATA=true) step details are written
+        to <report>_data/ and only loaded when a step is expanded.
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"judo_report_{timestamp}.html"
+        if external_data is None:
+            external_data = os.getenv('JUDO_REPORT_EXTERNAL_DATA', 'false').lower() == 'true'
 
         report_path = self.output_dir / filename
-        html_content = self._generate_html(report_data)
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        details = StepDetailsWriter(report_path.parent / f"{report_path.stem}_data") if external_data else None
+        with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            self._write_html(f, report_data, details)
+        if details is not None:
+            details.close()
         return str(report_path)
 
 
@@ -282,18 +355,16 @@ class HTMLReporter:
     # ------------------------------------------------------------------ #
 
     def _generate_html(self, report_data: ReportData) -> str:
+        buffer = io.StringIO()
+        self._write_html(buffer, report_data)
+        return buffer.getvalue()
+
+    def _write_html(self, out: TextIO, report_data: ReportData,
+                    details: Optional[StepDetailsWriter] = None) -> None:
         summary = report_data.get_summary()
         charts_enabled = self._cfg("charts", "enabled", default=True)
         title = self._cfg("project", "name", default="Judo Report")
-        css = self._get_css_styles()
-        header = self._generate_header(report_data, summary)
-        proj = self._generate_project_info()
-        summ = self._generate_summary_section(summary, report_data)
-        feats = self._generate_features_section(report_data.features)
-        footer = self._generate_footer()
-        js = self._get_javascript()
-        charts_js = self._get_charts_javascript(summary) if charts_enabled else ""
-        return (
+        out.write(
             "<!DOCTYPE html>\n"
             '<html lang="en">\n'
             "<head>\n"
@@ -301,21 +372,26 @@ class HTMLReporter:
             '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
             f"<title>{title}</title>\n"
             '<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>\n'
-            f"<style>{css}</style>\n"
+            f"<style>{self._get_css_styles()}</style>\n"
             "</head>\n"
             "<body>\n"
             '<div class="app">\n'
-            f"{header}\n"
-            '<main class="main">\n'
-            f"{proj}\n"
-            f"{summ}\n"
-            f"{feats}\n"
-            "</main>\n"
-            f"{footer}\n"
-            "</div>\n"
-            "<script>\n"
-            f"{js}\n"
-            f"{charts_js}\n"
+        )
+        out.write(f"{self._generate_header(report_data, summary)}\n")
+        out.write('<main class="main">\n')
+        out.write(f"{self._generate_project_info()}\n")
+        out.write(f"{self._generate_summary_section(summary, report_data)}\n")
+        for chunk in self._iter_features_section(report_data.features, details):
+            out.write(chunk)
+        out.write("\n</main>\n")
+        out.write(f"{self._generate_footer()}\n")
+        out.write("</div>\n<script>\n")
+        out.write(f"{self._get_javascript()}\n")
+        if details is not None:
+            out.write(f"{self._get_details_javascript(details)}\n")
+        if charts_enabled:
+            out.write(f"{self._get_charts_javascript(summary)}\n")
+        out.write(
             "</script>\n"
             "</body>\n"
             "</html>\n"
@@ -471,10 +547,14 @@ class HTMLReporter:
         )
 
 
-    def _generate_features_section(self, features) -> str:
+    def _generate_features_section(self, features, details: Optional[StepDetailsWriter] = None) -> str:
+        return "".join(self._iter_features_section(features, details))
+
+    def _iter_features_section(self, features, details: Optional[StepDetailsWriter] = None) -> Iterator[str]:
+        """Features section in pieces (one per scenario) for streaming"""
         fcfg = self.config.get("features", {})
         collapsed = fcfg.get("collapsed_by_default", True)
-        html = '<div class="features-list">\n'
+        yield '<div class="features-list">\n'
         for i, feature in enumerate(features):
             all_passed = all(s.status.value == "passed" for s in feature.scenarios)
             fstatus = "passed" if all_passed else "failed"
@@ -482,7 +562,7 @@ class HTMLReporter:
             dur = f"{feature.duration:.2f}s" if fcfg.get("show_duration", True) else ""
             sc_count = f"{len(feature.scenarios)} scenarios" if fcfg.get("show_scenario_count", True) else ""
             display = "none" if collapsed else "block"
-            html += (
+            yield (
                 f'<div class="feature-block">'
                 f'<div class="feature-hdr status-{fstatus}" onclick="toggleEl(\'feat-{i}\')">'
                 f'<span class="fhdr-icon">{icon}</span>'
@@ -491,16 +571,17 @@ class HTMLReporter:
                 f'<span class="toggle-arrow" id="arr-feat-{i}">&#9660;</span>'
                 f'</div>'
                 f'<div class="feature-body" id="feat-{i}" style="display:{display}">'
-                f'{self._generate_scenarios_section(feature.scenarios, i)}'
-                f'</div></div>\n'
             )
-        html += '</div>\n'
-        return html
+            yield from self._iter_scenarios_section(feature.scenarios, i, details)
+            yield '</div></div>\n'
+        yield '</div>\n'
 
-    def _generate_scenarios_section(self, scenarios, fi) -> str:
+    def _generate_scenarios_section(self, scenarios, fi, details: Optional[StepDetailsWriter] = None) -> str:
+        return "".join(self._iter_scenarios_section(scenarios, fi, details))
+
+    def _iter_scenarios_section(self, scenarios, fi, details: Optional[StepDetailsWriter] = None) -> Iterator[str]:
         scfg = self.config.get("scenarios", {})
         collapsed = scfg.get("collapsed_by_default", True)
-        html = ""
         for j, sc in enumerate(scenarios):
             st = sc.status.value
             icon = "&#9989;" if st == "passed" else ("&#10060;" if st == "failed" else "&#9193;")
@@ -510,7 +591,8 @@ class HTMLReporter:
             if scfg.get("show_tags", True) and getattr(sc, "tags", None):
                 tags_html = " ".join(f'<span class="tag">@{t}</span>' for t in sc.tags)
             display = "none" if collapsed else "block"
-            html += (
+            steps = list(getattr(sc, "background_steps", None) or []) + list(sc.steps or [])
+            yield (
                 f'<div class="scenario-block">'
                 f'<div class="scenario-hdr status-{st}" onclick="toggleEl(\'sc-{fi}-{j}\')">'
                 f'<span class="shdr-icon">{icon}</span>'
@@ -519,21 +601,27 @@ class HTMLReporter:
                 f'<span class="toggle-arrow" id="arr-sc-{fi}-{j}">&#9660;</span>'
                 f'</div>'
                 f'<div class="scenario-body" id="sc-{fi}-{j}" style="display:{display}">'
-                f'{self._generate_steps_section(list(getattr(sc,"background_steps",None) or []) + list(sc.steps or []))}'
+                f'{self._generate_steps_section(steps, details)}'
                 f'</div></div>\n'
             )
-        return html
 
-    def _generate_steps_section(self, steps) -> str:
+    def _generate_steps_section(self, steps, details: Optional[StepDetailsWriter] = None) -> str:
         html = '<div class="steps-list">\n'
         for step in steps:
             st = step.status.value
             icon = "&#9989;" if st == "passed" else ("&#10060;" if st == "failed" else "&#9193;")
             dur = f"{step.duration:.3f}s"
-            details = self._generate_step_details(step)
-            has_details = bool(details.strip())
-            sid = str(id(step))
-            onclick = f'onclick="toggleEl(\'step-{sid}\')"'  if has_details else ""
+            details_html = self._generate_step_details(step)
+            has_details = bool(details_html.strip())
+            if has_details and details is not None:
+                # Details go to the data files; the page loads them on expand
+                n = details.add(details_html)
+                sid = f"d{n}"
+                details_html = ""
+                onclick = f'onclick="toggleStep(\'step-{sid}\',{n})"'
+            else:
+                sid = str(id(step))
+                onclick = f'onclick="toggleEl(\'step-{sid}\')"'  if has_details else ""
             arrow = f'<span class="toggle-arrow" id="arr-step-{sid}">&#9660;</span>' if has_details else ""
             cursor = "cursor:pointer" if has_details else ""
             html += (
@@ -546,7 +634,7 @@ class HTMLReporter:
                 f'</div>'
             )
             if has_details:
-                html += f'<div class="step-details" id="step-{sid}" style="display:none">{details}</div>'
+                html += f'<div class="step-details" id="step-{sid}" style="display:none">{details_html}</div>'
             html += '</div>\n'
         html += '</div>\n'
         return html
@@ -556,7 +644,7 @@ class HTMLReporter:
         html = ""
         max_body = scfg.get("max_body_length", 5000)
         if scfg.get("show_variables", True) and getattr(step, "variables_used", None):
-            html += self._detail_block("&#128221; Variables", f'<pre class="code-block">{json.dumps(step.variables_used, indent=2, ensure_ascii=False)}</pre>')
+            html += self._detail_block("&#128221; Variables", f'<pre class="code-block">{json_codec.dumps(step.variables_used, indent=2)}</pre>')
         if scfg.get("show_request_details", True) and getattr(step, "request_data", None):
             req = step.request_data
             method = getattr(req, "method", "")
@@ -566,8 +654,9 @@ class HTMLReporter:
                 inner += self._kv_table("Headers", req.headers)
             if scfg.get("show_query_params", True) and getattr(req, "params", None):
                 inner += self._kv_table("Query Params", req.params)
-            if scfg.get("show_request_body", True) and getattr(req, "body", None):
-                body_str = json.dumps(req.body, indent=2, ensure_ascii=False) if isinstance(req.body, (dict, list)) else str(req.body)
+            body = getattr(req, "body", None) if scfg.get("show_request_body", True) else None
+            if body:
+                body_str = json_codec.dumps(body, indent=2) if isinstance(body, (dict, list)) else str(body)
                 inner += f'<div class="body-block"><div class="block-label">Body</div><pre class="code-block">{body_str[:max_body]}</pre></div>\n'
             html += self._detail_block("&#128228; Request", inner)
         if scfg.get("show_response_details", True) and getattr(step, "response_data", None):
@@ -576,11 +665,21 @@ class HTMLReporter:
             elapsed = getattr(resp, "elapsed_time", 0)
             elapsed_ms = round(elapsed * 1000) if elapsed else 0
             sc_cls = "status-ok" if str(status_code).startswith("2") else "status-err"
-            inner = f'<div class="resp-status"><span class="status-code-badge {sc_cls}">{status_code}</span><span class="resp-time">{elapsed_ms}ms</span></div>\n'
+            protocol = ""
+            if getattr(resp, "http_version", None):
+                protocol = resp.http_version
+                if getattr(resp, "stream_id", None) is not None:
+                    protocol += f" &middot; stream {resp.stream_id}"
+                reused = getattr(resp, "connection_reused", None)
+                if reused is not None:
+                    protocol += " &middot; reused connection" if reused else " &middot; new connection"
+                protocol = f'<span class="resp-time">{protocol}</span>'
+            inner = f'<div class="resp-status"><span class="status-code-badge {sc_cls}">{status_code}</span><span class="resp-time">{elapsed_ms}ms</span>{protocol}</div>\n'
             if scfg.get("show_response_headers", True) and getattr(resp, "headers", None):
                 inner += self._kv_table("Headers", resp.headers)
-            if scfg.get("show_response_body", True) and getattr(resp, "body", None):
-                body_str = json.dumps(resp.body, indent=2, ensure_ascii=False) if isinstance(resp.body, (dict, list)) else str(resp.body)
+            body = getattr(resp, "body", None) if scfg.get("show_response_body", True) else None
+            if body:
+                body_str = json_codec.dumps(body, indent=2) if isinstance(body, (dict, list)) else str(body)
                 inner += f'<div class="body-block"><div class="block-label">Body</div><pre class="code-block">{body_str[:max_body]}</pre></div>\n'
             html += self._detail_block("&#128229; Response", inner)
         if scfg.get("show_assertions", True) and getattr(step, "assertions", None):
@@ -610,7 +709,7 @@ class HTMLReporter:
     def _generate_body_section(self, title, body, body_type):
         if not body:
             return ""
-        body_str = json.dumps(body, indent=2, ensure_ascii=False) if isinstance(body, (dict, list)) else str(body)
+        body_str = json_codec.dumps(body, indent=2) if isinstance(body, (dict, list)) else str(body)
         return f'<div class="body-block"><div class="block-label">{title}</div><pre class="code-block">{body_str}</pre></div>\n'
 
     def _generate_assertions_section(self, assertions: list) -> str:
@@ -885,6 +984,63 @@ document.addEventListener('DOMContentLoaded', function() {
 });
 """
 
+    def _get_details_javascript(self, details: StepDetailsWriter) -> str:
+        """Loader for step details stored by StepDetailsWriter"""
+        base = json_codec.dumps(details.directory.name)
+        return """
+var judoData = {base: %s, chunkSize: %d, chunks: {}, pending: {}};
+
+function judoInflate(b64) {
+    var bytes = Uint8Array.from(atob(b64), function(c) { return c.charCodeAt(0); });
+    var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return new Response(stream).text().then(JSON.parse);
+}
+
+function judoChunkLoaded(k, items) {
+    judoData.chunks[k] = items;
+    (judoData.pending[k] || []).forEach(function(cb) { cb(items); });
+    delete judoData.pending[k];
+}
+
+// Called by each <report>_data/part-NNNNN.js
+function judoReportData(k, payload) {
+    if (typeof payload !== 'string') { judoChunkLoaded(k, payload); return; }
+    if (typeof DecompressionStream === 'undefined') { judoChunkLoaded(k, null); return; }
+    judoInflate(payload).then(function(items) { judoChunkLoaded(k, items); },
+                              function() { judoChunkLoaded(k, null); });
+}
+
+function judoLoadChunk(k, cb) {
+    if (k in judoData.chunks) { cb(judoData.chunks[k]); return; }
+    if (judoData.pending[k]) { judoData.pending[k].push(cb); return; }
+    judoData.pending[k] = [cb];
+    var s = document.createElement('script');
+    s.src = judoData.base + '/part-' + ('0000' + k).slice(-5) + '.js';
+    s.onerror = function() { judoChunkLoaded(k, null); };
+    document.head.appendChild(s);
+}
+
+function toggleStep(id, n) {
+    var el = document.getElementById(id);
+    if (!el) return;
+    if (!el.getAttribute('data-loaded')) {
+        el.setAttribute('data-loaded', '1');
+        el.innerHTML = '<div class="detail-content">Loading...</div>';
+        var k = Math.floor(n / judoData.chunkSize);
+        judoLoadChunk(k, function(items) {
+            if (items) {
+                el.innerHTML = items[n %% judoData.chunkSize] || '';
+            } else {
+                el.removeAttribute('data-loaded');
+                el.innerHTML = '<div class="detail-content">Step details could not be loaded from ' +
+                    judoData.base + '/ (keep the folder next to the report; gzip chunks need a browser ' +
+                    'with DecompressionStream, or set JUDO_REPORT_DATA_COMPRESS=false)</div>';
+            }
+        });
+    }
+    toggleEl(id);
+}
+""" % (base, details.chunk_size)
 
     def _get_charts_javascript(self, summary: dict) -> str:
         cc = self.config.get("charts", {})
@@ -0,0 +1,86 @@
+"""
+JUnit Exporter - JUnit XML from Judo report data
+
+One <testsuite> per feature and one <testcase> per scenario, the layout CI
+servers (Jenkins, GitLab, Azure DevOps) expect. Like the Cucumber exporter
+it works with a ReportData or a SpooledReport and writes one feature at a
+time.
+"""
+
+import re
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+from .report_data import ScenarioStatus, StepStatus
+
+
+# Characters XML 1.0 does not allow (e.g. ANSI escapes in error messages)
+_INVALID_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_STEP_MARKS = {
+    StepStatus.PASSED: "✓",
+    StepStatus.FAILED: "✗",
+    StepStatus.SKIPPED: "-",
+    StepStatus.PENDING: "?"
+}
+
+
+def _text(value) -> str:
+    return escape(_INVALID_XML.sub('', str(value or "")))
+
+
+def _attr(value) -> str:
+    return quoteattr(_INVALID_XML.sub('', str(value or "")))
+
+
+def _testcase(feature_name: str, scenario) -> str:
+    steps = list(scenario.background_steps) + list(scenario.steps)
+    lines = [f'    <testcase classname={_attr(feature_name)} name={_attr(scenario.name)} '
+             f'time="{scenario.duration or 0:.3f}">']
+
+    if scenario.status == ScenarioStatus.FAILED:
+        failed = next((step for step in steps if step.status == StepStatus.FAILED), None)
+        message = scenario.error_message or (failed.error_message if failed else None) or "Scenario failed"
+        details = ""
+        if failed is not None:
+            details = failed.step_text
+            if failed.error_traceback:
+                details += "\n" + failed.error_traceback
+        lines.append(f'      <failure message={_attr(message)} type="AssertionError">{_text(details)}</failure>')
+    elif scenario.status == ScenarioStatus.SKIPPED:
+        lines.append('      <skipped/>')
+
+    if steps:
+        output = "\n".join(f"{_STEP_MARKS.get(step.status, '?')} {step.step_text} ({step.duration:.3f}s)"
+                           for step in steps)
+        lines.append(f'      <system-out>{_text(output)}</system-out>')
+    lines.append('    </testcase>')
+    return "\n".join(lines)
+
+
+def write_junit_xml(report_data, path) -> str:
+    """Write report_data as JUnit XML, one feature at a time"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    summary = report_data.get_summary()
+    counts = summary["scenario_counts"]
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(f'<testsuites name={_attr(report_data.title)} tests="{summary["total_scenarios"]}" '
+                f'failures="{counts["failed"]}" skipped="{counts["skipped"]}" '
+                f'time="{report_data.duration or 0:.3f}">\n')
+        for feature in report_data.features:
+            scenarios = feature.scenarios
+            failures = sum(1 for s in scenarios if s.status == ScenarioStatus.FAILED)
+            skipped = sum(1 for s in scenarios if s.status == ScenarioStatus.SKIPPED)
+            f.write(f'  <testsuite name={_attr(feature.name)} tests="{len(scenarios)}" failures="{failures}" '
+                    f'skipped="{skipped}" errors="0" time="{feature.duration or 0:.3f}" '
+                    f'timestamp="{feature.start_time.isoformat(timespec="seconds")}" '
+                    f'file={_attr(feature.file_path)}>\n')
+            for scenario in scenarios:
+                f.write(_testcase(feature.name, scenario))
+                f.write("\n")
+            f.write('  </testsuite>\n')
+        f.write('</testsuites>\n')
+    return str(path)
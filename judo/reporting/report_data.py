@@ -1,14 +1,46 @@
 """
 Report Data Models - Data structures for test reporting
+
+The models use __slots__ and keep timestamps as time.perf_counter() floats
+(start_time/end_time are datetimes computed on access), so a run with
+100k steps does not carry a __dict__ and two datetime objects per step.
+Request/response bodies are kept by reference; large ones can be
+truncated or offloaded to disk (see body_store).
 """
 
 import json
+import sys
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
 from enum import Enum
 
+from .body_store import load_body, store_body
+
+
+# Wall-clock time at perf_counter() == 0, to turn timestamps back into datetimes
+_WALL_OFFSET = time.time() - time.perf_counter()
+
+Timestamp = Union[datetime, float, None]
+
+
+def _timestamp(value: Timestamp) -> Optional[float]:
+    """perf_counter()-based float for a datetime (floats are returned as-is)"""
+    if isinstance(value, datetime):
+        return value.timestamp() - _WALL_OFFSET
+    return value
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    return None if value is None else datetime.fromtimestamp(_WALL_OFFSET + value)
+
+
+def _intern_keys(headers: Optional[Dict]) -> Dict:
+    """Headers with interned names (the same few names repeat on every request)"""
+    if not headers:
+        return {}
+    return {sys.intern(k) if k.__class__ is str else k: v for k, v in headers.items()}
+
 
 class StepStatus(Enum):
     """Step execution status"""
@@ -25,16 +57,58 @@ class ScenarioStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+class _Timed:
+    """start_time/end_time stored as perf_counter() floats"""
+
+    __slots__ = ('_start', '_end')
+
+    def __init__(self, start_time: Timestamp = None, end_time: Timestamp = None):
+        self._start = time.perf_counter() if start_time is None else _timestamp(start_time)
+        self._end = _timestamp(end_time)
+
+    @property
+    def start_time(self) -> datetime:
+        return _datetime(self._start)
+
+    @start_time.setter
+    def start_time(self, value: Timestamp) -> None:
+        self._start = _timestamp(value)
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        return _datetime(self._end)
+
+    @end_time.setter
+    def end_time(self, value: Timestamp) -> None:
+        self._end = _timestamp(value)
+
+    def _stop(self) -> None:
+        self._end = time.perf_counter()
+        self.duration = self._end - self._start
+
+
 class RequestData:
     """HTTP request data"""
-    method: str = ""
-    url: str = ""
-    headers: Dict[str, str] = field(default_factory=dict)
-    params: Dict[str, Any] = field(default_factory=dict)
-    body: Any = None
-    body_type: str = "json"  # json, form, text, binary
-    
+
+    __slots__ = ('method', 'url', 'headers', 'params', '_body', 'body_type')
+
+    def __init__(self, method: str = "", url: str = "", headers: Dict[str, str] = None,
+                 params: Dict[str, Any] = None, body: Any = None, body_type: str = "json"):
+        self.method = sys.intern(method) if method.__class__ is str else method
+        self.url = url
+        self.headers = _intern_keys(headers)
+        self.params = params if params is not None else {}
+        self.body = body
+        self.body_type = sys.intern(body_type) if body_type.__class__ is str else body_type  # json, form, text, binary
+
+    @property
+    def body(self) -> Any:
+        return load_body(self._body)
+
+    @body.setter
+    def body(self, value: Any) -> None:
+        self._body = store_body(value)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
         return {
@@ -47,15 +121,32 @@ class RequestData:
         }
 
 
-@dataclass
 class ResponseData:
     """HTTP response data"""
-    status_code: int = 0
-    headers: Dict[str, str] = field(default_factory=dict)
-    body: Any = None
-    body_type: str = "json"  # json, text, binary
-    elapsed_time: float = 0.0
-    
+
+    __slots__ = ('status_code', 'headers', '_body', 'body_type', 'elapsed_time',
+                 'http_version', 'connection_reused', 'stream_id')
+
+    def __init__(self, status_code: int = 0, headers: Dict[str, str] = None, body: Any = None,
+                 body_type: str = "json", elapsed_time: float = 0.0, http_version: Optional[str] = None,
+                 connection_reused: Optional[bool] = None, stream_id: Optional[int] = None):
+        self.status_code = status_code
+        self.headers = _intern_keys(headers)
+        self.body = body
+        self.body_type = sys.intern(body_type) if body_type.__class__ is str else body_type  # json, text, binary
+        self.elapsed_time = elapsed_time
+        self.http_version = http_version  # HTTP/1.1, HTTP/2
+        self.connection_reused = connection_reused
+        self.stream_id = stream_id
+
+    @property
+    def body(self) -> Any:
+        return load_body(self._body)
+
+    @body.setter
+    def body(self, value: Any) -> None:
+        self._body = store_body(value)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
         return {
@@ -63,30 +154,74 @@ class ResponseData:
             "headers": self.headers,
             "body": self.body,
             "body_type": self.body_type,
-            "elapsed_time": self.elapsed_time
+            "elapsed_time": self.elapsed_time,
+            "http_version": self.http_version,
+            "connection_reused": self.connection_reused,
+            "stream_id": self.stream_id
         }
 
 
-@dataclass
-class StepReport:
-    """Individual step report"""
-    step_text: str
-    status: StepStatus
-    start_time: datetime
-    end_time: Optional[datetime] = None
-    duration: float = 0.0
-    error_message: Optional[str] = None
-    error_traceback: Optional[str] = None
-    request_data: Optional[RequestData] = None
-    response_data: Optional[ResponseData] = None
-    variables_used: Dict[str, Any] = field(default_factory=dict)
-    variables_set: Dict[str, Any] = field(default_factory=dict)
-    assertions: List[Dict[str, Any]] = field(default_factory=list)
-    
+class StepReport(_Timed):
+    """
+    Individual step report
+
+    variables_used, variables_set and assertions are created on first use;
+    most steps never set them.
+    """
+
+    __slots__ = ('step_text', 'status', 'duration', 'error_message', 'error_traceback',
+                 'request_data', 'response_data', '_variables_used', '_variables_set', '_assertions')
+
+    def __init__(self, step_text: str, status: StepStatus, start_time: Timestamp = None,
+                 end_time: Timestamp = None, duration: float = 0.0, error_message: Optional[str] = None,
+                 error_traceback: Optional[str] = None, request_data: Optional[RequestData] = None,
+                 response_data: Optional[ResponseData] = None, variables_used: Dict[str, Any] = None,
+                 variables_set: Dict[str, Any] = None, assertions: List[Dict[str, Any]] = None):
+        super().__init__(start_time, end_time)
+        self.step_text = sys.intern(step_text) if step_text.__class__ is str else step_text
+        self.status = status
+        self.duration = duration
+        self.error_message = error_message
+        self.error_traceback = error_traceback
+        self.request_data = request_data
+        self.response_data = response_data
+        self._variables_used = variables_used
+        self._variables_set = variables_set
+        self._assertions = assertions
+
+    @property
+    def variables_used(self) -> Dict[str, Any]:
+        if self._variables_used is None:
+            self._variables_used = {}
+        return self._variables_used
+
+    @variables_used.setter
+    def variables_used(self, value: Dict[str, Any]) -> None:
+        self._variables_used = value
+
+    @property
+    def variables_set(self) -> Dict[str, Any]:
+        if self._variables_set is None:
+            self._variables_set = {}
+        return self._variables_set
+
+    @variables_set.setter
+    def variables_set(self, value: Dict[str, Any]) -> None:
+        self._variables_set = value
+
+    @property
+    def assertions(self) -> List[Dict[str, Any]]:
+        if self._assertions is None:
+            self._assertions = []
+        return self._assertions
+
+    @assertions.setter
+    def assertions(self, value: List[Dict[str, Any]]) -> None:
+        self._assertions = value
+
     def finish(self, status: StepStatus, error_message: str = None, error_traceback: str = None):
         """Mark step as finished"""
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds()
+        self._stop()
         self.status = status
         if error_message:
             self.error_message = error_message
@@ -99,21 +234,26 @@ class StepReport:
         self.request_data = RequestData(
             method=method,
             url=url,
-            headers=headers or {},
-            params=params or {},
+            headers=headers,
+            params=params,
             body=body,
             body_type=body_type
         )
     
     def add_response(self, status_code: int, headers: Dict = None, 
-                    body: Any = None, body_type: str = "json", elapsed_time: float = 0.0):
+                    body: Any = None, body_type: str = "json", elapsed_time: float = 0.0,
+                    transport: Dict = None):
         """Add response data"""
+        transport = transport or {}
         self.response_data = ResponseData(
             status_code=status_code,
-            headers=headers or {},
+            headers=headers,
             body=body,
             body_type=body_type,
-            elapsed_time=elapsed_time
+            elapsed_time=elapsed_time,
+            http_version=transport.get("http_version"),
+            connection_reused=transport.get("connection_reused"),
+            stream_id=transport.get("stream_id")
         )
     
     def add_assertion(self, description: str, expected: Any, actual: Any, passed: bool):
@@ -128,11 +268,12 @@ class StepReport:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
+        end_time = self.end_time
         return {
             "step_text": self.step_text,
             "status": self.status.value,
             "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "end_time": end_time.isoformat() if end_time else None,
             "duration": self.duration,
             "error_message": self.error_message,
             "error_traceback": self.error_traceback,
@@ -144,36 +285,41 @@ class StepReport:
         }
 
 
-@dataclass
-class ScenarioReport:
+class ScenarioReport(_Timed):
     """Scenario report"""
-    name: str
-    feature_name: str
-    tags: List[str] = field(default_factory=list)
-    status: ScenarioStatus = ScenarioStatus.PASSED
-    start_time: datetime = field(default_factory=datetime.now)
-    end_time: Optional[datetime] = None
-    duration: float = 0.0
-    steps: List[StepReport] = field(default_factory=list)
-    background_steps: List[StepReport] = field(default_factory=list)
-    error_message: Optional[str] = None
+
+    __slots__ = ('name', 'feature_name', 'tags', 'status', 'duration', 'steps',
+                 'background_steps', 'error_message')
+
+    def __init__(self, name: str, feature_name: str, tags: List[str] = None,
+                 status: ScenarioStatus = ScenarioStatus.PASSED, start_time: Timestamp = None,
+                 end_time: Timestamp = None, duration: float = 0.0, steps: List[StepReport] = None,
+                 background_steps: List[StepReport] = None, error_message: Optional[str] = None):
+        super().__init__(start_time, end_time)
+        self.name = name
+        self.feature_name = feature_name
+        self.tags = tags if tags is not None else []
+        self.status = status
+        self.duration = duration
+        self.steps = steps if steps is not None else []
+        self.background_steps = background_steps if background_steps is not None else []
+        self.error_message = error_message
     
     def add_step(self, step_text: str) -> StepReport:
         """Add a new step"""
-        step = StepReport(step_text=step_text, status=StepStatus.PENDING, start_time=datetime.now())
+        step = StepReport(step_text=step_text, status=StepStatus.PENDING)
         self.steps.append(step)
         return step
     
     def add_background_step(self, step_text: str) -> StepReport:
         """Add a background step"""
-        step = StepReport(step_text=step_text, status=StepStatus.PENDING, start_time=datetime.now())
+        step = StepReport(step_text=step_text, status=StepStatus.PENDING)
         self.background_steps.append(step)
         return step
     
     def finish(self, status: ScenarioStatus, error_message: str = None):
         """Mark scenario as finished"""
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds()
+        self._stop()
         self.status = status
         if error_message:
             self.error_message = error_message
@@ -188,13 +334,14 @@ class ScenarioReport:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
+        end_time = self.end_time
         return {
             "name": self.name,
             "feature_name": self.feature_name,
             "tags": self.tags,
             "status": self.status.value,
             "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "end_time": end_time.isoformat() if end_time else None,
             "duration": self.duration,
             "background_steps": [step.to_dict() for step in self.background_steps],
             "steps": [step.to_dict() for step in self.steps],
@@ -203,17 +350,21 @@ class ScenarioReport:
         }
 
 
-@dataclass
-class FeatureReport:
+class FeatureReport(_Timed):
     """Feature report"""
-    name: str
-    description: str = ""
-    file_path: str = ""
-    tags: List[str] = field(default_factory=list)
-    scenarios: List[ScenarioReport] = field(default_factory=list)
-    start_time: datetime = field(default_factory=datetime.now)
-    end_time: Optional[datetime] = None
-    duration: float = 0.0
+
+    __slots__ = ('name', 'description', 'file_path', 'tags', 'scenarios', 'duration')
+
+    def __init__(self, name: str, description: str = "", file_path: str = "", tags: List[str] = None,
+                 scenarios: List[ScenarioReport] = None, start_time: Timestamp = None,
+                 end_time: Timestamp = None, duration: float = 0.0):
+        super().__init__(start_time, end_time)
+        self.name = name
+        self.description = description
+        self.file_path = file_path
+        self.tags = tags if tags is not None else []
+        self.scenarios = scenarios if scenarios is not None else []
+        self.duration = duration
     
     def add_scenario(self, name: str, tags: List[str] = None) -> ScenarioReport:
         """Add a new scenario"""
@@ -227,8 +378,7 @@ class FeatureReport:
     
     def finish(self):
         """Mark feature as finished"""
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds()
+        self._stop()
     
     def get_scenario_counts(self) -> Dict[str, int]:
         """Get scenario counts by status"""
@@ -239,29 +389,34 @@ class FeatureReport:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
+        end_time = self.end_time
         return {
             "name": self.name,
             "description": self.description,
             "file_path": self.file_path,
             "tags": self.tags,
             "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "end_time": end_time.isoformat() if end_time else None,
             "duration": self.duration,
             "scenarios": [scenario.to_dict() for scenario in self.scenarios],
             "scenario_counts": self.get_scenario_counts()
         }
 
 
-@dataclass
-class ReportData:
+class ReportData(_Timed):
     """Main report data container"""
-    title: str = "Judo Framework Test Report"
-    start_time: datetime = field(default_factory=datetime.now)
-    end_time: Optional[datetime] = None
-    duration: float = 0.0
-    features: List[FeatureReport] = field(default_factory=list)
-    environment: Dict[str, str] = field(default_factory=dict)
-    configuration: Dict[str, Any] = field(default_factory=dict)
+
+    __slots__ = ('title', 'duration', 'features', 'environment', 'configuration')
+
+    def __init__(self, title: str = "Judo Framework Test Report", start_time: Timestamp = None,
+                 end_time: Timestamp = None, duration: float = 0.0, features: List[FeatureReport] = None,
+                 environment: Dict[str, str] = None, configuration: Dict[str, Any] = None):
+        super().__init__(start_time, end_time)
+        self.title = title
+        self.duration = duration
+        self.features = features if features is not None else []
+        self.environment = environment if environment is not None else {}
+        self.configuration = configuration if configuration is not None else {}
     
     def add_feature(self, name: str, description: str = "", file_path: str = "", 
                    tags: List[str] = None) -> FeatureReport:
@@ -277,12 +432,11 @@ class ReportData:
     
     def finish(self):
         """Mark report as finished"""
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds()
+        self._stop()
         
         # Finish all features
         for feature in self.features:
-            if not feature.end_time:
+            if feature._end is None:
                 feature.finish()
     
     def get_summary(self) -> Dict[str, Any]:
@@ -312,6 +466,36 @@ class ReportData:
             "success_rate": (scenario_counts["passed"] / total_scenarios * 100) if total_scenarios > 0 else 0
         }
     
+    def merge(self, *others) -> "ReportData":
+        """
+        Add the features of other reports (e.g. from other workers) to this one
+
+        Accepts ReportData or SpooledReport; start/end time widen to cover
+        all of them. For large runs prefer report_merge.merge_reports,
+        which streams instead of loading everything.
+        """
+        for other in others:
+            self.features.extend(other.features)
+            if other.start_time < self.start_time:
+                self.start_time = other.start_time
+            other_end, end = other.end_time, self.end_time
+            if other_end is not None and (end is None or other_end > end):
+                self.end_time = other_end
+        if self._end is not None:
+            self.duration = max(0.0, self._end - self._start)
+        return self
+    
+    def save_artifact(self, path) -> str:
+        """Save as a report artifact that `judo merge-reports` can combine"""
+        from .report_spool import write_report_artifact
+        return str(write_report_artifact(self, path))
+    
+    @classmethod
+    def from_artifacts(cls, paths, title: str = None) -> "ReportData":
+        """Load and merge report artifacts (spools) into one in-memory ReportData"""
+        from .report_spool import SpooledReport
+        return SpooledReport(paths, title=title, merge_features=True).to_report_data()
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
         return {
@@ -323,4 +507,4 @@ class ReportData:
             "environment": self.environment,
             "configuration": self.configuration,
             "summary": self.get_summary()
-        }
\ No newline at end of file
+        }
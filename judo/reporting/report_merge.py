@@ -0,0 +1,187 @@
+"""
+Report Merge - One report from the results of several workers or CI nodes
+
+Each behave process keeps its own reporter, so parallel workers and CI
+shards produce one partial result each. The mergeable artifact is the
+report spool (NDJSON, see report_spool): workers save it with
+JudoReporter.export_artifact() when JUDO_REPORT_ARTIFACT_DIR is set, and
+merge_reports() streams all of them into one HTML report, one JUnit XML
+and one Cucumber JSON. Cucumber/behave JSON files are accepted as well
+(converted to artifacts first); no HTML is ever parsed.
+
+    JUDO_REPORT_ARTIFACT_DIR  save this process' report as an artifact in this
+                              directory when the report is generated
+    JUDO_REPORT_WORKER        do not write the per-process HTML (true/false,
+                              default: false); set by BaseRunner for its workers
+
+From the command line:
+
+    judo merge-reports shard-1/ shard-2/ extra/cucumber.json -o judo_reports
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..utils import json_codec
+from .report_data import FeatureReport, ReportData, ScenarioReport, ScenarioStatus, StepReport, StepStatus
+from .report_spool import SpooledReport, write_report_artifact
+
+
+ARTIFACT_SUFFIX = ".ndjson"
+
+_STEP_STATUSES = {
+    "passed": StepStatus.PASSED,
+    "failed": StepStatus.FAILED,
+    "skipped": StepStatus.SKIPPED
+}
+
+
+def worker_mode() -> bool:
+    """True in processes whose report is merged by someone else (no HTML of their own)"""
+    return os.getenv('JUDO_REPORT_WORKER', 'false').lower() == 'true'
+
+
+def collect_artifacts(inputs: Iterable) -> List[Path]:
+    """
+    Expand inputs into report files
+
+    Directories contribute every *.ndjson artifact below them; files are
+    taken as given (artifacts or Cucumber/behave JSON).
+    """
+    paths: List[Path] = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(path.rglob(f"*{ARTIFACT_SUFFIX}")))
+        elif path.exists():
+            paths.append(path)
+        else:
+            raise FileNotFoundError(f"Report input not found: {path}")
+    return paths
+
+
+def _tags(tags) -> List[str]:
+    return [tag.get("name", "") if isinstance(tag, dict) else str(tag) for tag in tags or []]
+
+
+def _seconds(duration) -> float:
+    # Cucumber JSON durations are integer nanoseconds, behave writes float seconds
+    if isinstance(duration, int):
+        return duration / 1_000_000_000
+    return float(duration or 0.0)
+
+
+def _step(step: Dict[str, Any]) -> StepReport:
+    result = step.get("result") or {}
+    error_message = result.get("error_message")
+    if isinstance(error_message, list):
+        error_message = "\n".join(error_message)
+    return StepReport(
+        step_text=f"{step.get('keyword', '').strip()} {step.get('name', '')}".strip(),
+        status=_STEP_STATUSES.get(result.get("status"), StepStatus.PENDING),
+        duration=_seconds(result.get("duration")),
+        error_message=error_message
+    )
+
+
+def _executed_steps(element: Dict[str, Any]) -> List[StepReport]:
+    return [_step(step) for step in element.get("steps") or [] if step.get("result")]
+
+
+def feature_from_cucumber(feature_data: Dict[str, Any]) -> FeatureReport:
+    """A FeatureReport from one Cucumber/behave JSON feature (scenarios that did not run are left out)"""
+    description = feature_data.get("description") or ""
+    if isinstance(description, list):
+        description = "\n".join(description)
+    feature = FeatureReport(
+        name=feature_data.get("name", "Unknown Feature"),
+        description=description,
+        file_path=feature_data.get("uri") or feature_data.get("location", "").split(":")[0],
+        tags=_tags(feature_data.get("tags"))
+    )
+
+    background: List[StepReport] = []
+    for element in feature_data.get("elements") or []:
+        steps = _executed_steps(element)
+        if element.get("type") == "background" or element.get("keyword") == "Background":
+            # Applies to the scenario that follows it
+            background = steps
+            continue
+        if not steps:
+            continue
+        all_steps = background + steps
+        if any(step.status == StepStatus.FAILED for step in all_steps):
+            status = ScenarioStatus.FAILED
+        elif all(step.status == StepStatus.SKIPPED for step in all_steps):
+            status = ScenarioStatus.SKIPPED
+        else:
+            status = ScenarioStatus.PASSED
+        feature.scenarios.append(ScenarioReport(
+            name=element.get("name", "Unknown Scenario"),
+            feature_name=feature.name,
+            tags=_tags(element.get("tags")),
+            status=status,
+            duration=sum(step.duration for step in all_steps),
+            steps=steps,
+            background_steps=background
+        ))
+        background = []
+
+    feature.duration = sum(scenario.duration for scenario in feature.scenarios)
+    return feature
+
+
+def cucumber_to_artifact(json_path, artifact_path) -> Path:
+    """Convert a Cucumber/behave JSON file into a report artifact"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json_codec.load(f)
+    report = ReportData(title=Path(json_path).stem)
+    for feature_data in data if isinstance(data, list) else [data]:
+        if isinstance(feature_data, dict):
+            report.features.append(feature_from_cucumber(feature_data))
+    report.finish()
+    report.duration = sum(feature.duration for feature in report.features)
+    return write_report_artifact(report, artifact_path)
+
+
+def merge_reports(inputs: Iterable, output_dir: str = None, html: Optional[str] = "test_execution_report.html",
+                  junit: Optional[str] = "junit.xml", cucumber: Optional[str] = "cucumber-consolidated.json",
+                  title: str = None, config_file: str = None) -> Dict[str, str]:
+    """
+    Merge report artifacts (and Cucumber/behave JSON files) into one report
+
+    Features are streamed from the artifacts, so memory does not grow with
+    the number of workers; a feature whose scenarios ran on several workers
+    is reported once. Pass None for an output to skip it.
+
+    Returns:
+        {"html": path, "junit": path, "cucumber": path} for the outputs written
+    """
+    from .cucumber_exporter import write_cucumber_json
+    from .html_reporter import HTMLReporter
+    from .junit_exporter import write_junit_xml
+
+    paths = collect_artifacts(inputs)
+    if not paths:
+        raise ValueError("No report artifacts to merge")
+    output_dir = Path(output_dir or os.getenv('JUDO_REPORT_OUTPUT_DIR') or "judo_reports")
+
+    outputs: Dict[str, str] = {}
+    with tempfile.TemporaryDirectory(prefix="judo_merge_") as converted_dir:
+        artifacts = []
+        for number, path in enumerate(paths):
+            if path.suffix == ARTIFACT_SUFFIX:
+                artifacts.append(path)
+            else:
+                artifacts.append(cucumber_to_artifact(path, Path(converted_dir) / f"{number}{ARTIFACT_SUFFIX}"))
+
+        report = SpooledReport(artifacts, title=title, merge_features=True)
+        if html:
+            outputs["html"] = HTMLReporter(str(output_dir), config_file).generate_report(report, html)
+        if junit:
+            outputs["junit"] = write_junit_xml(report, output_dir / junit)
+        if cucumber:
+            outputs["cucumber"] = write_cucumber_json(report, output_dir / cucumber)
+    return outputs
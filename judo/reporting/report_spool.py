@@ -0,0 +1,531 @@
+"""
+Report Spool - Append-only on-disk record of a run, written as it happens
+
+JudoReporter writes one NDJSON line per event (feature/scenario start,
+finished step, scenario/feature end) to <output_dir>/.judo_spool/ and
+drops finished scenarios from memory. Reports are generated by reading
+the spool back one feature at a time, so memory stays flat however long
+the run is, and a run that dies half-way still leaves a spool from which
+a partial report can be built (see generate_report_from_spool).
+
+    JUDO_REPORT_SPOOL       spool the report to disk (true/false, default: true)
+    JUDO_REPORT_SPOOL_DIR   directory for spool files (default: <output_dir>/.judo_spool)
+    JUDO_REPORT_KEEP_SPOOL  keep the spool after the report was generated (default: false)
+
+A spool is also the artifact that report_merge combines across worker
+processes and CI nodes (see write_report_artifact and artifact_path).
+"""
+
+import itertools
+import os
+import re
+import socket
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..utils import json_codec
+from .body_store import BodyRef
+from .report_data import (FeatureReport, ReportData, RequestData, ResponseData, ScenarioReport,
+                          ScenarioStatus, StepReport, StepStatus)
+
+
+VERSION = 1
+
+INTERRUPTED = "Execution interrupted before the scenario finished"
+
+_spool_numbers = itertools.count(1)
+
+# Leading fields of a step record, enough for the summary without parsing the whole line
+_STEP_PREFIX = re.compile(r'^\{"type": ?"step", ?"scenario": ?(\d+), ?"index": ?(\d+), ?'
+                          r'"background": ?(true|false), ?"status": ?"(\w+)"')
+
+
+def _wall(moment: Optional[datetime]) -> Optional[float]:
+    return moment.timestamp() if moment is not None else None
+
+
+def _moment(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+def _body(value: Any) -> Any:
+    # Offloaded bodies stay on disk: the spool keeps the reference
+    if value.__class__ is BodyRef:
+        return {"$body_ref": str(value.path), "size": value.size}
+    return value
+
+
+def _unbody(value: Any) -> Any:
+    if value.__class__ is dict and "$body_ref" in value:
+        return BodyRef(Path(value["$body_ref"]), value.get("size", 0))
+    return value
+
+
+def _request_record(request: RequestData) -> Dict[str, Any]:
+    return {
+        "method": request.method,
+        "url": request.url,
+        "headers": request.headers,
+        "params": request.params,
+        "body": _body(request._body),
+        "body_type": request.body_type
+    }
+
+
+def _response_record(response: ResponseData) -> Dict[str, Any]:
+    return {
+        "status_code": response.status_code,
+        "headers": response.headers,
+        "body": _body(response._body),
+        "body_type": response.body_type,
+        "elapsed_time": response.elapsed_time,
+        "http_version": response.http_version,
+        "connection_reused": response.connection_reused,
+        "stream_id": response.stream_id
+    }
+
+
+def step_record(step: StepReport) -> Dict[str, Any]:
+    """Step fields as stored in the spool (timestamps are epoch seconds)"""
+    return {
+        "text": step.step_text,
+        "status": step.status.value,
+        "start": _wall(step.start_time),
+        "end": _wall(step.end_time),
+        "duration": step.duration,
+        "error_message": step.error_message,
+        "error_traceback": step.error_traceback,
+        "request": _request_record(step.request_data) if step.request_data else None,
+        "response": _response_record(step.response_data) if step.response_data else None,
+        "variables_used": step._variables_used,
+        "variables_set": step._variables_set,
+        "assertions": step._assertions
+    }
+
+
+def step_from_record(record: Dict[str, Any]) -> StepReport:
+    request = response = None
+    if record.get("request"):
+        data = dict(record["request"])
+        data["body"] = _unbody(data.get("body"))
+        request = RequestData(**data)
+    if record.get("response"):
+        data = dict(record["response"])
+        data["body"] = _unbody(data.get("body"))
+        response = ResponseData(**data)
+    return StepReport(
+        step_text=record["text"],
+        status=StepStatus(record["status"]),
+        start_time=_moment(record.get("start")) or datetime.now(),
+        end_time=_moment(record.get("end")),
+        duration=record.get("duration", 0.0),
+        error_message=record.get("error_message"),
+        error_traceback=record.get("error_traceback"),
+        request_data=request,
+        response_data=response,
+        variables_used=record.get("variables_used"),
+        variables_set=record.get("variables_set"),
+        assertions=record.get("assertions")
+    )
+
+
+class ReportSpool:
+    """Append-only NDJSON writer for one reporter (one file per process)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Line-buffered: every event reaches the OS as soon as it is written
+        self._file = open(self.path, 'a', encoding='utf-8', buffering=1)
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    @classmethod
+    def create(cls, output_dir: str) -> "ReportSpool":
+        directory = os.getenv('JUDO_REPORT_SPOOL_DIR') or os.path.join(output_dir, ".judo_spool")
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        return cls(Path(directory) / f"report-{stamp}-{os.getpid()}-{next(_spool_numbers)}.ndjson")
+
+    def new_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json_codec.dumps(record, default=str) + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+
+    def write_run(self, report: ReportData) -> None:
+        self.write({"type": "run", "v": VERSION, "title": report.title,
+                    "start": _wall(report.start_time), "environment": report.environment})
+
+    def write_run_end(self, report: ReportData) -> None:
+        self.write({"type": "run_end", "end": _wall(report.end_time), "duration": report.duration})
+
+    def write_feature(self, feature_id: int, feature: FeatureReport) -> None:
+        self.write({"type": "feature", "id": feature_id, "name": feature.name,
+                    "description": feature.description, "file_path": feature.file_path,
+                    "tags": feature.tags, "start": _wall(feature.start_time)})
+
+    def write_feature_end(self, feature_id: int, feature: FeatureReport) -> None:
+        self.write({"type": "feature_end", "id": feature_id, "end": _wall(feature.end_time),
+                    "duration": feature.duration})
+
+    def write_scenario(self, scenario_id: int, feature_id: int, scenario: ScenarioReport) -> None:
+        self.write({"type": "scenario", "id": scenario_id, "feature": feature_id, "name": scenario.name,
+                    "tags": scenario.tags, "start": _wall(scenario.start_time)})
+
+    def write_scenario_end(self, scenario_id: int, scenario: ScenarioReport) -> None:
+        self.write({"type": "scenario_end", "id": scenario_id, "status": scenario.status.value,
+                    "end": _wall(scenario.end_time), "duration": scenario.duration,
+                    "error_message": scenario.error_message})
+
+    def write_step(self, scenario_id: int, index: int, background: bool, step: StepReport) -> None:
+        # Keep these keys first and in this order (see _STEP_PREFIX)
+        record = {"type": "step", "scenario": scenario_id, "index": index, "background": background,
+                  "status": step.status.value}
+        record.update(step_record(step))
+        self.write(record)
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def remove(self) -> None:
+        """Close and delete the spool file"""
+        self.close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def _read_records(path: Path) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json_codec.loads(line)
+            except ValueError:
+                # Last line cut short by a crash
+                continue
+
+
+class SpooledReport:
+    """
+    A ReportData read back from spool files
+
+    Offers what the HTML reporter and exporters use (title, start_time,
+    duration, environment, features, get_summary) but `features` is a
+    generator that rebuilds one FeatureReport at a time from disk.
+    Several spools (e.g. from worker processes) are read in order; with
+    merge_features, a feature split across spools (scenario-level
+    parallelism) is reported once, holding only such features in memory.
+    """
+
+    def __init__(self, paths, title: str = None, merge_features: bool = False):
+        self.paths = [Path(p) for p in ([paths] if isinstance(paths, (str, Path)) else paths)]
+        self._title = title
+        self.merge_features = merge_features
+        self._scanned: Optional[Dict[str, Any]] = None
+        self._scanned_key = None
+
+    def _scan(self) -> Dict[str, Any]:
+        """Run header and summary counters, in one pass (step lines are not fully parsed)"""
+        key = tuple((str(p), p.stat().st_size if p.exists() else -1) for p in self.paths)
+        if self._scanned is not None and self._scanned_key == key:
+            return self._scanned
+
+        header = {"title": None, "start": None, "end": None, "environment": {}}
+        feature_ids = set()
+        # Last spool holding each feature (file path, name)
+        feature_last_file: Dict[tuple, int] = {}
+        scenario_status: Dict[tuple, Optional[str]] = {}
+        step_status: Dict[tuple, str] = {}
+        for number, path in enumerate(self.paths):
+            if not path.exists():
+                continue
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    match = _STEP_PREFIX.match(line)
+                    if match:
+                        scenario_id, index, background, status = match.groups()
+                        step_status[(number, int(scenario_id), background, int(index))] = status
+                        continue
+                    try:
+                        record = json_codec.loads(line)
+                    except ValueError:
+                        continue
+                    kind = record.get("type")
+                    if kind == "run":
+                        if header["title"] is None:
+                            header["title"] = record.get("title")
+                            header["environment"] = record.get("environment") or {}
+                        start = record.get("start")
+                        if start is not None and (header["start"] is None or start < header["start"]):
+                            header["start"] = start
+                    elif kind == "feature":
+                        feature_ids.add((number, record.get("id")))
+                        feature_last_file[_feature_key(record.get("file_path"), record.get("name"))] = number
+                    elif kind == "scenario":
+                        if (number, record.get("feature")) in feature_ids:
+                            scenario_status[(number, record.get("id"))] = None
+                    elif kind == "scenario_end":
+                        if (number, record.get("id")) in scenario_status:
+                            scenario_status[(number, record.get("id"))] = record.get("status")
+                    elif kind == "step":
+                        step_status[(number, record.get("scenario"), str(record.get("background")).lower(),
+                                     record.get("index"))] = record.get("status")
+                    end = record.get("end")
+                    if end is not None and (header["end"] is None or end > header["end"]):
+                        header["end"] = end
+
+        scenario_counts = {status.value: 0 for status in ScenarioStatus}
+        for status in scenario_status.values():
+            # Never finished: the run was interrupted (see iter_features)
+            scenario_counts[status or ScenarioStatus.FAILED.value] += 1
+        step_counts = {status.value: 0 for status in StepStatus}
+        total_steps = 0
+        for (number, scenario_id, _, _), status in step_status.items():
+            if (number, scenario_id) in scenario_status:
+                step_counts[status] += 1
+                total_steps += 1
+        total_scenarios = len(scenario_status)
+
+        header["feature_last_file"] = feature_last_file
+        header["summary"] = {
+            "total_features": len(feature_last_file) if self.merge_features else len(feature_ids),
+            "total_scenarios": total_scenarios,
+            "total_steps": total_steps,
+            "scenario_counts": scenario_counts,
+            "step_counts": step_counts,
+            "success_rate": (scenario_counts["passed"] / total_scenarios * 100) if total_scenarios > 0 else 0
+        }
+        self._scanned, self._scanned_key = header, key
+        return header
+
+    @property
+    def title(self) -> str:
+        return self._title or self._scan()["title"] or "Judo Framework Test Report"
+
+    @property
+    def environment(self) -> Dict[str, Any]:
+        return self._scan()["environment"]
+
+    @property
+    def start_time(self) -> datetime:
+        return _moment(self._scan()["start"]) or datetime.now()
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        return _moment(self._scan()["end"])
+
+    @property
+    def duration(self) -> float:
+        header = self._scan()
+        if header["start"] is None or header["end"] is None:
+            return 0.0
+        return max(0.0, header["end"] - header["start"])
+
+    @property
+    def features(self) -> Iterator[FeatureReport]:
+        return self.iter_features()
+
+    def iter_features(self) -> Iterator[FeatureReport]:
+        """Features in the order they started, each rebuilt when its records end"""
+        if not self.merge_features:
+            for path in self.paths:
+                if path.exists():
+                    yield from self._features_of(path)
+            return
+
+        last_file = self._scan()["feature_last_file"]
+        held: Dict[tuple, FeatureReport] = {}
+        for number, path in enumerate(self.paths):
+            if not path.exists():
+                continue
+            for feature in self._features_of(path):
+                key = _feature_key(feature.file_path, feature.name)
+                if key in held:
+                    _absorb(held[key], feature)
+                    feature = held[key]
+                if last_file.get(key, number) == number:
+                    held.pop(key, None)
+                    yield feature
+                else:
+                    held[key] = feature
+        yield from held.values()
+
+    def _features_of(self, path: Path) -> Iterator[FeatureReport]:
+        features: Dict[int, FeatureReport] = {}
+        open_features: List[int] = []
+        ended = set()
+        scenarios: Dict[int, ScenarioReport] = {}
+        finished_scenarios = set()
+        steps: Dict[int, Dict[bool, Dict[int, StepReport]]] = {}
+
+        def complete(feature_id: int) -> FeatureReport:
+            feature = features.pop(feature_id)
+            for scenario in feature.scenarios:
+                scenario_id = id(scenario)
+                collected = steps.pop(scenario_id, {})
+                scenario.background_steps = [s for _, s in sorted(collected.get(True, {}).items())]
+                scenario.steps = [s for _, s in sorted(collected.get(False, {}).items())]
+                if scenario_id not in finished_scenarios:
+                    scenario.status = ScenarioStatus.FAILED
+                    scenario.error_message = INTERRUPTED
+                    scenario.duration = sum(s.duration for s in scenario.background_steps + scenario.steps)
+            return feature
+
+        for record in _read_records(path):
+            kind = record.get("type")
+            if kind == "feature":
+                feature_id = record["id"]
+                features[feature_id] = FeatureReport(
+                    name=record.get("name", ""),
+                    description=record.get("description", ""),
+                    file_path=record.get("file_path", ""),
+                    tags=record.get("tags") or [],
+                    start_time=_moment(record.get("start")) or datetime.now()
+                )
+                open_features.append(feature_id)
+            elif kind == "scenario":
+                feature = features.get(record.get("feature"))
+                if feature is None:
+                    continue
+                scenario = ScenarioReport(
+                    name=record.get("name", ""),
+                    feature_name=feature.name,
+                    tags=record.get("tags") or [],
+                    start_time=_moment(record.get("start")) or datetime.now()
+                )
+                feature.scenarios.append(scenario)
+                scenarios[record["id"]] = scenario
+            elif kind == "step":
+                scenario = scenarios.get(record.get("scenario"))
+                if scenario is None:
+                    continue
+                by_kind = steps.setdefault(id(scenario), {})
+                by_kind.setdefault(bool(record.get("background")), {})[record.get("index", 0)] = \
+                    step_from_record(record)
+            elif kind == "scenario_end":
+                scenario = scenarios.pop(record.get("id"), None)
+                if scenario is None:
+                    continue
+                scenario.status = ScenarioStatus(record.get("status", "passed"))
+                scenario.end_time = _moment(record.get("end"))
+                scenario.duration = record.get("duration", 0.0)
+                scenario.error_message = record.get("error_message")
+                finished_scenarios.add(id(scenario))
+            elif kind == "feature_end":
+                feature_id = record.get("id")
+                feature = features.get(feature_id)
+                if feature is None:
+                    continue
+                feature.end_time = _moment(record.get("end"))
+                feature.duration = record.get("duration", 0.0)
+                ended.add(feature_id)
+                # Yield in start order (features run one after another within a process)
+                while open_features and open_features[0] in ended:
+                    yield complete(open_features.pop(0))
+
+        # Anything left open when the process stopped
+        for feature_id in open_features:
+            if feature_id in features:
+                yield complete(feature_id)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Same counters as ReportData.get_summary"""
+        return self._scan()["summary"]
+
+    def finish(self) -> None:
+        """Nothing to do: the spool is already complete (kept for ReportData compatibility)"""
+
+    def to_report_data(self) -> ReportData:
+        """Load everything into a regular (in-memory) ReportData"""
+        report = ReportData(title=self.title, start_time=self.start_time, end_time=self.end_time,
+                            duration=self.duration, environment=dict(self.environment))
+        report.features = list(self.iter_features())
+        return report
+
+
+def _feature_key(file_path: Optional[str], name: Optional[str]) -> tuple:
+    return (file_path or "", name or "")
+
+
+def _absorb(feature: FeatureReport, part: FeatureReport) -> None:
+    """Add the scenarios of another part of the same feature (run by another worker)"""
+    feature.scenarios.extend(part.scenarios)
+    if part._start is not None and part._start < feature._start:
+        feature._start = part._start
+    if part._end is not None and (feature._end is None or part._end > feature._end):
+        feature._end = part._end
+    feature.duration += part.duration
+
+
+def artifact_path(directory) -> Path:
+    """A name for this process' artifact that is unique across workers and hosts"""
+    return Path(directory) / f"{socket.gethostname()}-{os.getpid()}-{next(_spool_numbers)}.ndjson"
+
+
+def write_report_artifact(report, path) -> Path:
+    """
+    Write any report (ReportData or SpooledReport) as a spool file
+
+    The spool format is the mergeable artifact: `judo merge-reports` and
+    merge_reports() read it back without holding the report in memory.
+    """
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+    spool = ReportSpool(path)
+    try:
+        spool.write_run(report)
+        for feature in report.features:
+            feature_id = spool.new_id()
+            spool.write_feature(feature_id, feature)
+            for scenario in feature.scenarios:
+                scenario_id = spool.new_id()
+                spool.write_scenario(scenario_id, feature_id, scenario)
+                for index, step in enumerate(scenario.background_steps):
+                    spool.write_step(scenario_id, index, True, step)
+                for index, step in enumerate(scenario.steps):
+                    spool.write_step(scenario_id, index, False, step)
+                spool.write_scenario_end(scenario_id, scenario)
+            spool.write_feature_end(feature_id, feature)
+        spool.write_run_end(report)
+    finally:
+        spool.close()
+    return path
+
+
+def spool_enabled() -> bool:
+    return os.getenv('JUDO_REPORT_SPOOL', 'true').lower() == 'true'
+
+
+def keep_spool() -> bool:
+    return os.getenv('JUDO_REPORT_KEEP_SPOOL', 'false').lower() == 'true'
+
+
+def generate_report_from_spool(paths, output_dir: str = None, filename: str = None,
+                               config_file: str = None) -> str:
+    """
+    Build the HTML report from spool files (e.g. left by a run that crashed)
+
+    Example:
+        generate_report_from_spool(glob.glob("judo_reports/.judo_spool/*.ndjson"))
+    """
+    from .html_reporter import HTMLReporter
+
+    report = SpooledReport(paths)
+    if output_dir is None:
+        output_dir = str(report.paths[0].parent.parent) if report.paths else None
+    return HTMLReporter(output_dir, config_file).generate_report(report, filename)
+
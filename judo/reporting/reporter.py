@@ -2,21 +2,32 @@
 Integrated Reporter - Captures test execution data automatically
 """
 
+import atexit
 import json
 import os
+import shutil
 import traceback
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 from .report_data import ReportData, FeatureReport, ScenarioReport, StepReport, StepStatus, ScenarioStatus
 from .html_reporter import HTMLReporter
+from .report_spool import (ReportSpool, SpooledReport, artifact_path, keep_spool, spool_enabled,
+                           write_report_artifact)
 
 
 class JudoReporter:
     """
     Integrated reporter that captures test execution data
+    
+    With JUDO_REPORT_SPOOL (default: true) every finished step and scenario
+    is appended to a spool file under output_dir and finished scenarios are
+    dropped from memory; reports are then generated from the spool.
+    With JUDO_REPORT_ARTIFACT_DIR the spool is also kept there as an
+    artifact for merging with other workers (see report_merge).
     """
     
-    def __init__(self, title: str = "Judo Framework Test Report", output_dir: str = None, config_file: str = None):
+    def __init__(self, title: str = "Judo Framework Test Report", output_dir: str = None, config_file: str = None,
+                 spool: bool = None):
         """Initialize reporter"""
         self.report_data = ReportData(title=title)
         self.current_feature: Optional[FeatureReport] = None
@@ -43,11 +54,26 @@ class JudoReporter:
             "working_directory": os.getcwd(),
             "timestamp": datetime.now().isoformat()
         }
+        
+        self.spool: Optional[ReportSpool] = None
+        self._feature_id = None
+        self._scenario_id = None
+        self._spooled_steps = set()
+        self._report_generated = False
+        self._run_ended = False
+        self._artifact: Optional[str] = None
+        self._output_dir = output_dir
+        self._use_spool = spool_enabled() if spool is None else spool
     
     def start_feature(self, name: str, description: str = "", file_path: str = "", 
                      tags: list = None) -> FeatureReport:
         """Start a new feature"""
+        if self._use_spool and self.spool is None:
+            self._open_spool()
         self.current_feature = self.report_data.add_feature(name, description, file_path, tags or [])
+        if self.spool:
+            self._feature_id = self.spool.new_id()
+            self.spool.write_feature(self._feature_id, self.current_feature)
         return self.current_feature
     
     def start_scenario(self, name: str, tags: list = None) -> ScenarioReport:
@@ -56,6 +82,10 @@ class JudoReporter:
             self.current_feature = self.start_feature("Default Feature")
         
         self.current_scenario = self.current_feature.add_scenario(name, tags or [])
+        if self.spool:
+            self._scenario_id = self.spool.new_id()
+            self._spooled_steps = set()
+            self.spool.write_scenario(self._scenario_id, self._feature_id, self.current_scenario)
         return self.current_scenario
     
     def start_step(self, step_text: str, is_background: bool = False) -> StepReport:
@@ -77,10 +107,10 @@ class JudoReporter:
             self.current_step.add_request(method, url, headers, params, body, body_type)
     
     def log_response(self, status_code: int, headers: Dict = None, body: Any = None, 
-                    body_type: str = "json", elapsed_time: float = 0.0):
-        """Log HTTP response data"""
+                    body_type: str = "json", elapsed_time: float = 0.0, transport: Dict = None):
+        """Log HTTP response data (transport: http_version, connection_reused, stream_id)"""
         if self.current_step:
-            self.current_step.add_response(status_code, headers, body, body_type, elapsed_time)
+            self.current_step.add_response(status_code, headers, body, body_type, elapsed_time, transport)
     
     def log_assertion(self, description: str, expected: Any, actual: Any, passed: bool):
         """Log assertion result"""
@@ -98,13 +128,17 @@ class JudoReporter:
             self.current_step.variables_set[name] = value
     
     def finish_step(self, status: StepStatus = StepStatus.PASSED, 
-                   error_message: str = None, error_traceback: str = None):
-        """Finish current step"""
+                   error_message: str = None, error_traceback: str = None, duration: float = None):
+        """Finish current step (duration overrides the measured one)"""
         if self.current_step:
             self.current_step.finish(status, error_message, error_traceback)
+            if duration is not None:
+                self.current_step.duration = duration
+            if self.spool and self.current_scenario:
+                self._spool_step(self.current_step)
     
-    def finish_scenario(self, status: ScenarioStatus = None, error_message: str = None):
-        """Finish current scenario"""
+    def finish_scenario(self, status: ScenarioStatus = None, error_message: str = None, duration: float = None):
+        """Finish current scenario (duration overrides the measured one)"""
         if self.current_scenario:
             # Auto-determine status if not provided
             if status is None:
@@ -113,20 +147,121 @@ class JudoReporter:
                 status = ScenarioStatus.FAILED if failed_steps else ScenarioStatus.PASSED
             
             self.current_scenario.finish(status, error_message)
+            if duration is not None:
+                self.current_scenario.duration = duration
+            if self.spool:
+                self._spool_scenario(self.current_scenario)
     
     def finish_feature(self):
         """Finish current feature"""
         if self.current_feature:
             self.current_feature.finish()
+            if self.spool and self.current_feature in self.report_data.features:
+                self.spool.write_feature_end(self._feature_id, self.current_feature)
+                # Already on disk
+                self.report_data.features.remove(self.current_feature)
+    
+    def _open_spool(self) -> None:
+        # Created with the first feature, so reporters that never run one leave no file
+        self._use_spool = False
+        try:
+            self.spool = ReportSpool.create(self._output_dir)
+            self.spool.write_run(self.report_data)
+            atexit.register(self._close_spool)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not create report spool, keeping the report in memory: {e}")
+            self.spool = None
+    
+    def _spool_step(self, step: StepReport) -> None:
+        scenario = self.current_scenario
+        for background, steps in ((False, scenario.steps), (True, scenario.background_steps)):
+            # The finished step is almost always the last one added
+            for index in range(len(steps) - 1, -1, -1):
+                if steps[index] is step:
+                    self.spool.write_step(self._scenario_id, index, background, step)
+                    self._spooled_steps.add(id(step))
+                    return
+    
+    def _spool_scenario(self, scenario: ScenarioReport) -> None:
+        # Steps that were started but never finished (e.g. interrupted) are written as they are
+        for background, steps in ((False, scenario.steps), (True, scenario.background_steps)):
+            for index, step in enumerate(steps):
+                if id(step) not in self._spooled_steps:
+                    self.spool.write_step(self._scenario_id, index, background, step)
+        self._spooled_steps = set()
+        self.spool.write_scenario_end(self._scenario_id, scenario)
+        # Already on disk: only the current feature and scenario stay in memory
+        if self.current_feature and scenario in self.current_feature.scenarios:
+            self.current_feature.scenarios.remove(scenario)
+    
+    def _end_run(self) -> None:
+        if self.spool and self.current_feature in self.report_data.features:
+            self.finish_feature()
+        self.report_data.finish()
+        if self.spool and not self._run_ended:
+            self.spool.write_run_end(self.report_data)
+            self._run_ended = True
     
     def generate_html_report(self, filename: str = None) -> str:
         """Generate HTML report"""
-        self.report_data.finish()
-        return self.html_reporter.generate_report(self.report_data, filename)
+        self._end_run()
+        report_path = self.html_reporter.generate_report(self.get_report_data(), filename)
+        self._report_generated = True
+        return report_path
     
-    def get_report_data(self) -> ReportData:
-        """Get current report data"""
+    def generate_cucumber_json(self, filename: str = "cucumber-report.json") -> str:
+        """Export the captured data as Cucumber JSON into the output directory"""
+        from .cucumber_exporter import write_cucumber_json
+        return write_cucumber_json(self.get_report_data(), self.html_reporter.output_dir / filename)
+    
+    def export_artifact(self, directory: str = None) -> Optional[str]:
+        """
+        Save the captured report as a mergeable artifact
+        
+        Args:
+            directory: Target directory (default: JUDO_REPORT_ARTIFACT_DIR; None if unset)
+        
+        Returns:
+            Path of the artifact, or None when there is no directory to save to
+        """
+        directory = directory or os.getenv('JUDO_REPORT_ARTIFACT_DIR')
+        if not directory:
+            return None
+        if self._artifact:
+            return self._artifact
+        self._end_run()
+        path = artifact_path(directory)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.spool:
+            # The spool already is the artifact: move it instead of rewriting it
+            self.spool.close()
+            shutil.move(str(self.spool.path), str(path))
+            self.spool.path = path
+        else:
+            write_report_artifact(self.report_data, path)
+        self._artifact = str(path)
+        return self._artifact
+    
+    def discard_spool(self) -> None:
+        """Delete the spool without generating a report (the data was reported elsewhere)"""
+        if self.spool and not self._artifact:
+            self.spool.remove()
+        self.spool = None
+    
+    def get_report_data(self) -> Union[ReportData, SpooledReport]:
+        """Get current report data (read back from the spool when spooling)"""
+        if self.spool:
+            return SpooledReport(self.spool.path, title=self.report_data.title)
         return self.report_data
+    
+    def _close_spool(self) -> None:
+        """At exit: the spool is removed once a report was generated from it"""
+        if self.spool is None:
+            return
+        if self._report_generated and not keep_spool() and not self._artifact:
+            self.spool.remove()
+        else:
+            self.spool.close()
 
 
 # Global reporter instance
@@ -14,6 +14,7 @@ import subprocess
 from dotenv import load_dotenv
 
 from ..reporting.reporter import JudoReporter
+from ..utils import json_codec
 
 
 class BaseRunner:
@@ -36,7 +37,13 @@ class BaseRunner:
                  console_format: str = None,
                  save_requests_responses: bool = None,
                  requests_responses_dir: str = None,
-                 run_all_features_together: bool = None):
+                 run_all_features_together: bool = None,
+                 use_worker_pool: bool = None,
+                 parallel_level: str = None,
+                 shard: str = None,
+                 timings_file: str = None,
+                 use_feature_index: bool = None,
+                 use_result_stream: bool = None):
         """
         Inicializar runner base
         
@@ -48,6 +55,14 @@ class BaseRunner:
         - JUDO_OUTPUT_DIR: Directorio para reportes (default: "judo_reports")
         - JUDO_PARALLEL: Ejecutar en paralelo (true/false, default: false)
         - JUDO_MAX_WORKERS: Número máximo de hilos (default: 4)
+        - JUDO_WORKER_POOL: Usar pool de procesos behave persistentes en paralelo (true/false, default: false)
+        - JUDO_PARALLEL_LEVEL: Unidad de paralelismo (feature/scenario, default: feature)
+        - JUDO_SHARD: Ejecutar solo el shard i/n de la suite (ej: 2/4); se balancea por duración
+          solo si JUDO_TIMINGS_FILE está definido, si no se reparte por ruta
+        - JUDO_TIMINGS_FILE: Base de tiempos históricos (default: output_dir/.judo_timings.json).
+          Para shards debe ser el mismo archivo en todos los nodos (versionado o caché de CI)
+        - JUDO_FEATURE_INDEX: Usar índice persistente de features/tags (true/false, default: true)
+        - JUDO_RESULT_STREAM: Recibir resultados de behave por socket en vez de archivos temporales (true/false, default: true)
         - JUDO_GENERATE_CUCUMBER_JSON: Generar JSON Cucumber (true/false, default: true)
         - JUDO_CUCUMBER_JSON_DIR: Directorio para JSON Cucumber (default: output_dir/cucumber-json)
         - JUDO_CONSOLE_FORMAT: Formato consola (progress/pretty/plain/none, default: progress)
@@ -109,6 +124,30 @@ class BaseRunner:
         # Configurar ejecución paralela
         self.parallel = self._get_bool_env('JUDO_PARALLEL', parallel, False)
         self.max_workers = int(max_workers or self._get_env_value('JUDO_MAX_WORKERS', '4'))
+        self.use_worker_pool = self._get_bool_env('JUDO_WORKER_POOL', use_worker_pool, False)
+        self.parallel_level = (parallel_level or self._get_env_value('JUDO_PARALLEL_LEVEL', 'feature')).lower()
+        
+        # Shard estático (i/n) y tiempos históricos para planificar la ejecución
+        from .scheduler import parse_shard
+        from .timing_db import TimingDatabase
+        self.shard = shard or self._get_env_value('JUDO_SHARD', None)
+        if self.shard:
+            parse_shard(self.shard)  # Validar formato temprano
+        timings_env = timings_file or self._get_env_value('JUDO_TIMINGS_FILE', None)
+        self.timings_file = self._resolve_path(timings_env) if timings_env else self.output_dir / ".judo_timings.json"
+        # El archivo por defecto es local a cada nodo: no sirve para calcular la misma partición en todos
+        self.shard_by_timings = bool(timings_env)
+        self.timing_db = TimingDatabase(str(self.timings_file))
+        
+        # Índice persistente de features (descubrimiento incremental y filtrado por scenario)
+        from .feature_index import FeatureIndex
+        self.use_feature_index = self._get_bool_env('JUDO_FEATURE_INDEX', use_feature_index, True)
+        self.feature_index = FeatureIndex(str(self.output_dir / ".judo_feature_index.json")) if self.use_feature_index else None
+        
+        # Canal de resultados en streaming (eventos NDJSON por socket local)
+        self.use_result_stream = self._get_bool_env('JUDO_RESULT_STREAM', use_result_stream, True)
+        self._result_stream = None
+        self._cucumber_features: List[Dict[str, Any]] = []
         
         # Configurar formato de consola
         self.console_format = console_format or self._get_env_value('JUDO_CONSOLE_FORMAT', 'progress')
@@ -184,6 +223,17 @@ class BaseRunner:
         self.current_tags: List[str] = []
         self.current_exclude_tags: List[str] = []
         
+        # Scenarios seleccionados por archivo (None = archivo completo).
+        # Si los tags ya se evaluaron con el índice, behave recibe ubicaciones
+        # `archivo.feature:LINEA` en lugar de --tags
+        self._scenario_selection: Dict[str, Optional[List[int]]] = {}
+        self._tags_prefiltered = False
+        
+        # Directorio de artefactos de reporte de los workers (solo en modo paralelo)
+        self._artifact_dir: Optional[Path] = None
+        self._artifact_dir_owned = False
+        self._artifact_env: Dict[str, Optional[str]] = {}
+        
         # Callbacks
         self.before_all_callback: Optional[Callable] = None
         self.after_all_callback: Optional[Callable] = None
@@ -231,6 +281,10 @@ class BaseRunner:
         self.log(f"   🚀 Parallel: {self.parallel}")
         if self.parallel:
             self.log(f"   👥 Max workers: {self.max_workers}")
+            self.log(f"   ♻️  Worker pool: {self.use_worker_pool}")
+            self.log(f"   🧩 Parallel level: {self.parallel_level}")
+        if self.shard:
+            self.log(f"   🔀 Shard: {self.shard}")
         self.log(f"   🖥️  Console format: {self.console_format}")
         self.log(f"   🥒 Generate Cucumber JSON: {self.generate_cucumber_json}")
         if self.generate_cucumber_json:
@@ -239,6 +293,8 @@ class BaseRunner:
         if self.save_requests_responses:
             self.log(f"   📁 Requests/responses dir: {self.requests_responses_dir}")
         self.log(f"   🎯 Run all features together: {self.run_all_features_together}")
+        self.log(f"   🗂️  Feature index: {self.use_feature_index}")
+        self.log(f"   📡 Result stream: {self.use_result_stream}")
         self.log(f"   ⏱️  Timeout: {self.config['timeout']}s")
         self.log(f"   🔄 Retry count: {self.config['retry_count']}")
         self.log(f"   🛑 Fail fast: {self.config['fail_fast']}")
@@ -260,10 +316,12 @@ class BaseRunner:
         self.config.update(kwargs)
         return self
     
-    def set_parallel(self, enabled: bool, max_workers: int = 4):
+    def set_parallel(self, enabled: bool, max_workers: int = 4, use_worker_pool: bool = None):
         """Configurar ejecución paralela"""
         self.parallel = enabled
         self.max_workers = max_workers
+        if use_worker_pool is not None:
+            self.use_worker_pool = use_worker_pool
         return self
     
     def set_request_response_logging(self, enabled: bool, directory: str = None):
@@ -315,11 +373,23 @@ class BaseRunner:
         """
         Encontrar archivos .feature basado en tags
         
+        Los tags se evalúan por scenario (tags efectivos, incluyendo los del
+        feature y los de Examples). Cada elemento puede ser una expresión
+        booleana (ej: "@smoke and not @slow"); los elementos de `tags` se
+        combinan con AND, como los `--tags` repetidos de behave (para OR usar
+        "@a,@b" o "@a or @b" en un solo elemento), y cualquier coincidencia
+        en `exclude_tags` excluye.
+        
         Args:
             tags: Tags a incluir (ej: ["@smoke", "@api"])
             exclude_tags: Tags a excluir (ej: ["@slow", "@manual"])
         """
+        from .tag_expression import TagFilter
+        
         feature_files = []
+        tag_filter = TagFilter(tags, exclude_tags)
+        self._scenario_selection = {}
+        self._tags_prefiltered = False
         
         # Try to find features directory with different case variations
         possible_dirs = [
@@ -344,115 +414,231 @@ class BaseRunner:
         self.features_dir = features_dir
         self.log(f"📁 Usando directorio de features: {self.features_dir}")
         
+        if self.feature_index is not None:
+            return self._find_features_indexed(tag_filter)
+        
         # Buscar todos los archivos .feature
         for feature_file in self.features_dir.rglob("*.feature"):
-            if self._should_include_feature(feature_file, tags, exclude_tags):
+            if self._should_include_feature(feature_file, tag_filter):
                 feature_files.append(feature_file)
         
         return feature_files
     
-    def _should_include_feature(self, feature_file: Path, tags: List[str], exclude_tags: List[str]) -> bool:
-        """Determinar si incluir un feature basado en tags"""
-        if not tags and not exclude_tags:
-            return True
+    def _find_features_indexed(self, tag_filter) -> List[Path]:
+        """Descubrir features con el índice persistente y filtrar por scenario"""
+        feature_files = []
+        all_files = self.feature_index.scan(self.features_dir)
+        stats = self.feature_index.stats
+        self.log(f"🗂️ Índice de features: {stats['reused']} reutilizados, {stats['parsed']} parseados")
         
-        try:
-            content = feature_file.read_text(encoding='utf-8')
-            
-            # Extraer tags del archivo
-            file_tags = self._extract_tags_from_content(content)
-            
-            # Verificar tags de exclusión
-            if exclude_tags:
-                for exclude_tag in exclude_tags:
-                    if exclude_tag in file_tags:
-                        return False
-            
-            # Verificar tags de inclusión
-            if tags:
-                for tag in tags:
-                    if tag in file_tags:
-                        return True
-                return False  # No se encontró ningún tag requerido
+        for feature_file in all_files:
+            if tag_filter.is_empty:
+                feature_files.append(feature_file)
+                continue
             
+            selected = self.feature_index.select_scenarios(feature_file, tag_filter)
+            if selected is None:
+                # No se pudo parsear: behave reportará el error
+                feature_files.append(feature_file)
+            elif selected:
+                feature_files.append(feature_file)
+                total = len(self.feature_index.get(feature_file)["scenarios"])
+                self._scenario_selection[str(feature_file)] = (
+                    None if len(selected) == total else [s["line"] for s in selected]
+                )
+        
+        try:
+            self.feature_index.save()
+        except OSError as e:
+            self.log(f"⚠️ No se pudo guardar el índice de features: {e}")
+        
+        self._tags_prefiltered = True
+        return feature_files
+    
+    def _behave_locations(self, feature_file) -> List[str]:
+        """Ubicaciones behave para un feature, limitadas a los scenarios seleccionados"""
+        lines = self._scenario_selection.get(str(feature_file))
+        if not lines:
+            return [str(feature_file)]
+        return [f"{feature_file}:{line}" for line in lines]
+    
+    def _behave_tag_args(self) -> List[str]:
+        """Argumentos --tags para behave (vacío si el índice ya filtró los scenarios)"""
+        if self._tags_prefiltered:
+            return []
+        args = []
+        for tag in self.current_tags:
+            args.extend(["--tags", tag])
+        for tag in self.current_exclude_tags:
+            args.extend(["--tags", f"~{tag}"])
+        return args
+    
+    def _should_include_feature(self, feature_file: Path, tag_filter) -> bool:
+        """
+        Determinar si incluir un feature: algún scenario cumple el filtro de tags
+        
+        Mismo criterio que el índice (tags efectivos de cada scenario), pero
+        sin persistir nada; behave vuelve a filtrar los scenarios con --tags.
+        """
+        if tag_filter.is_empty:
             return True
-            
-        except Exception as e:
-            self.log(f"⚠️ Error leyendo feature {feature_file}: {e}")
+        
+        from .feature_index import FeatureIndex
+        entry = FeatureIndex.parse(feature_file)
+        if entry.get("error"):
+            # No se pudo parsear: behave reportará el error
+            self.log(f"⚠️ Error leyendo feature {feature_file}: {entry['error']}")
             return True
+        return any(tag_filter.matches(scenario["tags"]) for scenario in entry["scenarios"])
     
-    def _extract_tags_from_content(self, content: str) -> List[str]:
-        """Extraer tags de un archivo .feature"""
-        import re
-        tags = []
-        
-        # Buscar líneas que empiecen con @
-        for line in content.split('\n'):
-            line = line.strip()
-            if line.startswith('@'):
-                # Extraer todos los tags de la línea
-                # Incluye letras, números, guiones medios (-) y guiones bajos (_)
-                # Esto permite tags como @PROJ-123, @api-test, @smoke_test, etc.
-                found_tags = re.findall(r'@[\w-]+', line)
-                tags.extend(found_tags)
-        
-        return tags
-    
-    def run_behave_command(self, feature_file: Path, extra_args: List[str] = None) -> Dict[str, Any]:
+    def _build_behave_args(self, feature_file: Path, extra_args: List[str] = None,
+                           write_cucumber_json: bool = True):
         """
-        Ejecutar comando behave para un feature
+        Construir los argumentos de behave para un feature
         
         Args:
-            feature_file: Archivo .feature a ejecutar
+            feature_file: Archivo .feature (o ubicación `archivo.feature:LINEA`)
             extra_args: Argumentos adicionales para behave
-        """
-        cmd = [sys.executable, "-m", "behave"]
+            write_cucumber_json: Generar el archivo Cucumber JSON de esta ejecución
         
-        # Agregar archivo feature
-        cmd.append(str(feature_file))
+        Returns:
+            Tupla (args, result_source, cucumber_json_path). `args` no incluye
+            el intérprete ni "-m behave", para poder usarse tanto en un subprocess
+            como dentro de un worker del pool. `result_source` es el id del job en
+            el canal de resultados o la ruta del JSON temporal (ver _collect_results).
+        """
+        args = self._behave_locations(feature_file)
         
         # Agregar tags si están configurados
-        if self.current_tags:
-            for tag in self.current_tags:
-                cmd.extend(["--tags", tag])
-        
-        # Agregar exclude tags si están configurados
-        if self.current_exclude_tags:
-            for tag in self.current_exclude_tags:
-                cmd.extend(["--tags", f"~{tag}"])
+        args.extend(self._behave_tag_args())
         
         # Agregar argumentos adicionales
         if extra_args:
-            cmd.extend(extra_args)
+            args.extend(extra_args)
         
         # Configurar formato de salida multiplataforma
-        import tempfile
         from datetime import datetime
         
-        # Crear archivo temporal para capturar JSON (funciona en todos los OS)
-        json_output_file = tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False)
-        json_output_path = json_output_file.name
-        json_output_file.close()
-        
-        # Configurar formatos de salida
-        cmd.extend(["--format", "json", "--outfile", json_output_path])
+        # Resultados: por el canal en streaming o por un JSON temporal
+        result_source = self._add_result_output(args)
         
         # NO agregar el formatter de Judo aquí porque los auto_hooks ya capturan los datos
         # El formatter causaría duplicados
         
         # Si está habilitado, también generar Cucumber JSON
         cucumber_json_path = None
-        if self.generate_cucumber_json:
+        if self.generate_cucumber_json and write_cucumber_json:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            feature_name = feature_file.stem
+            feature_name = Path(feature_file).stem
             cucumber_json_path = self.cucumber_json_dir / f"{feature_name}_{timestamp}.json"
-            cmd.extend(["--format", "json", "--outfile", str(cucumber_json_path)])
+            if not isinstance(result_source, int):
+                args.extend(["--format", "json", "--outfile", str(cucumber_json_path)])
         
         # Usar formato de consola configurado
         # 'progress' es más limpio que 'pretty', 'judo-simple' es el más minimalista
         if self.console_format != "none":
-            cmd.extend(["--format", self.console_format])
-        cmd.extend(["--no-capture"])
+            args.extend(["--format", self.console_format])
+        args.extend(["--no-capture"])
+        
+        return args, result_source, cucumber_json_path
+    
+    def _add_result_output(self, args: List[str]):
+        """
+        Agregar a los argumentos de behave el formatter que entrega los resultados
+        
+        Returns:
+            Id del job en el canal de resultados, o la ruta del JSON temporal si el
+            canal no está activo (ej: run_behave_command llamado fuera de run())
+        """
+        if self._result_stream is not None and self._result_stream.running:
+            job_id = self._result_stream.new_job()
+            args.extend(self._result_stream.behave_args(job_id))
+            return job_id
+        
+        import tempfile
+        
+        # Crear archivo temporal para capturar JSON (funciona en todos los OS)
+        json_output_file = tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False)
+        json_output_path = json_output_file.name
+        json_output_file.close()
+        args.extend(["--format", "json", "--outfile", json_output_path])
+        return json_output_path
+    
+    def _collect_results(self, result_source, cucumber_json_path: Path = None) -> Optional[Any]:
+        """
+        Obtener el JSON de behave de una ejecución terminada
+        
+        Con el canal en streaming los datos ya están en memoria y el Cucumber JSON
+        se escribe directamente desde ellos; sin canal se lee el JSON temporal.
+        """
+        if not isinstance(result_source, int):
+            return self._read_behave_json(result_source)
+        
+        json_data = self._result_stream.collect(result_source)
+        if cucumber_json_path and json_data:
+            self._write_cucumber_json(cucumber_json_path, json_data)
+        return json_data
+    
+    def _discard_results(self, result_source):
+        """Descartar los resultados de una ejecución fallida (timeout o error)"""
+        if isinstance(result_source, int):
+            self._result_stream.collect(result_source, timeout=0)
+            return
+        try:
+            if os.path.exists(result_source):
+                os.unlink(result_source)
+        except:
+            pass
+    
+    def _write_cucumber_json(self, cucumber_json_path: Path, features: List[Dict[str, Any]]):
+        """Escribir un Cucumber JSON y conservar sus features para el consolidado"""
+        with open(cucumber_json_path, 'w', encoding='utf-8') as f:
+            json_codec.dump(features, f, indent=2)
+        self._cucumber_features.extend(features)
+    
+    def _read_behave_json(self, json_output_path: str) -> Optional[Any]:
+        """Leer y eliminar el archivo JSON temporal generado por behave"""
+        json_data = None
+        try:
+            if os.path.exists(json_output_path):
+                with open(json_output_path, 'r', encoding='utf-8', errors='replace') as f:
+                    json_content = f.read()
+                    if json_content.strip():
+                        json_data = json_codec.loads(json_content)
+                
+                # Limpiar archivo temporal (multiplataforma)
+                try:
+                    os.unlink(json_output_path)
+                except (OSError, PermissionError):
+                    # En Windows a veces hay problemas de permisos, intentar después
+                    try:
+                        os.remove(json_output_path)
+                    except:
+                        pass  # Si no se puede eliminar, no es crítico
+        except Exception as e:
+            self.log(f"⚠️ Error leyendo JSON de reporte: {e}")
+            # Intentar limpiar archivo temporal aunque haya error
+            try:
+                if os.path.exists(json_output_path):
+                    os.unlink(json_output_path)
+            except:
+                pass
+        return json_data
+    
+    def run_behave_command(self, feature_file: Path, extra_args: List[str] = None,
+                           write_cucumber_json: bool = True) -> Dict[str, Any]:
+        """
+        Ejecutar comando behave para un feature
+        
+        Args:
+            feature_file: Archivo .feature a ejecutar (o ubicación `archivo.feature:LINEA`)
+            extra_args: Argumentos adicionales para behave
+            write_cucumber_json: Generar el archivo Cucumber JSON de esta ejecución
+        """
+        behave_args, result_source, cucumber_json_path = self._build_behave_args(
+            feature_file, extra_args, write_cucumber_json
+        )
+        cmd = [sys.executable, "-m", "behave"] + behave_args
         
         start_time = time.time()
         
@@ -488,31 +674,7 @@ class BaseRunner:
             duration = time.time() - start_time
             
             # Leer datos JSON del reporte
-            json_data = None
-            try:
-                if os.path.exists(json_output_path):
-                    with open(json_output_path, 'r', encoding='utf-8', errors='replace') as f:
-                        json_content = f.read()
-                        if json_content.strip():
-                            json_data = json.loads(json_content)
-                    
-                    # Limpiar archivo temporal (multiplataforma)
-                    try:
-                        os.unlink(json_output_path)
-                    except (OSError, PermissionError):
-                        # En Windows a veces hay problemas de permisos, intentar después
-                        try:
-                            os.remove(json_output_path)
-                        except:
-                            pass  # Si no se puede eliminar, no es crítico
-            except Exception as e:
-                self.log(f"⚠️ Error leyendo JSON de reporte: {e}")
-                # Intentar limpiar archivo temporal aunque haya error
-                try:
-                    if os.path.exists(json_output_path):
-                        os.unlink(json_output_path)
-                except:
-                    pass
+            json_data = self._collect_results(result_source, cucumber_json_path)
             
             return {
                 "feature_file": str(feature_file),
@@ -528,11 +690,7 @@ class BaseRunner:
         except subprocess.TimeoutExpired:
             duration = time.time() - start_time
             # Limpiar archivo temporal
-            try:
-                if os.path.exists(json_output_path):
-                    os.unlink(json_output_path)
-            except:
-                pass
+            self._discard_results(result_source)
             
             return {
                 "feature_file": str(feature_file),
@@ -546,11 +704,7 @@ class BaseRunner:
         except Exception as e:
             duration = time.time() - start_time
             # Limpiar archivo temporal
-            try:
-                if os.path.exists(json_output_path):
-                    os.unlink(json_output_path)
-            except:
-                pass
+            self._discard_results(result_source)
             
             return {
                 "feature_file": str(feature_file),
@@ -588,35 +742,24 @@ class BaseRunner:
         
         # Agregar todos los archivos feature
         for feature_file in feature_files:
-            cmd.append(str(feature_file))
+            cmd.extend(self._behave_locations(feature_file))
         
         # Agregar tags si están configurados
-        if self.current_tags:
-            for tag in self.current_tags:
-                cmd.extend(["--tags", tag])
-        
-        # Agregar exclude tags si están configurados
-        if self.current_exclude_tags:
-            for tag in self.current_exclude_tags:
-                cmd.extend(["--tags", f"~{tag}"])
+        cmd.extend(self._behave_tag_args())
         
         # Configurar formato de salida
-        import tempfile
         from datetime import datetime
         
-        json_output_file = tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False)
-        json_output_path = json_output_file.name
-        json_output_file.close()
-        
-        cmd.extend(["--format", "json", "--outfile", json_output_path])
+        result_source = self._add_result_output(cmd)
         
         # Cucumber JSON si está habilitado (usar formato diferente para evitar conflictos)
         cucumber_json_path = None
         if self.generate_cucumber_json:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             cucumber_json_path = self.cucumber_json_dir / f"all_features_{timestamp}.json"
-            # Usar formato json.pretty para evitar conflictos con el formato json principal
-            cmd.extend(["--format", "json.pretty", "--outfile", str(cucumber_json_path)])
+            if not isinstance(result_source, int):
+                # Usar formato json.pretty para evitar conflictos con el formato json principal
+                cmd.extend(["--format", "json.pretty", "--outfile", str(cucumber_json_path)])
         
         # Formato de consola
         if self.console_format != "none":
@@ -655,22 +798,21 @@ class BaseRunner:
             
             duration = time.time() - start_time
             
-            # Limpiar archivo temporal
-            try:
-                os.unlink(json_output_path)
-            except:
-                pass
+            # Leer datos JSON (tiempos por scenario) y limpiar archivo temporal
+            json_data = self._collect_results(result_source, cucumber_json_path)
             
             return {
                 "success": result.returncode == 0,
                 "duration": duration,
                 "stdout": stdout_content,
                 "stderr": stderr_content,
-                "returncode": result.returncode
+                "returncode": result.returncode,
+                "json_data": json_data
             }
             
         except subprocess.TimeoutExpired:
             duration = time.time() - start_time
+            self._discard_results(result_source)
             return {
                 "success": False,
                 "duration": duration,
@@ -680,6 +822,7 @@ class BaseRunner:
             }
         except Exception as e:
             duration = time.time() - start_time
+            self._discard_results(result_source)
             return {
                 "success": False,
                 "duration": duration,
@@ -697,6 +840,7 @@ class BaseRunner:
             
             result = self.run_single_feature(feature_file)
             results.append(result)
+            self._add_result_to_report(result)
             
             # Actualizar estadísticas
             self.results["total"] += 1
@@ -716,8 +860,102 @@ class BaseRunner:
         
         return results
     
+    def _add_result_to_report(self, result: Dict[str, Any]):
+        """
+        Agregar al reporte consolidado los features de una ejecución terminada
+        
+        Solo con el canal en streaming: cada proceso behave genera su propio HTML,
+        así que el runner arma el reporte de toda la suite a medida que llegan los datos.
+        """
+        if self._result_stream is None or not isinstance(result.get("json_data"), list):
+            return
+        for feature_data in result["json_data"]:
+            self._process_feature_data(feature_data)
+    
+    def _generate_consolidated_report(self):
+        """
+        Generar el reporte HTML de toda la suite
+        
+        Si los workers dejaron artefactos de reporte se unen (con requests,
+        responses y variables de cada step, más un JUnit XML); si no, se usa
+        lo que el runner armó con los resultados de behave.
+        """
+        try:
+            artifacts = self._report_artifacts()
+            if artifacts:
+                from ..reporting.report_merge import merge_reports
+                outputs = merge_reports(artifacts, str(self.output_dir), cucumber=None)
+                # Los datos del runner ya están en el reporte unido
+                self.reporter.discard_spool()
+                self.log(f"📊 Reporte HTML consolidado ({len(artifacts)} workers): {outputs['html']}")
+                self.log(f"🧾 JUnit XML consolidado: {outputs['junit']}")
+                return
+            report_path = self.reporter.generate_html_report("test_execution_report.html")
+            self.log(f"📊 Reporte HTML consolidado: {report_path}")
+        except Exception as e:
+            self.log(f"⚠️ Error generando reporte consolidado: {e}")
+    
+    def _begin_report_artifacts(self):
+        """
+        Pedir a cada proceso behave un artefacto de reporte en lugar de su propio HTML
+        
+        Sin esto cada worker escribe test_execution_report.html y gana el último.
+        Los artefactos van a un subdirectorio de la ejecución dentro de
+        JUDO_REPORT_ARTIFACT_DIR (se conservan, ej. para unir shards de CI) o,
+        si no está definido, de output_dir/.judo_artifacts (se borra al terminar).
+        """
+        self._artifact_env = {key: os.environ.get(key)
+                              for key in ('JUDO_REPORT_ARTIFACT_DIR', 'JUDO_REPORT_WORKER')}
+        user_dir = self._artifact_env['JUDO_REPORT_ARTIFACT_DIR']
+        base_dir = Path(user_dir) if user_dir else self.output_dir / ".judo_artifacts"
+        self._artifact_dir = base_dir / f"run-{time.strftime('%Y%m%d_%H%M%S')}-{os.getpid()}"
+        self._artifact_dir_owned = not user_dir
+        # Antes de crear los workers: el pool de procesos hereda el entorno al iniciarse
+        os.environ['JUDO_REPORT_ARTIFACT_DIR'] = str(self._artifact_dir)
+        os.environ['JUDO_REPORT_WORKER'] = 'true'
+    
+    def _end_report_artifacts(self):
+        """Restaurar el entorno y borrar los artefactos internos"""
+        if self._artifact_dir is None:
+            return
+        for key, value in self._artifact_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        if self._artifact_dir_owned:
+            import shutil
+            shutil.rmtree(self._artifact_dir, ignore_errors=True)
+        self._artifact_dir = None
+    
+    def _report_artifacts(self) -> List[Path]:
+        """Artefactos de reporte escritos por los workers de esta ejecución"""
+        if self._artifact_dir is None or not self._artifact_dir.is_dir():
+            return []
+        return sorted(self._artifact_dir.glob("*.ndjson"))
+    
+    def _register_parallel_result(self, feature_file: Path, result: Dict[str, Any]):
+        """Actualizar estadísticas con el resultado de un feature ejecutado en paralelo"""
+        self.results["total"] += 1
+        if result["success"]:
+            self.results["passed"] += 1
+            self.log(f"✅ {Path(feature_file).name} - PASSED ({result['duration']:.2f}s)")
+        else:
+            self.results["failed"] += 1
+            self.log(f"❌ {Path(feature_file).name} - FAILED ({result['duration']:.2f}s)")
+    
     def run_features_parallel(self, feature_files: List[Path]) -> List[Dict[str, Any]]:
         """Ejecutar features en paralelo"""
+        if self.parallel_level == "scenario":
+            return self.run_scenarios_parallel(feature_files)
+        
+        # Los features más lentos primero para acortar la cola final (LPT)
+        from .scheduler import order_longest_first
+        feature_files = order_longest_first(feature_files, self.timing_db.estimate_feature)
+        
+        if self.use_worker_pool:
+            return self.run_features_in_worker_pool(feature_files)
+        
         results = []
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -734,16 +972,11 @@ class BaseRunner:
                 try:
                     result = future.result()
                     results.append(result)
+                    self._add_result_to_report(result)
                     
                     # Actualizar estadísticas (thread-safe)
                     with threading.Lock():
-                        self.results["total"] += 1
-                        if result["success"]:
-                            self.results["passed"] += 1
-                            self.log(f"✅ {feature_file.name} - PASSED ({result['duration']:.2f}s)")
-                        else:
-                            self.results["failed"] += 1
-                            self.log(f"❌ {feature_file.name} - FAILED ({result['duration']:.2f}s)")
+                        self._register_parallel_result(feature_file, result)
                 
                 except Exception as e:
                     self.log(f"❌ Error ejecutando {feature_file.name}: {e}")
@@ -758,6 +991,200 @@ class BaseRunner:
         
         return results
     
+    def run_features_in_worker_pool(self, feature_files: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Ejecutar features en un pool de procesos behave persistentes
+        
+        Cada worker importa behave y los steps de Judo una sola vez, y luego
+        ejecuta los features que recibe por su pipe. Evita el costo de iniciar
+        un intérprete por feature.
+        """
+        results = []
+        
+        for feature_file in feature_files:
+            if self.before_feature_callback:
+                self.before_feature_callback(feature_file)
+        
+        jobs = [(feature_file, None, True) for feature_file in feature_files]
+        
+        for index, result in self._iter_worker_pool(jobs):
+            feature_file = feature_files[index]
+            
+            if self.after_feature_callback:
+                self.after_feature_callback(feature_file, result)
+            
+            results.append(result)
+            self._add_result_to_report(result)
+            self._register_parallel_result(feature_file, result)
+        
+        return results
+    
+    def _iter_worker_pool(self, jobs: List[tuple]):
+        """
+        Ejecutar trabajos behave en el pool de procesos
+        
+        Args:
+            jobs: Lista de tuplas (ubicación, extra_args, write_cucumber_json)
+        
+        Yields:
+            Tuplas (índice del trabajo, resultado) a medida que terminan
+        """
+        from .worker_pool import BehaveWorkerPool
+        
+        tasks = []
+        task_info = {}
+        
+        for task_id, (location, extra_args, write_cucumber_json) in enumerate(jobs):
+            behave_args, result_source, cucumber_json_path = self._build_behave_args(
+                location, extra_args, write_cucumber_json
+            )
+            task_info[task_id] = (location, result_source, cucumber_json_path)
+            tasks.append({
+                "id": task_id,
+                "args": behave_args,
+                "capture_output": not self.config.get("verbose", True)
+            })
+        
+        if not tasks:
+            return
+        
+        pool_size = min(self.max_workers, len(tasks))
+        self.log(f"♻️ Iniciando pool de {pool_size} workers behave")
+        
+        with BehaveWorkerPool(size=pool_size, timeout=self.config.get("timeout", 300)) as pool:
+            for message in pool.imap_unordered(tasks):
+                location, result_source, cucumber_json_path = task_info[message["id"]]
+                
+                yield message["id"], {
+                    "feature_file": str(location),
+                    "success": message["returncode"] == 0,
+                    "returncode": message["returncode"],
+                    "stdout": message["stdout"],
+                    "stderr": message["stderr"],
+                    "duration": message["duration"],
+                    "json_data": self._collect_results(result_source, cucumber_json_path),
+                    "cucumber_json": str(cucumber_json_path) if cucumber_json_path else None
+                }
+    
+    def _iter_thread_pool(self, jobs: List[tuple]):
+        """
+        Ejecutar trabajos behave como subprocesses desde un pool de hilos
+        
+        Args:
+            jobs: Lista de tuplas (ubicación, extra_args, write_cucumber_json)
+        
+        Yields:
+            Tuplas (índice del trabajo, resultado) a medida que terminan
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_index = {
+                executor.submit(self.run_behave_command, location, extra_args, write_cucumber_json): index
+                for index, (location, extra_args, write_cucumber_json) in enumerate(jobs)
+            }
+            
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    yield index, future.result()
+                except Exception as e:
+                    yield index, {
+                        "feature_file": str(jobs[index][0]),
+                        "success": False,
+                        "returncode": -1,
+                        "stdout": "",
+                        "stderr": str(e),
+                        "duration": 0,
+                        "json_data": None
+                    }
+    
+    def run_scenarios_parallel(self, feature_files: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Ejecutar en paralelo a nivel de scenario
+        
+        Cada feature se expande en sus scenarios (y filas de Scenario Outline),
+        que se reparten entre los workers. Los resultados se vuelven a unir en
+        un resultado por feature, un único ReportData y un Cucumber JSON por feature.
+        """
+        from .scheduler import expand_features, order_longest_first
+        
+        units = expand_features(feature_files, self.feature_index, self._scenario_selection)
+        self.log(f"🧩 {len(feature_files)} features expandidos en {len(units)} scenarios")
+        
+        # Los scenarios más lentos primero para acortar la cola final (LPT)
+        units = order_longest_first(
+            units, lambda unit: self.timing_db.estimate_scenario(unit.feature_file, unit.name)
+        )
+        
+        for feature_file in feature_files:
+            if self.before_feature_callback:
+                self.before_feature_callback(feature_file)
+        
+        # --no-skipped: behave no reporta los scenarios no seleccionados por línea
+        jobs = [(unit.location, ["--no-skipped"], False) for unit in units]
+        iterator = self._iter_worker_pool(jobs) if self.use_worker_pool else self._iter_thread_pool(jobs)
+        
+        unit_results = {}
+        for index, result in iterator:
+            unit_results[index] = result
+            icon = "✅" if result["success"] else "❌"
+            self.log(f"   {icon} {units[index].display_name} ({result['duration']:.2f}s)")
+        
+        return self._merge_unit_results(feature_files, units, unit_results)
+    
+    def _merge_unit_results(self, feature_files: List[Path], units: List, 
+                            unit_results: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Unir los resultados por scenario en un resultado por feature"""
+        from datetime import datetime
+        from .scheduler import merge_feature_json
+        
+        results = []
+        
+        for feature_file in feature_files:
+            indexes = [i for i, unit in enumerate(units) if unit.feature_file == feature_file]
+            indexes.sort(key=lambda i: units[i].line or 0)
+            feature_unit_results = [unit_results[i] for i in indexes if i in unit_results]
+            
+            feature_chunks = []
+            for unit_result in feature_unit_results:
+                json_data = unit_result.get("json_data")
+                if isinstance(json_data, list):
+                    feature_chunks.extend(json_data)
+                elif isinstance(json_data, dict):
+                    feature_chunks.append(json_data)
+            
+            merged_feature = merge_feature_json(feature_chunks)
+            
+            cucumber_json_path = None
+            if self.generate_cucumber_json and merged_feature:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                cucumber_json_path = self.cucumber_json_dir / f"{Path(feature_file).stem}_{timestamp}.json"
+                self._write_cucumber_json(cucumber_json_path, [merged_feature])
+            
+            result = {
+                "feature_file": str(feature_file),
+                "success": bool(feature_unit_results) and all(r["success"] for r in feature_unit_results),
+                "returncode": max((r["returncode"] for r in feature_unit_results), default=-1),
+                "stdout": "".join(r.get("stdout") or "" for r in feature_unit_results),
+                "stderr": "".join(r.get("stderr") or "" for r in feature_unit_results),
+                "duration": sum(r["duration"] for r in feature_unit_results),
+                "json_data": [merged_feature] if merged_feature else None,
+                "cucumber_json": str(cucumber_json_path) if cucumber_json_path else None
+            }
+            
+            if merged_feature:
+                self._process_feature_data(merged_feature)
+            
+            if self.after_feature_callback:
+                self.after_feature_callback(feature_file, result)
+            
+            results.append(result)
+            self._register_parallel_result(feature_file, result)
+        
+        # Reporte HTML único construido con los resultados de todos los workers
+        self._generate_consolidated_report()
+        
+        return results
+    
     def run(self, tags: List[str] = None, exclude_tags: List[str] = None) -> Dict[str, Any]:
         """
         Ejecutar tests
@@ -784,6 +1211,9 @@ class BaseRunner:
         # Encontrar features
         feature_files = self.find_features(tags, exclude_tags)
         
+        if feature_files and self.shard:
+            feature_files = self.select_shard(feature_files, self.shard)
+        
         if not feature_files:
             self.log("⚠️ No se encontraron features para ejecutar")
             return self.results
@@ -794,32 +1224,62 @@ class BaseRunner:
         if exclude_tags:
             self.log(f"🚫 Tags excluidos: {', '.join(exclude_tags)}")
         
+        # Abrir el canal de resultados en streaming
+        self._cucumber_features = []
+        if self.use_result_stream:
+            from .result_stream import ResultStreamServer
+            self._result_stream = ResultStreamServer().start()
+        
         # Ejecutar features
-        if self.run_all_features_together and not self.parallel:
-            # Ejecutar todos los features en una sola llamada a behave
-            # Esto genera un solo reporte HTML con todos los features
-            self.log("📝 Ejecutando todos los features juntos (un solo reporte)")
-            single_result = self.run_all_features_in_one_execution(feature_files)
-            execution_results = [single_result]
+        try:
+            if self.run_all_features_together and not self.parallel:
+                # Ejecutar todos los features en una sola llamada a behave
+                # Esto genera un solo reporte HTML con todos los features
+                self.log("📝 Ejecutando todos los features juntos (un solo reporte)")
+                single_result = self.run_all_features_in_one_execution(feature_files)
+                execution_results = [single_result]
             
-            # Actualizar estadísticas basadas en el resultado
-            if single_result["success"]:
-                self.results["passed"] = len(feature_files)
-                self.log(f"✅ Todos los features - PASSED ({single_result['duration']:.2f}s)")
+                # Actualizar estadísticas basadas en el resultado
+                if single_result["success"]:
+                    self.results["passed"] = len(feature_files)
+                    self.log(f"✅ Todos los features - PASSED ({single_result['duration']:.2f}s)")
+                else:
+                    self.results["failed"] = len(feature_files)
+                    self.log(f"❌ Ejecución - FAILED ({single_result['duration']:.2f}s)")
+            elif self.parallel and (len(feature_files) > 1 or self.parallel_level == "scenario"):
+                mode = "procesos (worker pool)" if self.use_worker_pool else "hilos"
+                self.log(f"🚀 Ejecutando en paralelo con {self.max_workers} {mode}")
+                self._begin_report_artifacts()
+                execution_results = self.run_features_parallel(feature_files)
+                
+                # Cada proceso behave deja su artefacto de reporte: el runner genera el
+                # HTML de toda la suite (el modo por scenario ya lo hizo)
+                if (self._result_stream is not None or self._report_artifacts()) \
+                        and self.parallel_level != "scenario":
+                    self._generate_consolidated_report()
             else:
-                self.results["failed"] = len(feature_files)
-                self.log(f"❌ Ejecución - FAILED ({single_result['duration']:.2f}s)")
-        elif self.parallel and len(feature_files) > 1:
-            self.log(f"🚀 Ejecutando en paralelo con {self.max_workers} hilos")
-            execution_results = self.run_features_parallel(feature_files)
-        else:
-            self.log("📝 Ejecutando secuencialmente (un feature a la vez)")
-            execution_results = self.run_features_sequential(feature_files)
+                self.log("📝 Ejecutando secuencialmente (un feature a la vez)")
+                if len(feature_files) > 1:
+                    # Un proceso behave por feature: sin artefactos cada uno pisaría el HTML del anterior
+                    self._begin_report_artifacts()
+                execution_results = self.run_features_sequential(feature_files)
+                
+                # El HTML unido conserva requests y responses de cada step
+                if self._report_artifacts():
+                    self._generate_consolidated_report()
+        finally:
+            if self._result_stream is not None:
+                self._result_stream.stop()
+                self._result_stream = None
+            self._end_report_artifacts()
         
         # Finalizar
         self.results["end_time"] = time.time()
         self.results["duration"] = self.results["end_time"] - self.results["start_time"]
         
+        # Guardar tiempos para planificar las próximas ejecuciones
+        self._record_timings(execution_results)
+        
         # Callback after all
         if self.after_all_callback:
             self.after_all_callback(self.results)
@@ -833,6 +1293,42 @@ class BaseRunner:
         
         return self.results
     
+    def select_shard(self, feature_files: List[Path], shard: str) -> List[Path]:
+        """
+        Seleccionar los features de un shard estático
+        
+        Se balancea por duración solo con un archivo de tiempos explícito
+        (timings_file / JUDO_TIMINGS_FILE), que debe ser el mismo en todos los
+        nodos; si no, se reparte por ruta para que cada nodo calcule la misma
+        partición y ningún feature se ejecute dos veces o se pierda.
+        
+        Args:
+            feature_files: Features encontrados
+            shard: Especificación `i/n` (ej: "2/4")
+        """
+        from .scheduler import parse_shard, partition_shards
+        
+        index, count = parse_shard(shard)
+        estimate = self.timing_db.estimate_feature if self.shard_by_timings else None
+        shards = partition_shards(feature_files, estimate, count)
+        selected = shards[index - 1]
+        mode = f"por duración ({self.timings_file})" if self.shard_by_timings else "por ruta"
+        self.log(f"🔀 Shard {index}/{count} {mode}: {len(selected)} de {len(feature_files)} features")
+        return selected
+    
+    def _record_timings(self, execution_results: List[Dict[str, Any]]):
+        """Registrar duraciones de esta ejecución en la base de tiempos"""
+        try:
+            for result in execution_results:
+                if result.get("json_data"):
+                    self.timing_db.record_behave_json(result["json_data"])
+                elif result.get("feature_file") and not (self.current_tags or self.current_exclude_tags):
+                    # Sin JSON no se sabe qué scenarios corrieron: solo ejecuciones sin filtro
+                    self.timing_db.record_feature(result["feature_file"], result.get("duration", 0))
+            self.timing_db.save()
+        except Exception as e:
+            self.log(f"⚠️ No se pudieron guardar los tiempos de ejecución: {e}")
+    
     def _generate_final_report(self, execution_results: List[Dict[str, Any]]):
         """Generar reporte final con datos de Behave"""
         try:
@@ -935,22 +1431,27 @@ class BaseRunner:
                     full_step = f"{step_keyword} {step_name}"
                     self.reporter.start_step(full_step, is_background=False)
                     
-                    # Finalizar step con status apropiado
+                    # Finalizar step con status apropiado, conservando la duración medida por behave
+                    step_duration = step_result.get("duration")
                     if step_status == "passed":
-                        self.reporter.finish_step(StepStatus.PASSED)
+                        self.reporter.finish_step(StepStatus.PASSED, duration=step_duration)
                     elif step_status == "failed":
                         error_msg = step_result.get("error_message", "Step failed")
-                        self.reporter.finish_step(StepStatus.FAILED, error_msg)
+                        if isinstance(error_msg, list):
+                            error_msg = "\n".join(error_msg)
+                        self.reporter.finish_step(StepStatus.FAILED, error_msg, duration=step_duration)
                     elif step_status == "skipped":
-                        self.reporter.finish_step(StepStatus.SKIPPED)
+                        self.reporter.finish_step(StepStatus.SKIPPED, duration=step_duration)
                     else:
-                        self.reporter.finish_step(StepStatus.PENDING)
+                        self.reporter.finish_step(StepStatus.PENDING, duration=step_duration)
                 
                 # Finalizar scenario
                 scenario_status = ScenarioStatus.PASSED
                 if any(s.get("result", {}).get("status") == "failed" for s in steps if s.get("result")):
                     scenario_status = ScenarioStatus.FAILED
-                self.reporter.finish_scenario(scenario_status)
+                self.reporter.finish_scenario(scenario_status, duration=sum(
+                    s.get("result", {}).get("duration", 0) for s in steps if s.get("result")
+                ))
             
             # Finalizar feature
             self.reporter.finish_feature()
@@ -1003,8 +1504,12 @@ class BaseRunner:
         
         consolidated = []
         
+        # Con el canal en streaming los features de esta ejecución ya están en memoria
+        if self._cucumber_features:
+            consolidated = list(self._cucumber_features)
+        
         # Leer todos los archivos JSON en el directorio
-        for json_file in self.cucumber_json_dir.glob("*.json"):
+        for json_file in ([] if consolidated else self.cucumber_json_dir.glob("*.json")):
             try:
                 with open(json_file, 'r', encoding='utf-8', errors='replace') as f:
                     content = f.read().strip()
@@ -1012,7 +1517,7 @@ class BaseRunner:
                         self.log(f"⚠️ Archivo JSON vacío: {json_file.name}")
                         continue
                     
-                    data = json.loads(content)
+                    data = json_codec.loads(content)
                     if isinstance(data, list):
                         consolidated.extend(data)
                     else:
@@ -1026,7 +1531,7 @@ class BaseRunner:
                     # Estrategia de recuperación: remover trailing commas y cerrar estructuras
                     fixed_content = self._fix_malformed_json(content)
                     if fixed_content:
-                        data = json.loads(fixed_content)
+                        data = json_codec.loads(fixed_content)
                         if isinstance(data, list):
                             consolidated.extend(data)
                         else:
@@ -1043,7 +1548,7 @@ class BaseRunner:
         if consolidated:
             output_path = self.cucumber_json_dir / output_file
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(consolidated, f, indent=2, ensure_ascii=False)
+                json_codec.dump(consolidated, f, indent=2)
             
             self.log(f"📦 JSON consolidado generado: {output_path}")
             return str(output_path)
@@ -0,0 +1,174 @@
+"""
+Feature Index - Índice persistente de archivos .feature
+
+Guarda, por archivo, el nombre del feature, sus scenarios (incluyendo cada
+fila de Scenario Outline) y los tags efectivos de cada uno. Las entradas se
+validan con mtime y tamaño, así que en cada ejecución solo se vuelven a
+parsear los archivos que cambiaron.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class FeatureIndex:
+    """
+    Índice incremental de features, scenarios y tags
+
+    Formato de cada entrada:
+        {
+            "mtime_ns": int, "size": int,
+            "name": str, "tags": [str],
+            "scenarios": [{"name": str, "line": int, "tags": [str]}],
+            "error": str | None
+        }
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_file: str = None):
+        """
+        Inicializar índice
+
+        Args:
+            index_file: Archivo JSON donde persistir el índice (None = solo en memoria)
+        """
+        self.index_file = Path(index_file) if index_file else None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"reused": 0, "parsed": 0, "removed": 0}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """Cargar índice desde disco (un archivo corrupto se ignora)"""
+        if not self.index_file or not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Persistir índice de forma atómica"""
+        if not self.index_file or not self._dirty:
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_file.with_suffix(self.index_file.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": self.VERSION, "entries": self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_file)
+        self._dirty = False
+
+    def scan(self, features_dir: Path) -> List[Path]:
+        """
+        Descubrir archivos .feature actualizando el índice de forma incremental
+
+        Returns:
+            Archivos encontrados, en orden estable
+        """
+        self.stats = {"reused": 0, "parsed": 0, "removed": 0}
+        found = []
+        seen_keys = set()
+
+        for feature_file in self._walk(str(features_dir)):
+            path = Path(feature_file)
+            found.append(path)
+            seen_keys.add(self._key(path))
+            self.get(path)
+
+        # Eliminar entradas de archivos borrados dentro del directorio escaneado
+        prefix = self._key(Path(features_dir)).rstrip("/") + "/"
+        for key in [k for k in self.entries if k.startswith(prefix) and k not in seen_keys]:
+            del self.entries[key]
+            self.stats["removed"] += 1
+            self._dirty = True
+
+        return found
+
+    def get(self, feature_file: Path) -> Dict[str, Any]:
+        """Obtener la entrada de un archivo, re-parseándolo solo si cambió"""
+        key = self._key(feature_file)
+        try:
+            stat = os.stat(feature_file)
+        except OSError as e:
+            return {"name": "", "tags": [], "scenarios": [], "error": str(e)}
+
+        entry = self.entries.get(key)
+        if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            self.stats["reused"] += 1
+            return entry
+
+        entry = self.parse(feature_file)
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        self.entries[key] = entry
+        self.stats["parsed"] += 1
+        self._dirty = True
+        return entry
+
+    def select_scenarios(self, feature_file: Path, tag_filter) -> Optional[List[Dict[str, Any]]]:
+        """
+        Scenarios de un archivo que cumplen el filtro de tags
+
+        Returns:
+            Lista de scenarios seleccionados, o None si el archivo no se pudo
+            parsear (en ese caso se delega el filtrado a behave)
+        """
+        entry = self.get(feature_file)
+        if entry.get("error"):
+            return None
+        return [s for s in entry["scenarios"] if tag_filter.matches(s["tags"])]
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(str(path)).replace(os.sep, "/")
+
+    @staticmethod
+    def _walk(root: str):
+        """Recorrer el directorio con os.scandir (más rápido que rglob + stat)"""
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as iterator:
+                    entries = sorted(iterator, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs = []
+            for dir_entry in entries:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    subdirs.append(dir_entry.path)
+                elif dir_entry.name.endswith(".feature"):
+                    yield dir_entry.path
+            stack.extend(reversed(subdirs))
+
+    @staticmethod
+    def parse(feature_file: Path) -> Dict[str, Any]:
+        """Parsear un archivo con el parser de behave (entrada con el formato del índice, sin mtime)"""
+        try:
+            from behave.parser import parse_file
+            feature = parse_file(str(feature_file))
+        except Exception as e:
+            return {"name": "", "tags": [], "scenarios": [], "error": str(e)}
+
+        if feature is None:
+            return {"name": "", "tags": [], "scenarios": [], "error": None}
+
+        return {
+            "name": feature.name,
+            "tags": [str(tag) for tag in feature.tags],
+            "scenarios": [
+                {
+                    "name": scenario.name,
+                    "line": scenario.line,
+                    "tags": sorted(str(tag) for tag in scenario.effective_tags)
+                }
+                for scenario in feature.walk_scenarios()
+            ],
+            "error": None
+        }
@@ -0,0 +1,299 @@
+"""
+Result Stream - Canal de resultados en streaming entre behave y el runner
+
+Cada ejecución de behave (subprocess o worker del pool) usa el formatter
+`ResultStreamFormatter`, que se conecta a un socket local del runner y envía
+eventos NDJSON a medida que avanzan los steps y scenarios. El runner arma los
+features en formato behave/Cucumber JSON en memoria, sin escribir archivos
+temporales ni volver a parsearlos.
+
+Eventos (una línea JSON por evento, todos con "job"):
+    {"event": "feature", "data": {cabecera del feature}}
+    {"event": "step", "data": {"keyword", "name", "status", "duration"}}
+    {"event": "element", "data": {background/scenario completo con sus steps}}
+    {"event": "feature_end", "data": {"status": ...}}
+    {"event": "done"}
+"""
+
+import itertools
+import socket
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from behave.formatter.json import JSONFormatter
+
+from ..utils import json_codec
+
+
+# Nombre del userdata de behave (-D) con la dirección `host:puerto/job`
+STREAM_USERDATA_KEY = "judo_result_stream"
+
+# Especificación del formatter para `--format`
+FORMATTER_SPEC = "judo.runner.result_stream:ResultStreamFormatter"
+
+
+class _JobState:
+    """Features recibidos de una ejecución de behave"""
+
+    def __init__(self):
+        self.features: List[Dict[str, Any]] = []
+        self.current: Optional[Dict[str, Any]] = None
+        self.connected = False
+        self.finished = False
+
+
+class ResultStreamServer:
+    """
+    Servidor local que recibe eventos NDJSON de las ejecuciones de behave
+
+    Ejemplo:
+        with ResultStreamServer() as server:
+            job_id = server.new_job()
+            args += server.behave_args(job_id)
+            ...  # ejecutar behave
+            features = server.collect(job_id)
+    """
+
+    def __init__(self, host: str = "127.0.0.1",
+                 on_step: Optional[Callable[[int, Dict[str, Any]], None]] = None):
+        """
+        Inicializar servidor
+
+        Args:
+            host: Interfaz donde escuchar (solo local)
+            on_step: Callback opcional (job_id, step) por cada step terminado
+        """
+        self.host = host
+        self.on_step = on_step
+        self.address: Optional[str] = None
+        self._socket: Optional[socket.socket] = None
+        self._jobs: Dict[int, _JobState] = {}
+        self._job_ids = itertools.count(1)
+        self._condition = threading.Condition()
+        self._running = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Abrir el socket y empezar a aceptar conexiones"""
+        if self._running:
+            return self
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.bind((self.host, 0))
+        self._socket.listen(64)
+        host, port = self._socket.getsockname()[:2]
+        self.address = f"{host}:{port}"
+        self._running = True
+
+        threading.Thread(target=self._accept_loop, name="judo-result-stream", daemon=True).start()
+        return self
+
+    def stop(self):
+        """Cerrar el socket (las conexiones abiertas terminan solas)"""
+        self._running = False
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = None
+
+    def new_job(self) -> int:
+        """Registrar una nueva ejecución de behave y devolver su id"""
+        with self._condition:
+            job_id = next(self._job_ids)
+            self._jobs[job_id] = _JobState()
+            return job_id
+
+    def behave_args(self, job_id: int) -> List[str]:
+        """Argumentos de behave para que la ejecución envíe sus eventos a este servidor"""
+        return ["--format", FORMATTER_SPEC, "-D", f"{STREAM_USERDATA_KEY}={self.address}/{job_id}"]
+
+    def collect(self, job_id: int, timeout: float = 5.0) -> Optional[List[Dict[str, Any]]]:
+        """
+        Esperar a que la ejecución termine de enviar y devolver sus features
+
+        Debe llamarse después de que behave terminó. Si la ejecución nunca se
+        conectó (behave falló antes de cargar los formatters) se espera poco.
+
+        Returns:
+            Lista de features en formato behave JSON, o None si no llegó nada
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if not job.finished:
+                self._condition.wait_for(lambda: job.finished, timeout=timeout if job.connected else 0.5)
+            if not job.finished and job.connected:
+                self._condition.wait_for(lambda: job.finished, timeout=timeout)
+            del self._jobs[job_id]
+
+            features = list(job.features)
+            if job.current is not None:
+                features.append(job.current)  # Feature interrumpido
+            return features if (features or job.connected) else None
+
+    # ---- Recepción ----
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                conn, _ = self._socket.accept()
+            except OSError:
+                break
+            thread = threading.Thread(target=self._read_connection, args=(conn,), daemon=True)
+            thread.start()
+
+    def _read_connection(self, conn: socket.socket):
+        job_ids = set()
+        try:
+            with conn, conn.makefile("r", encoding="utf-8") as reader:
+                for line in reader:
+                    if not line.strip():
+                        continue
+                    try:
+                        event = json_codec.loads(line)
+                    except ValueError:
+                        continue
+                    job_ids.add(event.get("job"))
+                    self._handle(event)
+        except OSError:
+            pass
+        finally:
+            # Conexión cerrada: la ejecución ya no enviará más eventos
+            with self._condition:
+                for job_id in job_ids:
+                    job = self._jobs.get(job_id)
+                    if job is not None:
+                        job.finished = True
+                self._condition.notify_all()
+
+    def _handle(self, event: Dict[str, Any]):
+        step_callback = None
+        with self._condition:
+            job = self._jobs.get(event.get("job"))
+            if job is None:
+                return
+            kind = event.get("event")
+            data = event.get("data") or {}
+
+            if kind == "hello":
+                job.connected = True
+            elif kind == "feature":
+                if job.current is not None:
+                    job.features.append(job.current)
+                job.current = dict(data, elements=[])
+            elif kind == "element" and job.current is not None:
+                job.current["elements"].append(data)
+            elif kind == "feature_end" and job.current is not None:
+                job.current["status"] = data.get("status")
+                if not job.current["elements"]:
+                    del job.current["elements"]
+                job.features.append(job.current)
+                job.current = None
+            elif kind == "step":
+                step_callback = self.on_step
+            elif kind == "done":
+                job.finished = True
+
+            self._condition.notify_all()
+
+        if step_callback:
+            step_callback(event.get("job"), event.get("data") or {})
+
+
+class ResultStreamFormatter(JSONFormatter):
+    """
+    Formatter de behave que envía el JSON de behave como eventos NDJSON
+
+    Se activa con `--format judo.runner.result_stream:ResultStreamFormatter
+    -D judo_result_stream=host:puerto/job` (ver ResultStreamServer.behave_args).
+    Los elementos ya enviados se descartan, así que la memoria no crece con
+    el tamaño del feature.
+    """
+
+    name = "judo-stream"
+    description = "Judo result stream (NDJSON events to the runner)"
+
+    def open(self):
+        """Conectarse al runner en lugar de abrir el archivo de salida"""
+        spec = self.config.userdata.get(STREAM_USERDATA_KEY, "")
+        address, _, job = spec.rpartition("/")
+        host, _, port = address.rpartition(":")
+        self.job = int(job)
+        self._socket = socket.create_connection((host, int(port)))
+        self.stream = self._socket.makefile("w", encoding="utf-8", newline="\n")
+        self._emit("hello")
+        return self.stream
+
+    def _emit(self, event: str, data: Dict[str, Any] = None):
+        message = {"job": self.job, "event": event}
+        if data is not None:
+            message["data"] = data
+        self.stream.write(json_codec.dumps(message) + "\n")
+
+    # -- FORMATTER API:
+    def feature(self, feature):
+        super().feature(feature)
+        self._emit("feature", self.current_feature_data)
+
+    def background(self, background):
+        self.finish_current_scenario()
+        super().background(background)
+
+    def result(self, step):
+        super().result(step)
+        step_data = self.current_feature_element["steps"][self._step_index - 1]
+        self._emit("step", {
+            "keyword": step_data["keyword"],
+            "name": step_data["name"],
+            "status": step_data["result"]["status"],
+            "duration": step_data["result"]["duration"]
+        })
+
+    def eof(self):
+        if not self.current_feature_data:
+            return
+        self.finish_current_scenario()
+        self.update_status_data()
+        self._flush_elements()
+        self._emit("feature_end", {"status": self.current_feature_data["status"]})
+        self.stream.flush()
+        self.reset()
+        self.feature_count += 1
+
+    def close(self):
+        try:
+            self._emit("done")
+            self.stream.flush()
+        finally:
+            self.stream.close()
+            self.stream = None
+            self._socket.close()
+
+    # -- JSON-DATA COLLECTION:
+    def add_feature_element(self, element):
+        self._flush_elements()
+        return super().add_feature_element(element)
+
+    def finish_current_scenario(self):
+        super().finish_current_scenario()
+        self.current_scenario = None
+
+    def _flush_elements(self):
+        """Enviar los elementos terminados del feature actual y liberarlos"""
+        elements = self.current_feature_data.get("elements") if self.current_feature_data else None
+        if elements:
+            for element in elements:
+                self._emit("element", element)
+            self.current_feature_data["elements"] = []
@@ -0,0 +1,211 @@
+"""
+Scheduler - Planificación del trabajo para ejecución paralela
+
+Permite repartir un feature con muchos scenarios entre varios workers:
+cada scenario (y cada fila de un Scenario Outline) se convierte en una
+unidad `archivo.feature:LINEA` que behave puede ejecutar por separado.
+También ordena el trabajo por duración histórica (LPT) y genera shards
+estáticos balanceados para repartir una suite entre nodos de CI.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class WorkUnit:
+    """Unidad de trabajo: un feature completo o un scenario concreto"""
+    feature_file: Path
+    line: Optional[int] = None
+    name: str = ""
+    tags: List[str] = field(default_factory=list)
+
+    @property
+    def location(self) -> str:
+        """Ubicación en formato behave (`archivo.feature` o `archivo.feature:LINEA`)"""
+        if self.line is None:
+            return str(self.feature_file)
+        return f"{self.feature_file}:{self.line}"
+
+    @property
+    def display_name(self) -> str:
+        """Nombre legible para logs"""
+        if self.line is None:
+            return Path(self.feature_file).name
+        return f"{Path(self.feature_file).name}:{self.line} {self.name}".strip()
+
+
+def expand_feature(feature_file: Path, feature_index=None,
+                   lines: Optional[List[int]] = None) -> List[WorkUnit]:
+    """
+    Expandir un feature en una unidad por scenario y por fila de Examples
+
+    Si el archivo no se puede parsear se devuelve una única unidad con el
+    feature completo, para que behave reporte el error como siempre.
+
+    Args:
+        feature_file: Archivo .feature
+        feature_index: FeatureIndex opcional (evita volver a parsear el archivo)
+        lines: Líneas de los scenarios seleccionados (None = todos)
+    """
+    if feature_index is not None:
+        entry = feature_index.get(feature_file)
+        if entry.get("error"):
+            return [WorkUnit(feature_file=feature_file)]
+        scenarios = [(s["line"], s["name"], list(s["tags"])) for s in entry["scenarios"]]
+    else:
+        try:
+            from behave.parser import parse_file
+
+            feature = parse_file(str(feature_file))
+        except Exception:
+            return [WorkUnit(feature_file=feature_file)]
+
+        if feature is None:
+            return []
+
+        scenarios = [
+            (scenario.line, scenario.name, [str(tag) for tag in scenario.effective_tags])
+            for scenario in feature.walk_scenarios()
+        ]
+
+    if lines is not None:
+        selected_lines = set(lines)
+        scenarios = [s for s in scenarios if s[0] in selected_lines]
+
+    units = [
+        WorkUnit(feature_file=feature_file, line=line, name=name, tags=tags)
+        for line, name, tags in scenarios
+    ]
+    return units or [WorkUnit(feature_file=feature_file)]
+
+
+def expand_features(feature_files: List[Path], feature_index=None,
+                    selection: Optional[Dict[str, Optional[List[int]]]] = None) -> List[WorkUnit]:
+    """Expandir varios features manteniendo el orden de archivos y líneas"""
+    selection = selection or {}
+    units = []
+    for feature_file in feature_files:
+        units.extend(expand_feature(feature_file, feature_index, selection.get(str(feature_file))))
+    return units
+
+
+def order_longest_first(items: Sequence[T], estimate: Callable[[T], Optional[float]]) -> List[T]:
+    """
+    Ordenar trabajo de mayor a menor duración esperada (LPT)
+
+    Los elementos sin historial se estiman con la media de los conocidos,
+    y el orden original se conserva en caso de empate.
+    """
+    estimates = _estimates_with_default(items, estimate)
+    order = sorted(range(len(items)), key=lambda i: (-estimates[i], i))
+    return [items[i] for i in order]
+
+
+def partition_shards(items: Sequence[T], estimate: Optional[Callable[[T], Optional[float]]],
+                     shard_count: int) -> List[List[T]]:
+    """
+    Repartir trabajo en `shard_count` shards estáticos balanceados
+
+    Asignación greedy LPT: cada elemento (de mayor a menor duración) va al
+    shard con menor carga acumulada. Los empates se resuelven por nombre (no
+    por orden de descubrimiento), así que es determinista para los mismos
+    tiempos y cada nodo de CI calcula la misma partición por su cuenta.
+
+    Cada nodo solo obtiene la misma partición si usa exactamente los mismos
+    tiempos: un archivo versionado o restaurado desde la caché de CI, no el
+    de su propio output_dir (que solo tiene los tiempos del shard que corrió).
+    Con estimate=None el reparto es por ruta (round-robin en orden de nombre),
+    determinista sin ningún historial.
+    """
+    if shard_count < 1:
+        raise ValueError("shard_count debe ser >= 1")
+
+    estimates = _estimates_with_default(items, estimate) if estimate else [1.0] * len(items)
+    shards: List[List[int]] = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+
+    for i in sorted(range(len(items)), key=lambda i: (-estimates[i], str(items[i]))):
+        target = min(range(shard_count), key=lambda s: (loads[s], s))
+        shards[target].append(i)
+        loads[target] += estimates[i]
+
+    # Dentro de cada shard se conserva el orden original de descubrimiento
+    return [[items[i] for i in sorted(shard)] for shard in shards]
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parsear una especificación de shard `i/n` (i empieza en 1)
+
+    Raises:
+        ValueError: Si el formato o los valores no son válidos
+    """
+    try:
+        index_text, count_text = str(spec).split("/", 1)
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise ValueError(f"Shard inválido '{spec}': se esperaba el formato i/n (ej: 2/4)")
+
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard inválido '{spec}': debe cumplirse 1 <= i <= n")
+    return index, count
+
+
+def _estimates_with_default(items: Sequence[T], estimate: Callable[[T], Optional[float]]) -> List[float]:
+    """Estimaciones por elemento; los desconocidos usan la media de los conocidos"""
+    raw = [estimate(item) for item in items]
+    known = [value for value in raw if value is not None]
+    default = sum(known) / len(known) if known else 1.0
+    return [value if value is not None else default for value in raw]
+
+
+def merge_feature_json(feature_chunks: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Unir los fragmentos JSON (formato behave/Cucumber) de un mismo feature
+
+    Cada unidad de trabajo produce el feature con solo sus scenarios. El
+    resultado contiene un único background y los scenarios ordenados por línea.
+    """
+    if not feature_chunks:
+        return None
+
+    merged = dict(feature_chunks[0])
+    background = None
+    scenarios = []
+    seen_locations = set()
+
+    for chunk in feature_chunks:
+        for element in chunk.get("elements", []):
+            if element.get("type") == "background":
+                if background is None:
+                    background = element
+                continue
+
+            location = element.get("location")
+            if location in seen_locations:
+                continue
+            seen_locations.add(location)
+            scenarios.append(element)
+
+    scenarios.sort(key=lambda element: _location_line(element.get("location", "")))
+    merged["elements"] = ([background] if background else []) + scenarios
+
+    statuses = [chunk.get("status") for chunk in feature_chunks if chunk.get("status")]
+    if "failed" in statuses:
+        merged["status"] = "failed"
+    elif statuses:
+        merged["status"] = "passed" if "passed" in statuses else statuses[0]
+
+    return merged
+
+
+def _location_line(location: str) -> int:
+    """Extraer el número de línea de una ubicación `archivo:LINEA`"""
+    try:
+        return int(location.rsplit(":", 1)[1])
+    except (IndexError, ValueError):
+        return 0
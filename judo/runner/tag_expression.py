@@ -0,0 +1,147 @@
+"""
+Tag Expressions - Expresiones booleanas de tags para filtrar scenarios
+
+Soporta la sintaxis de Cucumber (`@smoke and (@api or not @slow)`) y la
+sintaxis clásica de behave (`~@slow` para negar, `@a,@b` para OR).
+"""
+
+import re
+from typing import Iterable, List, Optional, Set
+
+
+def normalize_tag(tag: str) -> str:
+    """Normalizar un tag: sin '@' inicial ni espacios"""
+    tag = str(tag).strip()
+    return tag[1:] if tag.startswith('@') else tag
+
+
+class TagExpression:
+    """Expresión de tags compilada"""
+
+    def __init__(self, text: str):
+        """
+        Compilar expresión
+
+        Raises:
+            ValueError: Si la expresión no es válida
+        """
+        self.text = text
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+        self._root = self._parse_or() if self._tokens else ("true",)
+        if self._pos != len(self._tokens):
+            raise ValueError(f"Expresión de tags inválida '{text}': token inesperado '{self._tokens[self._pos]}'")
+
+    def evaluate(self, tags: Iterable[str]) -> bool:
+        """Evaluar la expresión contra un conjunto de tags"""
+        tag_set = tags if isinstance(tags, (set, frozenset)) else {normalize_tag(t) for t in tags}
+        return self._eval(self._root, tag_set)
+
+    def __call__(self, tags: Iterable[str]) -> bool:
+        return self.evaluate(tags)
+
+    def __repr__(self) -> str:
+        return f"TagExpression({self.text!r})"
+
+    # ---- Parsing ----
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        return [t for t in re.findall(r'\(|\)|[^\s()]+', text or "")]
+
+    def _peek(self) -> Optional[str]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Expresión de tags inválida '{self.text}': fin inesperado")
+        self._pos += 1
+        return token
+
+    def _parse_or(self):
+        node = self._parse_and()
+        while self._peek() == "or":
+            self._next()
+            node = ("or", node, self._parse_and())
+        return node
+
+    def _parse_and(self):
+        node = self._parse_not()
+        while self._peek() == "and":
+            self._next()
+            node = ("and", node, self._parse_not())
+        return node
+
+    def _parse_not(self):
+        if self._peek() == "not":
+            self._next()
+            return ("not", self._parse_not())
+        return self._parse_atom()
+
+    def _parse_atom(self):
+        token = self._next()
+        if token == "(":
+            node = self._parse_or()
+            if self._next() != ")":
+                raise ValueError(f"Expresión de tags inválida '{self.text}': falta ')'")
+            return node
+        if token in (")", "and", "or"):
+            raise ValueError(f"Expresión de tags inválida '{self.text}': token inesperado '{token}'")
+        return self._parse_legacy_term(token)
+
+    @staticmethod
+    def _parse_legacy_term(token: str):
+        """Término simple: `@tag`, `~@tag` o una lista OR `@a,~@b`"""
+        node = None
+        for part in filter(None, token.split(",")):
+            negated = part.startswith("~")
+            term = ("tag", normalize_tag(part.lstrip("~")))
+            if negated:
+                term = ("not", term)
+            node = term if node is None else ("or", node, term)
+        if node is None:
+            raise ValueError(f"Tag vacío en '{token}'")
+        return node
+
+    # ---- Evaluación ----
+
+    def _eval(self, node, tags: Set[str]) -> bool:
+        kind = node[0]
+        if kind == "tag":
+            return node[1] in tags
+        if kind == "not":
+            return not self._eval(node[1], tags)
+        if kind == "and":
+            return self._eval(node[1], tags) and self._eval(node[2], tags)
+        if kind == "or":
+            return self._eval(node[1], tags) or self._eval(node[2], tags)
+        return True
+
+
+class TagFilter:
+    """
+    Filtro de inclusión/exclusión construido con listas de expresiones
+
+    Un scenario se incluye si cumple todas las expresiones de `tags` (como
+    behave con `--tags` repetidos) y no cumple ninguna de `exclude_tags`.
+    El OR se expresa dentro de un elemento: "@a,@b" o "@a or @b".
+    """
+
+    def __init__(self, tags: List[str] = None, exclude_tags: List[str] = None):
+        self.include = [TagExpression(t) for t in (tags or [])]
+        self.exclude = [TagExpression(t) for t in (exclude_tags or [])]
+
+    @property
+    def is_empty(self) -> bool:
+        """True si el filtro acepta todo"""
+        return not self.include and not self.exclude
+
+    def matches(self, tags: Iterable[str]) -> bool:
+        """Evaluar el filtro contra los tags efectivos de un scenario"""
+        tag_set = {normalize_tag(t) for t in tags}
+        if any(expression.evaluate(tag_set) for expression in self.exclude):
+            return False
+        if self.include:
+            return all(expression.evaluate(tag_set) for expression in self.include)
+        return True
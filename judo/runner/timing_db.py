@@ -0,0 +1,164 @@
+"""
+Timing Database - Duraciones históricas de features y scenarios
+
+Guarda en un archivo JSON pequeño (por defecto `output_dir/.judo_timings.json`)
+la duración de cada feature y scenario de ejecuciones anteriores. El runner la
+usa para ordenar el trabajo de mayor a menor duración y para generar shards
+balanceados.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class TimingDatabase:
+    """
+    Duraciones históricas persistidas en disco
+
+    Las duraciones se suavizan con una media móvil exponencial para que
+    un valor atípico no desbalancee la siguiente ejecución.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, smoothing: float = 0.5):
+        """
+        Inicializar base de tiempos
+
+        Args:
+            path: Archivo JSON donde persistir los tiempos
+            smoothing: Peso de la nueva medición en la media móvil (0-1)
+        """
+        self.path = Path(path)
+        self.smoothing = smoothing
+        self.features: Dict[str, Dict[str, Any]] = {}
+        self.scenarios: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def normalize_path(feature_file) -> str:
+        """Clave estable para un feature: ruta relativa al cwd con separador '/'"""
+        path = str(feature_file)
+        try:
+            path = os.path.relpath(path)
+        except ValueError:
+            pass  # Otra unidad en Windows
+        return path.replace(os.sep, "/")
+
+    @classmethod
+    def scenario_key(cls, feature_file, scenario_name: str) -> str:
+        """Clave de un scenario (por nombre, para tolerar cambios de línea)"""
+        return f"{cls.normalize_path(feature_file)}::{scenario_name.strip()}"
+
+    def load(self):
+        """Cargar tiempos desde disco (un archivo corrupto se ignora)"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.features = data.get("features", {})
+                self.scenarios = data.get("scenarios", {})
+        except (OSError, ValueError):
+            self.features = {}
+            self.scenarios = {}
+
+    def save(self):
+        """Persistir tiempos de forma atómica"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": self.VERSION,
+                "features": self.features,
+                "scenarios": self.scenarios
+            }, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _record(self, table: Dict[str, Dict[str, Any]], key: str, duration: float):
+        entry = table.get(key)
+        if entry is None:
+            table[key] = {"duration": round(duration, 4), "runs": 1}
+        else:
+            smoothed = self.smoothing * duration + (1 - self.smoothing) * entry["duration"]
+            entry["duration"] = round(smoothed, 4)
+            entry["runs"] = entry.get("runs", 0) + 1
+        self._dirty = True
+
+    def record_feature(self, feature_file, duration: float):
+        """Registrar la duración de un feature"""
+        self._record(self.features, self.normalize_path(feature_file), duration)
+
+    def record_scenario(self, feature_file, scenario_name: str, duration: float):
+        """Registrar la duración de un scenario"""
+        self._record(self.scenarios, self.scenario_key(feature_file, scenario_name), duration)
+
+    def derive_feature(self, feature_file, scenario_names: List[str]) -> bool:
+        """
+        Estimar un feature como la suma de las estimaciones de sus scenarios
+
+        Para ejecuciones parciales (filtradas por tags): su duración no es la
+        del feature completo. Si algún scenario no tiene historial no se
+        registra nada (False).
+        """
+        estimates = [self.estimate_scenario(feature_file, name) for name in scenario_names]
+        if not estimates or None in estimates:
+            return False
+        key = self.normalize_path(feature_file)
+        runs = self.features.get(key, {}).get("runs", 0)
+        self.features[key] = {"duration": round(sum(estimates), 4), "runs": runs}
+        self._dirty = True
+        return True
+
+    def record_behave_json(self, json_data: List[Dict[str, Any]]):
+        """
+        Registrar tiempos a partir de la salida JSON de behave
+
+        La duración de un feature es la suma de sus scenarios, así que sirve
+        tanto para ejecuciones por feature como por scenario. Solo se registra
+        tal cual si se ejecutaron todos sus scenarios; si no (ej. --tags), se
+        deriva de las estimaciones de cada scenario (ver derive_feature).
+        """
+        for feature in json_data or []:
+            feature_file = feature.get("location", "").rsplit(":", 1)[0]
+            if not feature_file:
+                continue
+
+            feature_duration = 0.0
+            executed = False
+            complete = True
+            scenario_names = []
+            for element in feature.get("elements", []):
+                if element.get("type") == "background":
+                    continue
+                scenario_names.append(element.get("name", ""))
+                results = [s.get("result") for s in element.get("steps", []) if s.get("result")]
+                if not results or all(r.get("status") == "skipped" for r in results):
+                    complete = False
+                    continue  # Scenario no ejecutado
+                duration = sum(r.get("duration", 0) for r in results)
+                self.record_scenario(feature_file, element.get("name", ""), duration)
+                feature_duration += duration
+                executed = True
+
+            if executed and complete:
+                self.record_feature(feature_file, feature_duration)
+            elif executed:
+                self.derive_feature(feature_file, scenario_names)
+
+    def estimate_feature(self, feature_file) -> Optional[float]:
+        """Duración esperada de un feature (None si no hay historial)"""
+        entry = self.features.get(self.normalize_path(feature_file))
+        return entry["duration"] if entry else None
+
+    def estimate_scenario(self, feature_file, scenario_name: str) -> Optional[float]:
+        """Duración esperada de un scenario (None si no hay historial)"""
+        entry = self.scenarios.get(self.scenario_key(feature_file, scenario_name))
+        return entry["duration"] if entry else None
@@ -0,0 +1,316 @@
+"""
+Worker Pool - Procesos persistentes de behave para ejecución paralela
+
+En lugar de lanzar un intérprete nuevo (`python -m behave`) por cada feature,
+el pool mantiene un número fijo de procesos que ya tienen importados behave,
+requests, jsonschema y el paquete judo (incluyendo el registro de steps).
+Los features se envían a los workers por un pipe y los resultados vuelven
+por el mismo canal a medida que terminan.
+"""
+
+import io
+import os
+import sys
+import time
+import traceback
+import multiprocessing
+from collections import deque
+from contextlib import redirect_stdout, redirect_stderr
+from multiprocessing.connection import wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+def _get_mp_context():
+    """
+    Obtener el contexto de multiprocessing
+
+    Se prefiere 'fork' cuando está disponible: el worker hereda los módulos
+    ya importados y no necesita re-importar el script del runner del usuario.
+    En Windows solo existe 'spawn' (el runner debe usar `if __name__ == "__main__":`).
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def _reset_judo_state():
+    """Dejar el estado global de Judo como en un proceso recién iniciado"""
+    from ..reporting.reporter import reset_reporter
+    reset_reporter()
+
+    import judo.behave.auto_hooks as auto_hooks_module
+    auto_hooks_module._reporter = None
+    auto_hooks_module._report_generated = False
+
+
+def _run_behave_in_process(args: List[str], capture_output: bool) -> Dict[str, Any]:
+    """Ejecutar behave dentro del proceso actual y devolver el resultado"""
+    from behave.__main__ import main as behave_main
+
+    _reset_judo_state()
+
+    stdout_buffer = io.StringIO() if capture_output else None
+    stderr_buffer = io.StringIO() if capture_output else None
+    start_time = time.time()
+
+    try:
+        if capture_output:
+            with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
+                returncode = behave_main(list(args))
+        else:
+            returncode = behave_main(list(args))
+            sys.stdout.flush()
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else 1
+    except Exception:
+        returncode = 1
+        error_text = traceback.format_exc()
+        if stderr_buffer is not None:
+            stderr_buffer.write(error_text)
+        else:
+            sys.stderr.write(error_text)
+
+    return {
+        "returncode": returncode or 0,
+        "stdout": stdout_buffer.getvalue() if stdout_buffer else "",
+        "stderr": stderr_buffer.getvalue() if stderr_buffer else "",
+        "duration": time.time() - start_time
+    }
+
+
+def _worker_main(conn, cwd: str, env: Dict[str, str]):
+    """
+    Bucle principal de un worker
+
+    Protocolo (mensajes pickled sobre el pipe):
+    - Padre -> worker: {"id": ..., "args": [...], "capture_output": bool} o None para terminar
+    - Worker -> padre: {"type": "ready"} al iniciar y {"type": "result", "id": ..., ...} por tarea
+    """
+    os.chdir(cwd)
+    os.environ.update(env)
+
+    # Precargar behave y los steps de Judo una sola vez por proceso
+    try:
+        import behave.__main__  # noqa: F401
+        import judo.behave  # noqa: F401
+    except Exception:
+        traceback.print_exc()
+
+    conn.send({"type": "ready", "pid": os.getpid()})
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError, KeyboardInterrupt):
+            break
+
+        if task is None:
+            break
+
+        result = _run_behave_in_process(task["args"], task.get("capture_output", False))
+        result["type"] = "result"
+        result["id"] = task["id"]
+
+        try:
+            conn.send(result)
+        except (BrokenPipeError, OSError):
+            break
+
+    conn.close()
+
+
+class _Worker:
+    """Proceso worker y su extremo del pipe"""
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.task: Optional[Dict[str, Any]] = None
+        self.started_at: float = 0.0
+
+
+class BehaveWorkerPool:
+    """
+    Pool fijo de procesos behave de larga vida
+
+    Ejemplo:
+        with BehaveWorkerPool(size=4, timeout=300) as pool:
+            for result in pool.imap_unordered(tasks):
+                ...
+    """
+
+    def __init__(self, size: int = 4, timeout: Optional[float] = None,
+                 cwd: str = None, env: Dict[str, str] = None):
+        """
+        Inicializar pool
+
+        Args:
+            size: Número de procesos worker
+            timeout: Timeout en segundos por tarea (None = sin límite)
+            cwd: Directorio de trabajo de los workers (default: cwd actual)
+            env: Variables de entorno para los workers (default: os.environ)
+        """
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.cwd = cwd or os.getcwd()
+        self.env = dict(env if env is not None else os.environ)
+        self._context = _get_mp_context()
+        self._workers: List[_Worker] = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.shutdown()
+
+    def start(self):
+        """Iniciar los procesos worker (la carga de behave ocurre en paralelo)"""
+        new_workers = []
+        while len(self._workers) + len(new_workers) < self.size:
+            new_workers.append(self._spawn_worker(wait_ready=False))
+        for worker in new_workers:
+            self._wait_ready(worker)
+        self._workers.extend(new_workers)
+        return self
+
+    def _spawn_worker(self, wait_ready: bool = True) -> _Worker:
+        """Crear un worker, opcionalmente esperando a que tenga behave cargado"""
+        parent_conn, child_conn = self._context.Pipe(duplex=True)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.cwd, self.env),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        worker = _Worker(process, parent_conn)
+        if wait_ready:
+            self._wait_ready(worker)
+        return worker
+
+    @staticmethod
+    def _wait_ready(worker: _Worker):
+        """Esperar el mensaje "ready" del worker"""
+        try:
+            worker.conn.recv()
+        except (EOFError, OSError):
+            pass
+
+    def _replace_worker(self, worker: _Worker) -> _Worker:
+        """Terminar un worker (colgado o caído) y reemplazarlo"""
+        try:
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.process.join(timeout=5)
+        except Exception:
+            pass
+        try:
+            worker.conn.close()
+        except Exception:
+            pass
+
+        new_worker = self._spawn_worker()
+        self._workers[self._workers.index(worker)] = new_worker
+        return new_worker
+
+    def imap_unordered(self, tasks: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Ejecutar tareas en el pool y devolver resultados a medida que terminan
+
+        Args:
+            tasks: Tareas con formato {"id": ..., "args": [...], "capture_output": bool}
+
+        Yields:
+            Resultados con formato {"id", "returncode", "stdout", "stderr", "duration"}
+        """
+        if not self._workers:
+            self.start()
+
+        pending = deque(tasks)
+        idle = deque(self._workers)
+        busy: Dict[Any, _Worker] = {}
+
+        while pending or busy:
+            # Asignar tareas a workers libres
+            while pending and idle:
+                worker = idle.popleft()
+                task = pending.popleft()
+                worker.task = task
+                worker.started_at = time.time()
+                try:
+                    worker.conn.send(task)
+                    busy[worker.conn] = worker
+                except (BrokenPipeError, OSError):
+                    pending.appendleft(task)
+                    idle.append(self._replace_worker(worker))
+
+            ready = wait(list(busy), timeout=self._next_wait_timeout(busy.values()))
+
+            for conn in ready:
+                worker = busy.pop(conn)
+                task = worker.task
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    exitcode = worker.process.exitcode
+                    idle.append(self._replace_worker(worker))
+                    yield self._error_result(task, worker, f"Worker terminó inesperadamente (exit code {exitcode})")
+                    continue
+
+                if message.get("type") != "result":
+                    busy[conn] = worker
+                    continue
+
+                worker.task = None
+                idle.append(worker)
+                yield message
+
+            # Verificar timeouts
+            if self.timeout:
+                now = time.time()
+                for conn, worker in list(busy.items()):
+                    if now - worker.started_at > self.timeout:
+                        busy.pop(conn)
+                        task = worker.task
+                        idle.append(self._replace_worker(worker))
+                        yield self._error_result(task, worker, f"Timeout after {self.timeout} seconds")
+
+    def _next_wait_timeout(self, busy_workers) -> Optional[float]:
+        """Calcular cuánto esperar antes de revisar timeouts"""
+        if not self.timeout:
+            return None
+        now = time.time()
+        remaining = [self.timeout - (now - w.started_at) for w in busy_workers]
+        return max(0.0, min(remaining)) if remaining else None
+
+    @staticmethod
+    def _error_result(task: Dict[str, Any], worker: _Worker, message: str) -> Dict[str, Any]:
+        """Resultado para una tarea que no terminó normalmente"""
+        return {
+            "type": "result",
+            "id": task["id"] if task else None,
+            "returncode": -1,
+            "stdout": "",
+            "stderr": message,
+            "duration": time.time() - worker.started_at
+        }
+
+    def shutdown(self):
+        """Detener todos los workers"""
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except Exception:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(timeout=5)
+            try:
+                worker.conn.close()
+            except Exception:
+                pass
+        self._workers = []
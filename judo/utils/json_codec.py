@@ -0,0 +1,200 @@
+"""
+JSON Codec - Pluggable JSON backend (orjson / ujson / stdlib json)
+
+Judo parses and serializes a lot of JSON: response bodies, saved
+request/response files, report data and Cucumber JSON. This module picks
+the fastest installed backend and falls back to the stdlib for anything
+the backend cannot handle, so results are the same as json: datetimes and
+dataclasses go through the caller's default, and NaN/Infinity are written
+by the stdlib (orjson would write null). The one remaining difference is
+that orjson serializes UUID and Enum values itself (a UUID as str(uuid),
+an Enum as its value) where json needs a default.
+
+Backend selection: JUDO_JSON_BACKEND=auto|orjson|ujson|json (default: auto,
+which prefers orjson, then ujson). Install with pip install judo-framework[fastjson].
+
+Run `python -m judo.utils.json_codec` to benchmark the installed backends.
+"""
+
+import json
+import math
+import os
+import time
+from typing import Any, Callable, Dict, IO, Optional, Union
+
+
+_BACKENDS = ("orjson", "ujson", "json")
+
+
+def _import_backend(name: str):
+    if name == "json":
+        return json
+    try:
+        return __import__(name)
+    except ImportError:
+        return None
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True if a NaN/Infinity float is nested anywhere in dicts/lists/tuples"""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+class JsonCodec:
+    """loads/dumps on top of one backend with stdlib fallback"""
+
+    def __init__(self, backend: str = "auto"):
+        backend = (backend or "auto").lower()
+        if backend == "auto":
+            for name in _BACKENDS:
+                if _import_backend(name) is not None:
+                    backend = name
+                    break
+        module = _import_backend(backend) if backend in _BACKENDS else None
+        if module is None:
+            raise ImportError(f"JSON backend '{backend}' is not available")
+        self.name = backend
+        self._module = module
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Parse JSON text or UTF-8/16/32 bytes"""
+        if self.name != "json":
+            try:
+                return self._module.loads(data)
+            except Exception:
+                # Non UTF-8 bytes, huge ints, etc.: stdlib decides (and raises JSONDecodeError)
+                pass
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, ensure_ascii: bool = False,
+              default: Callable = None, sort_keys: bool = False) -> str:
+        """Serialize to str (ensure_ascii defaults to False, unlike json.dumps)"""
+        if self.name == "orjson" and not ensure_ascii and indent in (None, 0, 2):
+            import orjson
+            # Like json: datetimes and dataclasses are the caller's default's business
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                data = orjson.dumps(obj, default=default, option=option)
+                # orjson writes NaN/Infinity as null; only look for them when a null was written
+                if b"null" not in data or not _has_non_finite(obj):
+                    return data.decode("utf-8")
+            except (TypeError, orjson.JSONEncodeError):
+                pass
+        elif self.name == "ujson" and default is None:
+            try:
+                return self._module.dumps(obj, indent=indent or 0, ensure_ascii=ensure_ascii,
+                                          sort_keys=sort_keys, escape_forward_slashes=False)
+            except (TypeError, OverflowError):
+                pass
+        return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii, default=default,
+                          sort_keys=sort_keys)
+
+    def load(self, fp: IO) -> Any:
+        """Parse JSON from a file object"""
+        return self.loads(fp.read())
+
+    def dump(self, obj: Any, fp: IO, **kwargs) -> None:
+        """Serialize to a text file object (same options as dumps)"""
+        fp.write(self.dumps(obj, **kwargs))
+
+
+_codec: Optional[JsonCodec] = None
+
+
+def get_codec() -> JsonCodec:
+    """Process-wide codec (created on first use)"""
+    global _codec
+    if _codec is None:
+        _codec = JsonCodec(os.getenv("JUDO_JSON_BACKEND", "auto"))
+    return _codec
+
+
+def set_backend(name: str) -> JsonCodec:
+    """Switch the process-wide backend: auto, orjson, ujson or json"""
+    global _codec
+    _codec = JsonCodec(name)
+    return _codec
+
+
+def backend_name() -> str:
+    """Name of the active backend"""
+    return get_codec().name
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    return get_codec().loads(data)
+
+
+def dumps(obj: Any, **kwargs) -> str:
+    return get_codec().dumps(obj, **kwargs)
+
+
+def load(fp: IO) -> Any:
+    return get_codec().load(fp)
+
+
+def dump(obj: Any, fp: IO, **kwargs) -> None:
+    get_codec().dump(obj, fp, **kwargs)
+
+
+def benchmark(items: int = 20000, rounds: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Time loads/dumps of a large API-like payload with every installed backend
+
+    Returns:
+        {backend: {"loads_ms": ..., "dumps_ms": ..., "dumps_indent_ms": ...}}
+    """
+    payload = [{
+        "id": i,
+        "name": f"user-{i}",
+        "email": f"user{i}@example.com",
+        "active": i % 2 == 0,
+        "score": i * 1.5,
+        "tags": ["a", "b", "c"],
+        "address": {"street": f"Calle {i}", "city": "Santiago", "zip": str(10000 + i)}
+    } for i in range(items)]
+    encoded = json.dumps(payload).encode("utf-8")
+
+    def best(fn) -> float:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return round(min(timings) * 1000, 2)
+
+    results = {}
+    for name in _BACKENDS:
+        if _import_backend(name) is None:
+            continue
+        codec = JsonCodec(name)
+        results[name] = {
+            "loads_ms": best(lambda: codec.loads(encoded)),
+            "dumps_ms": best(lambda: codec.dumps(payload)),
+            "dumps_indent_ms": best(lambda: codec.dumps(payload, indent=2)),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    results = benchmark()
+    baseline = results["json"]
+    print(f"{'backend':<8} {'loads':>10} {'dumps':>10} {'dumps(indent=2)':>16}")
+    for name, timing in results.items():
+        print(f"{name:<8} {timing['loads_ms']:>8}ms {timing['dumps_ms']:>8}ms {timing['dumps_indent_ms']:>14}ms"
+              f"   x{baseline['loads_ms'] / timing['loads_ms']:.1f} loads,"
+              f" x{baseline['dumps_indent_ms'] / timing['dumps_indent_ms']:.1f} dumps")
@@ -53,6 +53,10 @@ setup(
         "excel": ["openpyxl>=3.0.0"],
         "websocket": ["websockets>=10.0"],
         "graphql": ["graphql-core>=3.2.0"],
+        "async": ["aiohttp>=3.8.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "fastjson": ["orjson>=3.9.0"],
+        "fastschema": ["fastjsonschema>=2.16"],
         "genai": [
             "openai>=1.0.0",
             "anthropic>=0.20.0",
@@ -68,6 +72,10 @@ setup(
             "openpyxl>=3.0.0",
             "websockets>=10.0",
             "graphql-core>=3.2.0",
+            "aiohttp>=3.8.0",
+            "httpx[http2]>=0.24.0",
+            "orjson>=3.9.0",
+            "fastjsonschema>=2.16",
             "openai>=1.0.0",
             "anthropic>=0.20.0",
             "google-generativeai>=0.5.0",
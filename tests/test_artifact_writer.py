@@ -0,0 +1,71 @@
+"""
+Tests for the background request/response artifact writer
+"""
+
+import gzip
+import json
+
+import pytest
+
+from judo.reporting.artifact_writer import NDJSON_FILENAME, ArtifactWriter
+
+
+def _ndjson(path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_files_format_after_flush(tmp_path):
+    writer = ArtifactWriter(fmt="files", async_mode=True)
+    try:
+        for number in range(1, 4):
+            writer.submit(tmp_path / "scenario", f"{number:02d}_GET", {"n": number}, {"status_code": 200})
+        assert writer.flush(timeout=5)
+
+        assert json.loads((tmp_path / "scenario" / "02_GET_request.json").read_text(encoding="utf-8")) == {"n": 2}
+        assert json.loads((tmp_path / "scenario" / "03_GET_response.json").read_text(encoding="utf-8")) == \
+            {"status_code": 200}
+        assert writer.stats()["written"] == 3
+        assert writer.stats()["pending"] == 0
+    finally:
+        writer.close()
+
+
+@pytest.mark.parametrize("fmt, filename", [("ndjson", NDJSON_FILENAME), ("ndjson.gz", NDJSON_FILENAME + ".gz")])
+def test_ndjson_formats_append_one_record_per_request(tmp_path, fmt, filename):
+    writer = ArtifactWriter(fmt=fmt, async_mode=True, batch_size=2)
+    for number in range(5):
+        writer.submit(tmp_path, f"{number:02d}_POST", {"body": {"n": number}}, {"status_code": 201})
+    writer.close()
+
+    records = _ndjson(tmp_path / filename)
+    assert [record["id"] for record in records] == [f"{number:02d}_POST" for number in range(5)]
+    assert records[4] == {"id": "04_POST", "request": {"body": {"n": 4}}, "response": {"status_code": 201}}
+
+
+def test_data_changed_after_submit_is_not_saved(tmp_path):
+    writer = ArtifactWriter(fmt="ndjson", async_mode=True)
+    request = {"items": [1]}
+    writer.submit(tmp_path, "01_POST", request, {"body": request})
+    request["items"].append(2)
+    writer.close()
+
+    record = _ndjson(tmp_path / NDJSON_FILENAME)[0]
+    assert record["request"] == {"items": [1]}
+    assert record["response"] == {"body": {"items": [1]}}
+
+
+def test_submit_after_close_writes_synchronously(tmp_path):
+    writer = ArtifactWriter(fmt="files", async_mode=True)
+    writer.close()
+    writer.close()
+
+    writer.submit(tmp_path, "01_GET", {}, {})
+    assert (tmp_path / "01_GET_request.json").exists()
+    assert writer.flush(timeout=1)
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        ArtifactWriter(fmt="xml")
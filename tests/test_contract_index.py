@@ -0,0 +1,35 @@
+"""
+Tests for the OpenAPI path template index
+"""
+
+from judo.features.contract import OperationIndex
+
+
+def _index(*templates):
+    return OperationIndex({"paths": {template: {"get": {}} for template in templates}})
+
+
+def test_first_declared_template_wins():
+    assert _index("/users/{id}", "/users/me").find_path("/users/me") == "/users/{id}"
+    assert _index("/users/me", "/users/{id}").find_path("/users/me") == "/users/me"
+    assert _index("/users/{id}", "/users/me").find_path("/users/42") == "/users/{id}"
+
+
+def test_params_match_one_non_empty_segment():
+    index = _index("/users/{id}/orders/{order}", "/users")
+
+    assert index.find_path("/users/1/orders/2") == "/users/{id}/orders/{order}"
+    assert index.find_path("/users") == "/users"
+    assert index.find_path("/users//orders/2") is None
+    assert index.find_path("/users/1/orders") is None
+    assert index.find_path("/other") is None
+
+
+def test_find_operation():
+    index = _index("/users/{id}")
+
+    template, path_item, operation = index.find_operation("GET", "/users/7")
+    assert template == "/users/{id}"
+    assert operation == {}
+    assert index.find_operation("POST", "/users/7")[2] is None
+    assert index.find_operation("GET", "/nothing") == (None, None, None)
@@ -0,0 +1,35 @@
+"""
+Tests for connection pool settings
+"""
+
+import pytest
+
+from judo.http.pool import HttpPoolConfig
+
+
+def test_settings_come_from_the_http_pool_section(monkeypatch):
+    monkeypatch.setenv("JUDO_HTTP_POOL_MAXSIZE", "20")
+    monkeypatch.setenv("JUDO_HTTP_MAX_RETRIES", "2")
+
+    config = HttpPoolConfig.from_config({"http_pool": {"max_retries": 5, "http2": "true"},
+                                         "pool_connections": 99})
+
+    assert config.pool_maxsize == 20
+    assert config.max_retries == 5
+    assert config.http2 is True
+    # Unrelated top-level keys are not pool settings
+    assert config.pool_connections == 10
+
+
+def test_malformed_values_fall_back_to_defaults(monkeypatch):
+    monkeypatch.setenv("JUDO_HTTP_POOL_MAXSIZE", "abc")
+
+    with pytest.warns(RuntimeWarning) as warned:
+        config = HttpPoolConfig.from_config({"http_pool": {"max_connections": "many"}})
+
+    messages = " ".join(str(warning.message) for warning in warned)
+    assert "JUDO_HTTP_POOL_MAXSIZE" in messages
+    assert 'config["http_pool"]["max_connections"]' in messages
+
+    assert config.pool_maxsize == 10
+    assert config.max_connections == 0
@@ -0,0 +1,23 @@
+"""
+Tests for the JSONPath fast path against jsonpath_ng
+"""
+
+import pytest
+from jsonpath_ng import parse
+
+from judo.core.jsonpath import CompiledJsonPath, _parse_simple
+
+
+DATA = {"name": "judo", "items": [{"id": 1}, {"id": 2}], "empty": "", "nested": {"list": [[5, 6]]}}
+
+
+@pytest.mark.parametrize("path", [
+    "$.name", "$.items[1].id", "$.items[5]", "$.missing.id", "$.nested.list[0][1]",
+    "$.name[0]", "$.name[10]", "$.empty[0]", "$.name.id"
+])
+def test_fast_path_matches_jsonpath_ng(path):
+    simple = _parse_simple(path)
+
+    assert simple is not None
+    assert simple.find_values(DATA) == [match.value for match in parse(path).find(DATA)]
+    assert simple.find_values(DATA) == CompiledJsonPath(path).find_values(DATA)
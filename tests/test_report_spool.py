@@ -0,0 +1,139 @@
+"""
+Tests for report spools, artifact merging and Cucumber JSON conversion
+"""
+
+import json
+
+from judo.reporting.report_data import ReportData, ScenarioStatus, StepStatus
+from judo.reporting.report_merge import cucumber_to_artifact, feature_from_cucumber, merge_reports
+from judo.reporting.report_spool import INTERRUPTED, ReportSpool, SpooledReport, write_report_artifact
+
+
+def _report(feature_name="Users", file_path="features/users.feature", scenarios=(("List users", True),)):
+    report = ReportData(title="Run")
+    feature = report.add_feature(feature_name, file_path=file_path)
+    for name, passed in scenarios:
+        scenario = feature.add_scenario(name, tags=["@api"])
+        scenario.add_background_step("Given the API is up").finish(StepStatus.PASSED)
+        scenario.add_step("When I call it").finish(StepStatus.PASSED)
+        if passed:
+            scenario.add_step("Then it works").finish(StepStatus.PASSED)
+            scenario.finish(ScenarioStatus.PASSED)
+        else:
+            scenario.add_step("Then it works").finish(StepStatus.FAILED, "expected 200")
+            scenario.finish(ScenarioStatus.FAILED, "expected 200")
+    feature.finish()
+    report.finish()
+    return report
+
+
+def test_artifact_round_trip_keeps_features_and_summary(tmp_path):
+    report = _report(scenarios=(("List users", True), ("Create user", False)))
+
+    spooled = SpooledReport(write_report_artifact(report, tmp_path / "run.ndjson"))
+    features = list(spooled.iter_features())
+
+    assert spooled.title == "Run"
+    assert [s.name for s in features[0].scenarios] == ["List users", "Create user"]
+    assert [s.step_text for s in features[0].scenarios[1].steps] == ["When I call it", "Then it works"]
+    assert features[0].scenarios[1].steps[1].error_message == "expected 200"
+    assert spooled.get_summary() == report.get_summary()
+
+
+def test_truncated_spool_reports_unfinished_scenario_as_interrupted(tmp_path):
+    report = _report()
+    feature = report.features[0]
+    scenario = feature.scenarios[0]
+    path = tmp_path / "crashed.ndjson"
+    spool = ReportSpool(path)
+    spool.write_run(report)
+    spool.write_feature(1, feature)
+    spool.write_scenario(2, 1, scenario)
+    spool.write_step(2, 0, False, scenario.steps[0])
+    spool.close()
+    # The process died while writing the next line
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "step", "scenario": 2, "index": 1, "backgr')
+
+    spooled = SpooledReport(path)
+    features = list(spooled.iter_features())
+
+    assert len(features) == 1
+    interrupted = features[0].scenarios[0]
+    assert interrupted.status == ScenarioStatus.FAILED
+    assert interrupted.error_message == INTERRUPTED
+    assert [s.step_text for s in interrupted.steps] == ["When I call it"]
+    summary = spooled.get_summary()
+    assert summary["scenario_counts"]["failed"] == 1
+    assert summary["total_steps"] == 1
+
+
+def test_merge_features_combines_a_feature_run_on_several_workers(tmp_path):
+    first = write_report_artifact(_report(scenarios=(("List users", True),)), tmp_path / "w1.ndjson")
+    second = write_report_artifact(_report(scenarios=(("Create user", False),)), tmp_path / "w2.ndjson")
+    other = write_report_artifact(_report("Orders", "features/orders.feature"), tmp_path / "w3.ndjson")
+
+    merged = SpooledReport([first, other, second], merge_features=True)
+    features = list(merged.iter_features())
+
+    assert sorted(f.name for f in features) == ["Orders", "Users"]
+    users = next(f for f in features if f.name == "Users")
+    assert [s.name for s in users.scenarios] == ["List users", "Create user"]
+
+    summary = merged.get_summary()
+    assert summary["total_features"] == 2
+    assert summary["total_scenarios"] == sum(len(f.scenarios) for f in features) == 3
+    assert summary["scenario_counts"] == {"passed": 2, "failed": 1, "skipped": 0}
+    assert summary["total_steps"] == 9
+    # Without merging, each worker's part is a feature of its own
+    assert SpooledReport([first, other, second]).get_summary()["total_features"] == 3
+
+
+def _cucumber_feature(duration):
+    return {
+        "name": "Users",
+        "uri": "features/users.feature",
+        "tags": [{"name": "@api"}],
+        "elements": [
+            {"type": "background", "keyword": "Background", "name": "",
+             "steps": [{"keyword": "Given ", "name": "the API is up",
+                        "result": {"status": "passed", "duration": duration}}]},
+            {"type": "scenario", "keyword": "Scenario", "name": "List users",
+             "steps": [{"keyword": "When ", "name": "I call it",
+                        "result": {"status": "failed", "duration": duration,
+                                   "error_message": ["expected 200", "got 500"]}}]},
+            {"type": "scenario", "keyword": "Scenario", "name": "Not run",
+             "steps": [{"keyword": "When ", "name": "I skip it"}]}
+        ]
+    }
+
+
+def test_cucumber_durations_in_nanoseconds_and_seconds():
+    from_cucumber = feature_from_cucumber(_cucumber_feature(1_500_000_000))
+    from_behave = feature_from_cucumber(_cucumber_feature(1.5))
+
+    for feature in (from_cucumber, from_behave):
+        assert [s.name for s in feature.scenarios] == ["List users"]
+        scenario = feature.scenarios[0]
+        assert scenario.status == ScenarioStatus.FAILED
+        assert scenario.steps[0].error_message == "expected 200\ngot 500"
+        assert [s.step_text for s in scenario.background_steps] == ["Given the API is up"]
+        assert scenario.duration == 3.0
+        assert feature.duration == 3.0
+
+
+def test_merge_reports_accepts_artifacts_and_cucumber_json(tmp_path):
+    artifact = write_report_artifact(_report("Orders", "features/orders.feature"), tmp_path / "w1.ndjson")
+    cucumber = tmp_path / "cucumber.json"
+    cucumber.write_text(json.dumps([_cucumber_feature(1_000_000_000)]), encoding="utf-8")
+
+    outputs = merge_reports([artifact, cucumber], tmp_path / "out", html=None)
+
+    assert set(outputs) == {"junit", "cucumber"}
+    junit = (tmp_path / "out" / "junit.xml").read_text(encoding="utf-8")
+    assert 'tests="2" failures="1"' in junit
+    merged = json.loads((tmp_path / "out" / "cucumber-consolidated.json").read_text(encoding="utf-8"))
+    assert sorted(feature["name"] for feature in merged) == ["Orders", "Users"]
+
+    converted = SpooledReport(cucumber_to_artifact(cucumber, tmp_path / "c.ndjson"))
+    assert converted.get_summary()["scenario_counts"]["failed"] == 1
@@ -0,0 +1,34 @@
+"""
+Tests for static shard partitioning
+"""
+
+from judo.runner.scheduler import parse_shard, partition_shards
+
+
+FEATURES = [f"features/f{i}.feature" for i in range(7)]
+
+
+def test_path_split_covers_every_feature_once():
+    shards = partition_shards(FEATURES, None, 3)
+
+    assert sorted(f for shard in shards for f in shard) == sorted(FEATURES)
+    assert [len(shard) for shard in shards] == [3, 2, 2]
+
+
+def test_path_split_ignores_discovery_order():
+    shards = partition_shards(FEATURES, None, 3)
+    reversed_shards = partition_shards(list(reversed(FEATURES)), None, 3)
+
+    assert [sorted(shard) for shard in shards] == [sorted(shard) for shard in reversed_shards]
+
+
+def test_timings_balance_the_load():
+    timings = {"features/f0.feature": 10.0, "features/f1.feature": 4.0,
+               "features/f2.feature": 3.0, "features/f3.feature": 3.0}
+    shards = partition_shards(FEATURES[:4], timings.get, 2)
+
+    assert shards == [["features/f0.feature"], ["features/f1.feature", "features/f2.feature", "features/f3.feature"]]
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
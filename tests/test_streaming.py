@@ -0,0 +1,81 @@
+"""
+Tests for incremental reading of streamed response bodies
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from judo.core.streaming import StreamingJudoResponse
+
+
+class FakeResponse:
+    """The parts of requests.Response a streamed body uses"""
+
+    def __init__(self, body: bytes, chunk_size: int):
+        self.chunks = [body[start:start + chunk_size] for start in range(0, len(body), chunk_size)]
+        self.encoding = "utf-8"
+        self.headers = {"Content-Type": "application/json"}
+        self.closed = False
+        # Set by StreamingJudoResponse.content, as on requests.Response
+        self._content = None
+
+    @property
+    def content(self):
+        return self._content
+
+    def iter_content(self, chunk_size=None):
+        yield from self.chunks
+
+    def close(self):
+        self.closed = True
+
+
+ITEMS = [1.5, -20, 3e10, "a,b]", "tildé \\" + '"q"', {"k": [1, 2]}, None, True, 12345678901234567890]
+BODY = json.dumps(ITEMS).encode("utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+def test_json_items_split_across_chunk_boundaries(chunk_size):
+    response = StreamingJudoResponse(FakeResponse(BODY, chunk_size))
+
+    assert list(response.iter_json_items()) == ITEMS
+    assert response.bytes_read == len(BODY)
+    assert response.hexdigest() == hashlib.sha256(BODY).hexdigest()
+
+
+def test_multibyte_character_split_between_chunks():
+    body = json.dumps(["ñandú", "€"], ensure_ascii=False).encode("utf-8")
+    response = StreamingJudoResponse(FakeResponse(body, 1))
+
+    assert list(response.iter_json_items()) == ["ñandú", "€"]
+
+
+def test_empty_array_and_not_an_array():
+    assert list(StreamingJudoResponse(FakeResponse(b" [ ] ", 1)).iter_json_items()) == []
+    with pytest.raises(ValueError):
+        list(StreamingJudoResponse(FakeResponse(b'{"a": 1}', 2)).iter_json_items())
+    with pytest.raises(ValueError):
+        list(StreamingJudoResponse(FakeResponse(b"[1, 2", 2)).iter_json_items())
+
+
+def test_spooled_body_can_be_read_again():
+    response = StreamingJudoResponse(FakeResponse(BODY, 4), spool=True)
+
+    assert list(response.iter_json_items()) == ITEMS
+    assert response.content == BODY
+    assert response.json == ITEMS
+
+
+def test_partial_read_is_not_returned_as_the_body():
+    fake = FakeResponse(BODY, 4)
+    response = StreamingJudoResponse(fake, spool=True)
+    for _ in response.iter_bytes():
+        break
+    assert fake.closed
+
+    with pytest.raises(RuntimeError):
+        response.content
+    with pytest.raises(RuntimeError):
+        list(response.iter_bytes())
@@ -0,0 +1,48 @@
+"""
+Tests for tag expressions and the include/exclude tag filter
+"""
+
+import pytest
+
+from judo.runner.tag_expression import TagExpression, TagFilter
+
+
+def test_multiple_include_tags_are_anded_like_behave():
+    tag_filter = TagFilter(["@smoke", "@api"])
+
+    assert tag_filter.matches(["@smoke", "@api"])
+    assert tag_filter.matches(["smoke", "api", "slow"])
+    assert not tag_filter.matches(["@smoke"])
+    assert not tag_filter.matches(["@api"])
+
+
+def test_or_inside_a_single_item():
+    assert TagFilter(["@smoke,@api"]).matches(["@api"])
+    assert TagFilter(["@smoke or @api"]).matches(["@smoke"])
+    assert not TagFilter(["@smoke,@api", "@fast"]).matches(["@smoke"])
+    assert TagFilter(["@smoke,@api", "@fast"]).matches(["@api", "@fast"])
+
+
+def test_exclude_tags_win():
+    tag_filter = TagFilter(["@smoke"], ["@slow"])
+
+    assert tag_filter.matches(["@smoke"])
+    assert not tag_filter.matches(["@smoke", "@slow"])
+
+
+def test_empty_filter_accepts_everything():
+    assert TagFilter().is_empty
+    assert TagFilter().matches([])
+
+
+def test_boolean_expression():
+    expression = TagExpression("@smoke and (@api or not @slow)")
+
+    assert expression.evaluate(["@smoke", "@api", "@slow"])
+    assert expression.evaluate(["@smoke"])
+    assert not expression.evaluate(["@smoke", "@slow"])
+
+
+def test_invalid_expression():
+    with pytest.raises(ValueError):
+        TagExpression("@smoke and")
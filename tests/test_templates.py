@@ -0,0 +1,51 @@
+"""
+Tests for compiled templates and cached JSON bodies
+"""
+
+import json
+
+from judo.core.templates import MISSING, DataTemplate, compile_json, render
+
+
+VARIABLES = {"id": 7, "name": 'Ana "A"', "city": "Lima"}
+
+
+def resolve(name):
+    return VARIABLES.get(name, MISSING)
+
+
+def test_json_body_is_parsed_and_compiled_once():
+    text = '{"user": {"id": "{id}", "city": "{city}"}, "items": [1, 2, 3], "note": "{unknown}"}'
+
+    template = compile_json(text)
+    assert compile_json(text) is template
+
+    first = template.render(resolve)
+    second = template.render(resolve)
+    assert first == {"user": {"id": "7", "city": "Lima"}, "items": [1, 2, 3], "note": "{unknown}"}
+    assert first == second
+    # Subtrees without placeholders are shared, not rebuilt
+    assert first["items"] is second["items"] is template.data["items"]
+
+
+def test_json_body_matches_text_interpolation():
+    text = '{"id": "{id}", "tags": ["{city}", "x"]}'
+
+    assert compile_json(text).render(resolve) == json.loads(render(text, resolve))
+
+
+def test_values_are_not_json_escaped_by_hand():
+    assert compile_json('{"name": "{name}"}').render(resolve) == {"name": 'Ana "A"'}
+
+
+def test_text_that_is_only_json_after_interpolation():
+    assert compile_json('{"id": {id}}') is None
+    assert compile_json('{"{name}": 1}') is None
+
+
+def test_data_template_without_placeholders_is_static():
+    data = {"a": [1, 2], "b": "plain"}
+    template = DataTemplate(data)
+
+    assert template.is_static
+    assert template.render(resolve) is data
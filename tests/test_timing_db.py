@@ -0,0 +1,54 @@
+"""
+Tests for the historical timings database
+"""
+
+from judo.runner.timing_db import TimingDatabase
+
+
+def _behave_json(durations):
+    """behave JSON for features/users.feature; None marks a scenario that did not run"""
+    elements = [{"type": "background", "steps": [{"result": {"status": "passed", "duration": 100.0}}]}]
+    for name, duration in durations.items():
+        if duration is None:
+            steps = [{"result": {"status": "skipped", "duration": 0}}, {}]
+        else:
+            steps = [{"result": {"status": "passed", "duration": duration}}]
+        elements.append({"type": "scenario", "name": name, "steps": steps})
+    return [{"location": "features/users.feature:1", "elements": elements}]
+
+
+def test_full_run_records_the_feature(tmp_path):
+    db = TimingDatabase(str(tmp_path / "timings.json"))
+    db.record_behave_json(_behave_json({"list": 2.0, "create": 6.0}))
+
+    assert db.estimate_feature("features/users.feature") == 8.0
+    assert db.estimate_scenario("features/users.feature", "create") == 6.0
+
+
+def test_filtered_run_does_not_shrink_the_feature_estimate(tmp_path):
+    db = TimingDatabase(str(tmp_path / "timings.json"), smoothing=0.5)
+    db.record_behave_json(_behave_json({"list": 2.0, "create": 6.0}))
+
+    # Only "list" selected by --tags (and it got slower)
+    db.record_behave_json(_behave_json({"list": 4.0, "create": None}))
+
+    assert db.estimate_scenario("features/users.feature", "list") == 3.0
+    assert db.estimate_scenario("features/users.feature", "create") == 6.0
+    assert db.estimate_feature("features/users.feature") == 9.0
+
+
+def test_filtered_run_without_history_records_no_feature(tmp_path):
+    db = TimingDatabase(str(tmp_path / "timings.json"))
+    db.record_behave_json(_behave_json({"list": 4.0, "create": None}))
+
+    assert db.estimate_feature("features/users.feature") is None
+    assert db.estimate_scenario("features/users.feature", "list") == 4.0
+
+
+def test_timings_survive_save_and_load(tmp_path):
+    path = str(tmp_path / "timings.json")
+    db = TimingDatabase(path)
+    db.record_feature("features/orders.feature", 5.0)
+    db.save()
+
+    assert TimingDatabase(path).estimate_feature("features/orders.feature") == 5.0
@@ -0,0 +1,55 @@
+"""
+Tests for scoped variables
+"""
+
+import pytest
+
+from judo.core.variables import ScopedVariables
+
+
+def test_outer_fixture_is_shared_not_copied():
+    fixture = {"k": 1, "items": list(range(1000))}
+    variables = ScopedVariables()
+    variables["fixture"] = fixture
+
+    variables.enter("scenario")
+    assert variables.get("fixture") is fixture
+    assert variables["fixture"] is fixture
+
+    variables.enter("scenario")
+    assert variables.get("fixture") is fixture
+
+
+def test_mutable_change_does_not_leak_into_next_scenario():
+    fixture = {"k": 1}
+    variables = ScopedVariables()
+    variables["fixture"] = fixture
+
+    variables.enter("scenario")
+    variables.mutable("fixture")["k"] = 2
+    variables.mutable("fixture")["items"] = []
+    assert variables["fixture"] == {"k": 2, "items": []}
+    assert fixture == {"k": 1}
+
+    variables.enter("scenario")
+    assert variables.get("fixture") is fixture
+
+
+def test_feature_values_outlive_scenarios():
+    variables = ScopedVariables()
+    variables.enter("feature")
+    variables["token"] = "abc"
+
+    variables.enter("scenario")
+    variables["user"] = "ana"
+    del variables["token"]
+    assert "token" not in variables
+
+    variables.enter("scenario")
+    assert variables["token"] == "abc"
+    assert "user" not in variables
+
+
+def test_unknown_scope():
+    with pytest.raises(ValueError):
+        ScopedVariables().enter("step")